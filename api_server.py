@@ -3,26 +3,33 @@ Tune Agent Builder API Server
 FastAPI server exposing all agent capabilities via REST API
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, UploadFile, File
+from fastapi import FastAPI, APIRouter, HTTPException, BackgroundTasks, Depends, UploadFile, File, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable
 from datetime import datetime
 import asyncio
 import json
+import orjson
+import anthropic
 from pathlib import Path
 import csv
 import io
+import itertools
+import re
+import time
+from collections import Counter
 
 from src.agent_builder_system import MasterAgentBuilder, IndustryType, IndustryAgent
 from src.prospect_intelligence import ProspectIntelligence, BatchProspectProcessor
 from src.content_generator import ContentGenerator, BatchContentGenerator
-from src.clay_integration import ClayIntegration, ClayWebhookHandler
-from src.database_async import TuneDatabaseAsync  # Using async database with connection pooling
+from src.clay_integration import ClayAPI, ClayIntegration, ClayWebhookHandler
+from src.database_async import TuneDatabaseAsync, EmailEventBatcher  # Using async database with connection pooling
 from src.analytics import AnalyticsEngine, ABTestAnalyzer
-from src.auth import require_auth, APIKey, get_api_key_for_testing
+from src.auth import require_auth
+from src.cache import LLMCache
 import os
 from dotenv import load_dotenv
 
@@ -34,6 +41,7 @@ app = FastAPI(
     title="Tune® Agent Builder API",
     description="Elite agent creation and outbound automation system",
     version="3.0.0",
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if os.getenv("ENABLE_API_DOCS", "true").lower() == "true" else None,
     redoc_url="/redoc" if os.getenv("ENABLE_API_DOCS", "true").lower() == "true" else None,
 )
@@ -49,10 +57,39 @@ app.add_middleware(
     max_age=3600
 )
 
+# Protected endpoints share one auth + rate limit dependency (require_auth)
+protected_router = APIRouter(dependencies=[Depends(require_auth)])
+
+# Industry lookups (precomputed for request validation)
+_INDUSTRY_BY_NAME = {e.name: e for e in IndustryType}
+_INDUSTRY_VALUES = [e.value for e in IndustryType]
+
+# Public PDF filenames: no path separators or NUL, no leading dot
+_PDF_NAME_RE = re.compile(r"[^/\\\x00.][^/\\\x00]{0,250}\.pdf")
+PDF_DIR = Path("pdf_lead_magnets/generated").resolve()
+
+# Fenced JSON block in a Claude reply
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)\s*```", re.S)
+
 # Global state
 agents_cache = {}
 config = {}
 db = None  # Database instance
+tracking_batcher = None  # Coalesces email tracking writes
+claude_client = None  # Shared AsyncAnthropic client (connection pool reused across requests)
+clay_http_client = None  # Shared Clay HTTP client (keep-alive connections reused across requests)
+
+# Claude-backed engines reused across requests, keyed by (class name, industry)
+_generator_cache: Dict[tuple, Any] = {}
+
+# Bound concurrent hospital Claude calls
+_hospital_semaphore = asyncio.Semaphore(int(os.getenv("CLAUDE_CONCURRENCY", "10")))
+
+# Bound concurrent agent builds (each build makes many Claude calls)
+_build_semaphore = asyncio.Semaphore(int(os.getenv("MAX_CONCURRENT_BUILDS", "2")))
+
+# Claude response cache (in-process LRU, Redis when REDIS_URL is set)
+llm_cache = LLMCache(ttl_seconds=int(os.getenv("LLM_CACHE_TTL_SECONDS", "1800")))
 
 
 # ============================================================================
@@ -71,7 +108,7 @@ class ProspectInput(BaseModel):
     
 class BatchProspectRequest(BaseModel):
     prospects: List[ProspectInput]
-    concurrency: int = 5
+    concurrency: int = Field(5, ge=1, le=20)
     
 class ContentGenerationRequest(BaseModel):
     prospect_analysis: Dict
@@ -102,14 +139,18 @@ class HospitalBatchRequest(BaseModel):
 # CONFIGURATION
 # ============================================================================
 
+def _load_config() -> Dict:
+    """Read config.json (blocking - run in a worker thread)"""
+    with open("config.json", "r") as f:
+        return json.load(f)
+
 @app.on_event("startup")
 async def startup_event():
     """Load configuration on startup"""
-    global config, db
+    global config, db, tracking_batcher, claude_client, clay_http_client
 
     try:
-        with open("config.json", "r") as f:
-            config = json.load(f)
+        config = await asyncio.to_thread(_load_config)
         print("✅ Configuration loaded")
     except:
         print("⚠️  No config file found, using defaults")
@@ -118,49 +159,96 @@ async def startup_event():
             "clay_api_key": os.getenv("CLAY_API_KEY", "your-clay-key")
         }
 
+    claude_client = anthropic.AsyncAnthropic(api_key=config["claude_api_key"])
+    clay_http_client = ClayAPI.make_client(config["clay_api_key"])
+
     # Initialize async database with connection pooling
     db = TuneDatabaseAsync()
     await db.init_db()
     print(f"✅ Async database initialized with connection pooling")
 
+    tracking_batcher = EmailEventBatcher(db)
+    tracking_batcher.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Flush pending writes and close connections"""
+    if tracking_batcher is not None:
+        await tracking_batcher.stop()
+    if db is not None:
+        await db.close()
+    if claude_client is not None:
+        await claude_client.close()
+    if clay_http_client is not None:
+        await clay_http_client.aclose()
+
 def get_agent(industry: str) -> IndustryAgent:
     """Get or load agent from cache"""
     if industry not in agents_cache:
         raise HTTPException(status_code=404, detail=f"Agent for {industry} not found. Build it first.")
     return agents_cache[industry]
 
+_now_iso_cache = [0, ""]  # [epoch second, formatted timestamp]
+
+def _now_iso() -> str:
+    """Current time as ISO string, formatted at most once per second"""
+    second = int(time.time())
+    if second != _now_iso_cache[0]:
+        _now_iso_cache[0] = second
+        _now_iso_cache[1] = datetime.fromtimestamp(second).isoformat()
+    return _now_iso_cache[1]
+
+def _get_or_make(cls, industry: str):
+    """Get or create a shared engine instance for an industry's agent"""
+    agent = get_agent(industry)
+    key = (cls.__name__, industry)
+    instance = _generator_cache.get(key)
+    # Rebuild if the agent was rebuilt since the instance was created
+    if instance is None or instance.agent is not agent:
+        instance = cls(agent, config["claude_api_key"])
+        _generator_cache[key] = instance
+    return instance
+
+def _llm_cache_key(endpoint: str, industry: str, payload: Dict) -> str:
+    """Cache key for a Claude-backed endpoint (invalidated when the agent is rebuilt)"""
+    agent = get_agent(industry)
+    return LLMCache.make_key(endpoint, {
+        "industry": industry,
+        "agent_created_at": agent.created_at.isoformat(),
+        "payload": payload,
+    })
+
 
 # ============================================================================
 # AGENT BUILDING ENDPOINTS
 # ============================================================================
 
-@app.post("/api/agents/build", tags=["Agents"])
+@protected_router.post("/api/agents/build", tags=["Agents"])
 async def build_agent(
     request: BuildAgentRequest,
-    background_tasks: BackgroundTasks,
-    api_key: APIKey = Depends(require_auth)
+    background_tasks: BackgroundTasks
 ):
     """Build a new industry agent (PROTECTED - requires API key)"""
     
-    try:
-        industry_enum = IndustryType[request.industry.upper()]
-    except KeyError:
+    industry_enum = _INDUSTRY_BY_NAME.get(request.industry.upper())
+    if industry_enum is None:
         raise HTTPException(
             status_code=400, 
-            detail=f"Invalid industry. Options: {[e.value for e in IndustryType]}"
+            detail=f"Invalid industry. Options: {_INDUSTRY_VALUES}"
         )
     
     # Build agent in background
     async def build_task():
-        builder = MasterAgentBuilder(config["claude_api_key"])
-        agent = await builder.build_agent(
-            industry_enum,
-            {"personalization_depth": request.personalization_depth}
-        )
+        async with _build_semaphore:
+            builder = MasterAgentBuilder(config["claude_api_key"])
+            agent = await builder.build_agent(
+                industry_enum,
+                {"personalization_depth": request.personalization_depth}
+            )
         agents_cache[request.industry] = agent
         
-        # Save to disk
-        agent.save(f"/home/claude/tune_agents/{request.industry}_agent.json")
+        # Save to disk without blocking the event loop
+        await asyncio.to_thread(agent.save, f"/home/claude/tune_agents/{request.industry}_agent.json")
     
     background_tasks.add_task(build_task)
     
@@ -170,10 +258,9 @@ async def build_agent(
         "message": "Agent build started. Check /api/agents/{industry}/status"
     }
 
-@app.get("/api/agents/{industry}/status", tags=["Agents"])
+@protected_router.get("/api/agents/{industry}/status", tags=["Agents"])
 async def get_agent_status(
-    industry: str,
-    api_key: APIKey = Depends(require_auth)
+    industry: str
 ):
     """Check if agent is built and ready (PROTECTED - requires API key)"""
     
@@ -189,14 +276,21 @@ async def get_agent_status(
     else:
         return {"status": "not_built", "industry": industry}
 
-@app.get("/api/agents/{industry}", tags=["Agents"])
+@protected_router.get("/api/agents/{industry}", tags=["Agents"])
 async def get_agent_details(
     industry: str,
-    api_key: APIKey = Depends(require_auth)
+    request: Request,
+    response: Response
 ):
     """Get full agent details (PROTECTED - requires API key)"""
     
     agent = get_agent(industry)
+
+    # Details only change when the agent is rebuilt
+    etag = f'W/"{industry}-{agent.created_at.timestamp()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     
     return {
         "industry": agent.industry.value,
@@ -213,41 +307,43 @@ async def get_agent_details(
 # PROSPECT INTELLIGENCE ENDPOINTS
 # ============================================================================
 
-@app.post("/api/prospects/analyze", tags=["Prospects"])
+@protected_router.post("/api/prospects/analyze", tags=["Prospects"])
 async def analyze_prospect(
     industry: str,
-    prospect: ProspectInput,
-    api_key: APIKey = Depends(require_auth)
+    prospect: ProspectInput
 ):
     """Analyze single prospect (PROTECTED - requires API key)"""
 
-    agent = get_agent(industry)
+    prospect_data = prospect.model_dump()
+    cache_key = _llm_cache_key("analyze", industry, prospect_data)
+    cached = await llm_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    intelligence = ProspectIntelligence(agent, config["claude_api_key"])
-    analysis = await intelligence.analyze_prospect(prospect.dict())
+    intelligence = _get_or_make(ProspectIntelligence, industry)
+    analysis = await intelligence.analyze_prospect(prospect_data)
+    await llm_cache.set(cache_key, analysis)
 
     return analysis
 
-@app.post("/api/prospects/analyze-batch", tags=["Prospects"])
+@protected_router.post("/api/prospects/analyze-batch", tags=["Prospects"])
 async def analyze_prospect_batch(
     industry: str,
-    request: BatchProspectRequest,
-    api_key: APIKey = Depends(require_auth)
+    request: BatchProspectRequest
 ):
     """Analyze batch of prospects (PROTECTED - requires API key)"""
 
-    agent = get_agent(industry)
-
-    processor = BatchProspectProcessor(agent, config["claude_api_key"])
-    prospects_data = [p.dict() for p in request.prospects]
+    processor = _get_or_make(BatchProspectProcessor, industry)
+    prospects_data = [p.model_dump() for p in request.prospects]
     results = await processor.process_batch(prospects_data, request.concurrency)
+    tiers = Counter(r["priority_tier"] for r in results)
 
     return {
         "total_processed": len(results),
         "priority_breakdown": {
-            "A": len([r for r in results if r["priority_tier"] == "A"]),
-            "B": len([r for r in results if r["priority_tier"] == "B"]),
-            "C": len([r for r in results if r["priority_tier"] == "C"])
+            "A": tiers.get("A", 0),
+            "B": tiers.get("B", 0),
+            "C": tiers.get("C", 0)
         },
         "results": results
     }
@@ -257,41 +353,43 @@ async def analyze_prospect_batch(
 # CONTENT GENERATION ENDPOINTS
 # ============================================================================
 
-@app.post("/api/content/generate-sequence", tags=["Content"])
+@protected_router.post("/api/content/generate-sequence", tags=["Content"])
 async def generate_email_sequence(
     industry: str,
-    request: ContentGenerationRequest,
-    api_key: APIKey = Depends(require_auth)
+    request: ContentGenerationRequest
 ):
     """Generate email sequence for prospect (PROTECTED - requires API key)"""
     
-    agent = get_agent(industry)
-    
-    generator = ContentGenerator(agent, config["claude_api_key"])
+    cache_key = _llm_cache_key("generate-sequence", industry, request.model_dump())
+    cached = await llm_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    generator = _get_or_make(ContentGenerator, industry)
     sequence = await generator.generate_full_sequence(
         request.prospect_analysis,
         request.persona_type
     )
     
-    return {
+    result = {
         "company": request.prospect_analysis["company_profile"]["company_name"],
         "persona": request.persona_type,
         "emails": sequence,
         "total_emails": len(sequence),
-        "avg_quality": sum(e["quality_score"] for e in sequence) / len(sequence)
+        "avg_quality": sum(e["quality_score"] for e in sequence) / len(sequence) if sequence else 0
     }
+    await llm_cache.set(cache_key, result)
+
+    return result
 
-@app.post("/api/content/generate-batch", tags=["Content"])
+@protected_router.post("/api/content/generate-batch", tags=["Content"])
 async def generate_content_batch(
     industry: str,
-    analyzed_prospects: List[Dict],
-    api_key: APIKey = Depends(require_auth)
+    analyzed_prospects: List[Dict]
 ):
     """Generate content for batch of analyzed prospects (PROTECTED - requires API key)"""
     
-    agent = get_agent(industry)
-    
-    generator = BatchContentGenerator(agent, config["claude_api_key"])
+    generator = _get_or_make(BatchContentGenerator, industry)
     results = await generator.generate_sequences_batch(analyzed_prospects)
     
     return {
@@ -300,41 +398,50 @@ async def generate_content_batch(
         "results": results
     }
 
-@app.post("/api/content/linkedin-message", tags=["Content"])
+@protected_router.post("/api/content/linkedin-message", tags=["Content"])
 async def generate_linkedin_message(
     industry: str,
-    request: ContentGenerationRequest,
-    api_key: APIKey = Depends(require_auth)
+    request: ContentGenerationRequest
 ):
     """Generate LinkedIn connection message (PROTECTED - requires API key)"""
     
-    agent = get_agent(industry)
-    
-    generator = ContentGenerator(agent, config["claude_api_key"])
+    cache_key = _llm_cache_key("linkedin-message", industry, request.model_dump())
+    cached = await llm_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    generator = _get_or_make(ContentGenerator, industry)
     message = await generator.generate_linkedin_message(
         request.prospect_analysis,
         request.persona_type
     )
+    await llm_cache.set(cache_key, message)
     
     return message
 
-@app.post("/api/content/video-script", tags=["Content"])
+@protected_router.post("/api/content/video-script", tags=["Content"])
 async def generate_video_script(
     industry: str,
     request: ContentGenerationRequest,
-    duration_seconds: int = 60,
-    api_key: APIKey = Depends(require_auth)
+    duration_seconds: int = 60
 ):
     """Generate Loom video script (PROTECTED - requires API key)"""
     
-    agent = get_agent(industry)
-    
-    generator = ContentGenerator(agent, config["claude_api_key"])
+    cache_key = _llm_cache_key(
+        "video-script", industry,
+        {**request.model_dump(), "duration_seconds": duration_seconds}
+    )
+    cached = await llm_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    generator = _get_or_make(ContentGenerator, industry)
     script = await generator.generate_video_script(
         request.prospect_analysis,
         request.persona_type,
         duration_seconds
     )
+    await llm_cache.set(cache_key, script)
     
     return script
 
@@ -343,16 +450,15 @@ async def generate_video_script(
 # CLAY INTEGRATION ENDPOINTS
 # ============================================================================
 
-@app.post("/api/clay/setup-tables", tags=["Clay"])
+@protected_router.post("/api/clay/setup-tables", tags=["Clay"])
 async def setup_clay_tables(
-    industry: str,
-    api_key: APIKey = Depends(require_auth)
+    industry: str
 ):
     """Setup Clay tables for industry (PROTECTED - requires API key)"""
     
     agent = get_agent(industry)
     
-    clay = ClayIntegration(config["clay_api_key"], agent)
+    clay = ClayIntegration(config["clay_api_key"], agent, clay_http_client)
     tables = await clay.setup_tables()
     
     return {
@@ -370,7 +476,8 @@ async def handle_clay_webhook(payload: ClayWebhookPayload):
     handler = ClayWebhookHandler(
         agent,
         config["claude_api_key"],
-        config["clay_api_key"]
+        config["clay_api_key"],
+        clay_http_client
     )
     
     if payload.webhook_type == "new_prospect":
@@ -387,62 +494,139 @@ async def handle_clay_webhook(payload: ClayWebhookPayload):
 # COMPLETE WORKFLOW ENDPOINTS
 # ============================================================================
 
-@app.post("/api/workflows/complete-pipeline", tags=["Workflows"])
+@protected_router.post("/api/workflows/complete-pipeline", tags=["Workflows"])
 async def run_complete_pipeline(
     industry: str,
     prospects: List[ProspectInput],
     write_to_clay: bool = True,
-    api_key: APIKey = Depends(require_auth)
+    concurrency: int = Query(5, ge=1, le=20)
 ):
-    """Run complete pipeline: analyze → generate → export (PROTECTED - requires API key)"""
+    """
+    Run complete pipeline: analyze → generate → export (PROTECTED - requires API key)
+
+    Streams NDJSON as work completes, one object per line:
+    - {"type": "analysis", "data": {...}} for each analyzed prospect
+    - {"type": "content", "data": {...}} for each high-scorer's sequence
+    - {"type": "error", "stage": ..., "company": ..., "error": ...} for each failed
+      analysis, content generation or Clay write
+    - {"type": "summary", ...} last, with totals and Clay status
+    """
     
     agent = get_agent(industry)
-    
-    # Step 1: Analyze prospects
-    processor = BatchProspectProcessor(agent, config["claude_api_key"])
-    prospects_data = [p.dict() for p in prospects]
-    analyzed = await processor.process_batch(prospects_data)
-    
-    # Step 2: Filter high-scorers
-    high_scorers = [a for a in analyzed if a["composite_score"] >= 70]
-    
-    # Step 3: Generate content
-    content_gen = BatchContentGenerator(agent, config["claude_api_key"])
-    content = await content_gen.generate_sequences_batch(high_scorers)
-    
-    # Step 4: Write to Clay if requested
-    clay_result = None
-    if write_to_clay:
-        clay = ClayIntegration(config["clay_api_key"], agent)
-        
-        # Write analyses
-        for analysis in analyzed:
-            await clay.write_prospect_analysis("prospects_table", analysis)
-        
-        # Write content
-        await clay.write_generated_content("content_table", content)
-        
-        clay_result = "data_written_to_clay"
-    
-    return {
-        "total_prospects": len(analyzed),
-        "high_scorers": len(high_scorers),
-        "emails_generated": sum(len(c["sequence"]) for c in content),
-        "clay_status": clay_result,
-        "analyzed": analyzed,
-        "content": content
-    }
+    processor = _get_or_make(BatchProspectProcessor, industry)
+    content_gen = _get_or_make(BatchContentGenerator, industry)
+    clay = ClayIntegration(config["clay_api_key"], agent, clay_http_client) if write_to_clay else None
+    prospects_data = [p.model_dump() for p in prospects]
+
+    async def pipeline():
+        semaphore = asyncio.Semaphore(concurrency)
+        clay_semaphore = asyncio.Semaphore(concurrency)
+        tasks = []  # everything this stream started; cancelled if it ends early
+
+        def start(coro):
+            task = asyncio.create_task(coro)
+            tasks.append(task)
+            return task
+
+        def error_line(stage, company, error):
+            return orjson.dumps({"type": "error", "stage": stage, "company": company, "error": error}) + b"\n"
+
+        async def analyze(prospect):
+            async with semaphore:
+                return prospect, await processor.process_one(prospect)
+
+        async def generate(analysis):
+            async with semaphore:
+                try:
+                    return analysis, await content_gen.generate_for_prospect(analysis), None
+                except Exception as e:
+                    return analysis, None, str(e)
+
+        async def write_to_clay(company, write, *args):
+            async with clay_semaphore:
+                try:
+                    await write(*args)
+                    return company, None
+                except Exception as e:
+                    return company, str(e)
+
+        total_prospects = 0
+        high_scorers = 0
+        emails_generated = 0
+        content_tasks = []
+        clay_tasks = []
+
+        try:
+            # Step 1: Analyze prospects, emitting each as it completes
+            for next_analysis in asyncio.as_completed([start(analyze(p)) for p in prospects_data]):
+                prospect, analysis = await next_analysis
+                if analysis is None:
+                    yield error_line("analysis", prospect["company_name"], "analysis failed")
+                    continue
+                total_prospects += 1
+                yield orjson.dumps({"type": "analysis", "data": analysis}, default=str) + b"\n"
+
+                # Step 2: Each analysis goes to Clay and, for high-scorers, content generation right away
+                if clay is not None:
+                    clay_tasks.append(start(write_to_clay(
+                        analysis["company_profile"]["company_name"],
+                        clay.create_prospect_analysis_row, "prospects_table", analysis
+                    )))
+
+                if analysis["composite_score"] >= 70:
+                    high_scorers += 1
+                    content_tasks.append(start(generate(analysis)))
+
+            # Step 3: Emit generated content as it completes, writing each sequence to Clay
+            for next_content in asyncio.as_completed(content_tasks):
+                analysis, result, error = await next_content
+                if error is not None:
+                    yield error_line("content", analysis["company_profile"]["company_name"], error)
+                    continue
+                emails_generated += len(result["sequence"])
+                yield orjson.dumps({"type": "content", "data": result}, default=str) + b"\n"
+
+                if clay is not None:
+                    clay_tasks.append(start(write_to_clay(
+                        result["company"],
+                        clay.write_generated_content, "content_table", [result], concurrency
+                    )))
+
+            # Step 4: Wait for the Clay writes, reporting any that failed
+            clay_result = None
+            if clay is not None:
+                clay_failures = 0
+                for company, error in await asyncio.gather(*clay_tasks):
+                    if error is not None:
+                        clay_failures += 1
+                        yield error_line("clay", company, error)
+                clay_result = "data_written_to_clay" if not clay_failures else f"{clay_failures} Clay writes failed"
+
+            yield orjson.dumps({
+                "type": "summary",
+                "total_prospects": total_prospects,
+                "high_scorers": high_scorers,
+                "emails_generated": emails_generated,
+                "clay_status": clay_result
+            }) + b"\n"
+
+        finally:
+            # Client disconnected or the stream failed: stop outstanding Claude calls and Clay writes
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    return StreamingResponse(pipeline(), media_type="application/x-ndjson")
 
 
 # ============================================================================
 # CAMPAIGN & DATABASE ENDPOINTS
 # ============================================================================
 
-@app.post("/api/campaigns/create", tags=["Campaigns"])
+@protected_router.post("/api/campaigns/create", tags=["Campaigns"])
 async def create_campaign(
     name: str,
-    industry: str,
-    api_key: APIKey = Depends(require_auth)
+    industry: str
 ):
     """Create new campaign (PROTECTED - requires API key)"""
     campaign_id = await db.create_campaign(name, industry)
@@ -452,10 +636,9 @@ async def create_campaign(
         "industry": industry
     }
 
-@app.get("/api/campaigns/{campaign_id}", tags=["Campaigns"])
+@protected_router.get("/api/campaigns/{campaign_id}", tags=["Campaigns"])
 async def get_campaign_details(
-    campaign_id: int,
-    api_key: APIKey = Depends(require_auth)
+    campaign_id: int
 ):
     """Get campaign details (PROTECTED - requires API key)"""
     campaign = await db.get_campaign(campaign_id)
@@ -463,11 +646,10 @@ async def get_campaign_details(
         raise HTTPException(404, "Campaign not found")
     return campaign
 
-@app.get("/api/campaigns/{campaign_id}/prospects/{tier}", tags=["Campaigns"])
+@protected_router.get("/api/campaigns/{campaign_id}/prospects/{tier}", tags=["Campaigns"])
 async def get_campaign_prospects_by_tier(
     campaign_id: int,
-    tier: str,
-    api_key: APIKey = Depends(require_auth)
+    tier: str
 ):
     """Get campaign prospects by tier (A, B, C) (PROTECTED - requires API key)"""
     prospects = await db.get_prospects_by_tier(campaign_id, tier)
@@ -483,11 +665,10 @@ async def get_campaign_prospects_by_tier(
 # ANALYTICS ENDPOINTS
 # ============================================================================
 
-@app.get("/api/analytics/{campaign_id}/report", tags=["Analytics"])
+@protected_router.get("/api/analytics/{campaign_id}/report", tags=["Analytics"])
 async def get_campaign_report(
     campaign_id: int,
-    days: int = 30,
-    api_key: APIKey = Depends(require_auth)
+    days: int = 30
 ):
     """Get comprehensive campaign analytics report (PROTECTED - requires API key)"""
     analytics = AnalyticsEngine(db)
@@ -503,10 +684,9 @@ async def get_campaign_report(
         "recommendations": insights.recommendations
     }
 
-@app.get("/api/analytics/{campaign_id}/roi-by-persona", tags=["Analytics"])
+@protected_router.get("/api/analytics/{campaign_id}/roi-by-persona", tags=["Analytics"])
 async def get_persona_roi(
-    campaign_id: int,
-    api_key: APIKey = Depends(require_auth)
+    campaign_id: int
 ):
     """Get ROI analysis by persona (PROTECTED - requires API key)"""
     analytics = AnalyticsEngine(db)
@@ -517,10 +697,9 @@ async def get_persona_roi(
         "persona_roi": roi
     }
 
-@app.get("/api/analytics/{campaign_id}/content-quality", tags=["Analytics"])
+@protected_router.get("/api/analytics/{campaign_id}/content-quality", tags=["Analytics"])
 async def get_content_quality_analysis(
-    campaign_id: int,
-    api_key: APIKey = Depends(require_auth)
+    campaign_id: int
 ):
     """Get content quality vs performance analysis (PROTECTED - requires API key)"""
     analytics = AnalyticsEngine(db)
@@ -528,11 +707,10 @@ async def get_content_quality_analysis(
 
     return quality_analysis
 
-@app.get("/api/analytics/{campaign_id}/ab-test/{test_name}", tags=["Analytics"])
+@protected_router.get("/api/analytics/{campaign_id}/ab-test/{test_name}", tags=["Analytics"])
 async def get_ab_test_results(
     campaign_id: int,
-    test_name: str,
-    api_key: APIKey = Depends(require_auth)
+    test_name: str
 ):
     """Get A/B test analysis (PROTECTED - requires API key)"""
     ab_analyzer = ABTestAnalyzer(db)
@@ -545,36 +723,33 @@ async def get_ab_test_results(
 # EMAIL TRACKING ENDPOINTS
 # ============================================================================
 
-@app.post("/api/tracking/email-opened", tags=["Tracking"])
+@protected_router.post("/api/tracking/email-opened", tags=["Tracking"])
 async def track_email_opened(
     content_id: int,
-    contact_id: int,
-    api_key: APIKey = Depends(require_auth)
+    contact_id: int
 ):
     """Track email open event (PROTECTED - requires API key)"""
-    await db.track_email_event(content_id, contact_id, "opened")
+    await tracking_batcher.track(content_id, contact_id, "opened")
     return {"status": "tracked"}
 
-@app.post("/api/tracking/email-clicked", tags=["Tracking"])
+@protected_router.post("/api/tracking/email-clicked", tags=["Tracking"])
 async def track_email_clicked(
     content_id: int,
     contact_id: int,
-    link_url: Optional[str] = None,
-    api_key: APIKey = Depends(require_auth)
+    link_url: Optional[str] = None
 ):
     """Track email click event (PROTECTED - requires API key)"""
     event_data = {"link_url": link_url} if link_url else None
-    await db.track_email_event(content_id, contact_id, "clicked", event_data)
+    await tracking_batcher.track(content_id, contact_id, "clicked", event_data)
     return {"status": "tracked"}
 
-@app.post("/api/tracking/email-replied", tags=["Tracking"])
+@protected_router.post("/api/tracking/email-replied", tags=["Tracking"])
 async def track_email_replied(
     content_id: int,
-    contact_id: int,
-    api_key: APIKey = Depends(require_auth)
+    contact_id: int
 ):
     """Track email reply event (PROTECTED - requires API key)"""
-    await db.track_email_event(content_id, contact_id, "replied")
+    await tracking_batcher.track(content_id, contact_id, "replied")
     return {"status": "tracked"}
 
 
@@ -589,14 +764,14 @@ async def health_check():
         "status": "healthy",
         "agents_loaded": list(agents_cache.keys()),
         "database_connected": db is not None,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
-@app.get("/api/industries", tags=["Utility"])
-async def list_industries(api_key: APIKey = Depends(require_auth)):
+@protected_router.get("/api/industries", tags=["Utility"])
+async def list_industries():
     """List available industries (PROTECTED - requires API key)"""
     return {
-        "industries": [e.value for e in IndustryType]
+        "industries": _INDUSTRY_VALUES
     }
 
 
@@ -604,155 +779,81 @@ async def list_industries(api_key: APIKey = Depends(require_auth)):
 # HOSPITAL-SPECIFIC ENDPOINTS (CSV Upload & Clay Integration)
 # ============================================================================
 
-def get_persona_focus(persona_type: str) -> str:
-    """Get persona-specific focus areas"""
-    focus_map = {
-        'finance': 'EBITDA impact, ROI, margin improvement, budget optimization, capital allocation',
-        'esg': 'Carbon reduction, ESG reporting, sustainability goals, green building certifications, stakeholder expectations',
-        'operations': 'Operational reliability, uptime, patient care continuity, equipment performance, risk mitigation',
-        'executive_leadership': 'Strategic value, competitive advantage, organizational goals, board reporting, community impact',
-        'facilities': 'Cost savings, equipment efficiency, maintenance reduction, energy optimization, operational simplicity'
-    }
-    return focus_map.get(persona_type, 'Cost savings and operational efficiency')
-
+# Title keywords per hospital persona, checked in priority order (first match wins)
+HOSPITAL_PERSONA_PATTERNS = [
+    (persona_type, persona_label, re.compile("|".join(map(re.escape, keywords))))
+    for persona_type, persona_label, keywords in [
+        ('finance', 'Finance', ['cfo', 'chief financial', 'finance', 'treasurer', 'controller']),
+        ('esg', 'ESG', ['sustainability', 'esg', 'environmental', 'chief sustainability']),
+        ('operations', 'Operations', ['operations', 'coo', 'chief operating', 'vp operations', 'director of operations']),
+        ('executive_leadership', 'Executive Leadership', ['ceo', 'president', 'chief executive', 'executive director', 'managing director', 'administrator']),
+        ('facilities', 'Facilities', ['facilities', 'facility', 'building', 'property', 'plant', 'energy', 'utilities']),
+    ]
+]
+
+
+HOSPITAL_PERSONA_FOCUS = {
+    'finance': 'EBITDA impact, ROI, margin improvement, budget optimization, capital allocation',
+    'esg': 'Carbon reduction, ESG reporting, sustainability goals, green building certifications, stakeholder expectations',
+    'operations': 'Operational reliability, uptime, patient care continuity, equipment performance, risk mitigation',
+    'executive_leadership': 'Strategic value, competitive advantage, organizational goals, board reporting, community impact',
+    'facilities': 'Cost savings, equipment efficiency, maintenance reduction, energy optimization, operational simplicity'
+}
+
+# Agent persona keys to try for each hospital persona (agents might use different naming)
+HOSPITAL_AGENT_PERSONA_KEYS = {
+    'finance': ['cfo', 'finance'],
+    'esg': ['esg_director', 'sustainability_chief'],
+    'operations': ['operations_director', 'coo'],
+    'executive_leadership': ['ceo', 'executive'],
+    'facilities': ['facilities_vp', 'energy_manager', 'director_facilities']
+}
+
+# Value props resolved per persona, rebuilt when a different agent dict is passed in
+_persona_value_prop_cache = {"agent": None, "by_persona": {}}
 
-async def process_hospital_data(hospital_input: Dict, agent: Dict) -> Dict:
-    """Process a single hospital and generate content + PDF"""
-    import anthropic
-    from pdf_lead_magnets.hospital_pdf_generator import generate_hospital_cost_analysis_pdf
 
-    # Enrich hospital data
-    hospital_name = hospital_input.get('hospital_name', 'Unknown Hospital')
-    location = hospital_input.get('location', 'United States')
-
-    # Handle empty strings from CSV
-    beds_str = str(hospital_input.get('beds', 200))
-    beds = int(beds_str) if beds_str and beds_str.strip() and beds_str != '0' else 200
-
-    sqft_str = str(hospital_input.get('sqft', 0))
-    sqft = int(sqft_str) if sqft_str and sqft_str.strip() and sqft_str != '0' else 0
-
-    # DO NOT estimate sqft from beds - many hospitals have multiple locations
-    # Only use sqft if explicitly provided
-    if sqft == 0:
-        sqft = 500000  # Default conservative estimate for calculation purposes only
-
-    # Handle empty string for annual energy spend
-    annual_spend_str = str(hospital_input.get('annual_energy_spend', 0))
-    annual_energy_spend = float(annual_spend_str) if annual_spend_str and annual_spend_str.strip() and annual_spend_str != '0' else 0
-
-    if annual_energy_spend == 0:
-        kwh_per_sqft = 250
-        cost_per_kwh = 0.11
-        annual_energy_spend = sqft * kwh_per_sqft * cost_per_kwh
-
-    savings_percentage = agent.get('savings_benchmarks', {}).get('typical_percentage', 12)
-    annual_savings = annual_energy_spend * (savings_percentage / 100)
-    monthly_savings = annual_savings / 12
-    five_year_savings = annual_savings * 5
-
-    annual_kwh = annual_energy_spend / 0.11
-    carbon_reduction_tons = (annual_kwh * (savings_percentage / 100) * 0.92) / 2000
-
-    estimated_investment = sqft * 0.50
-    payback_months = round((estimated_investment / monthly_savings) if monthly_savings > 0 else 18)
-
-    enriched_data = {
-        'company_profile': {
-            'company_name': hospital_name,
-            'location': location,
-            'beds': beds,
-            'estimated_sqft': sqft,
-            'estimated_energy_spend': round(annual_energy_spend),
-            'annual_savings_dollars': round(annual_savings),
-            'monthly_savings_dollars': round(monthly_savings),
-            'five_year_savings': round(five_year_savings),
-            'carbon_reduction_tons': round(carbon_reduction_tons),
-            'payback_months': payback_months,
-            'savings_percentage': savings_percentage,
-            'domain': hospital_input.get('domain', '')
-        },
-        'contact': {
-            'name': hospital_input.get('contact_name', ''),
-            'first_name': hospital_input.get('contact_first_name', hospital_input.get('contact_name', '').split()[0] if hospital_input.get('contact_name', '') else ''),
-            'title': hospital_input.get('contact_title', ''),
-            'email': hospital_input.get('contact_email', '')
-        }
-    }
-
-    # Generate PDF
-    pdf_filename = generate_hospital_cost_analysis_pdf(enriched_data)
-    pdf_base_url = os.getenv("PDF_BASE_URL", "http://localhost:8000")
-    pdf_url = f"{pdf_base_url}/pdf/{pdf_filename}"
-
-    # Check if email exists - skip entirely if not
-    contact_email = hospital_input.get('contact_email', '').strip()
-    has_email = bool(contact_email)
+def get_persona_focus(persona_type: str) -> str:
+    """Get persona-specific focus areas"""
+    return HOSPITAL_PERSONA_FOCUS.get(persona_type, 'Cost savings and operational efficiency')
 
-    # Skip this contact entirely if no email (don't return anything)
-    if not has_email:
-        return None
 
-    # Generate email sequence
-    client = anthropic.Anthropic(api_key=config["claude_api_key"])
+def get_persona_value_prop(agent: Dict, persona_type: str) -> Dict:
+    """Get the agent's value prop for a hospital persona (resolved once per agent)"""
+    if _persona_value_prop_cache["agent"] is not agent:
+        value_props = agent.get('value_props_by_persona', {})
+        # Fallback to first available
+        fallback = next(iter(value_props.values()), {})
 
-    # Determine persona (5 categories: Operations, Finance, Executive Leadership, Facilities, ESG)
-    contact_title = hospital_input.get('contact_title', '').lower()
+        by_persona = {}
+        for hospital_persona, agent_keys in HOSPITAL_AGENT_PERSONA_KEYS.items():
+            by_persona[hospital_persona] = next(
+                (value_props[key] for key in agent_keys if key in value_props),
+                None
+            ) or fallback
 
-    if any(x in contact_title for x in ['cfo', 'chief financial', 'finance', 'treasurer', 'controller']):
-        persona_type = 'finance'
-        persona_label = 'Finance'
-    elif any(x in contact_title for x in ['sustainability', 'esg', 'environmental', 'chief sustainability']):
-        persona_type = 'esg'
-        persona_label = 'ESG'
-    elif any(x in contact_title for x in ['operations', 'coo', 'chief operating', 'vp operations', 'director of operations']):
-        persona_type = 'operations'
-        persona_label = 'Operations'
-    elif any(x in contact_title for x in ['ceo', 'president', 'chief executive', 'executive director', 'managing director', 'administrator']):
-        persona_type = 'executive_leadership'
-        persona_label = 'Executive Leadership'
-    elif any(x in contact_title for x in ['facilities', 'facility', 'building', 'property', 'plant', 'energy', 'utilities']):
-        persona_type = 'facilities'
-        persona_label = 'Facilities'
-    else:
-        # Default to Facilities
-        persona_type = 'facilities'
-        persona_label = 'Facilities'
-
-    value_props = agent.get('value_props_by_persona', {})
-    # Map to agent personas (which might use different naming)
-    persona_mapping = {
-        'finance': ['cfo', 'finance'],
-        'esg': ['esg_director', 'sustainability_chief'],
-        'operations': ['operations_director', 'coo'],
-        'executive_leadership': ['ceo', 'executive'],
-        'facilities': ['facilities_vp', 'energy_manager', 'director_facilities']
-    }
+        _persona_value_prop_cache["agent"] = agent
+        _persona_value_prop_cache["by_persona"] = by_persona
 
-    # Try to find matching value prop from agent
-    persona_value_prop = {}
-    for agent_persona_key in persona_mapping.get(persona_type, ['facilities_vp']):
-        if agent_persona_key in value_props:
-            persona_value_prop = value_props[agent_persona_key]
-            break
+    return _persona_value_prop_cache["by_persona"].get(persona_type, {})
 
-    # Fallback to first available
-    if not persona_value_prop and value_props:
-        persona_value_prop = list(value_props.values())[0]
 
-    company = enriched_data['company_profile']
-    contact = enriched_data['contact']
+# Model settings for hospital sequences. 5 emails x ~90 words plus JSON framing is
+# ~1,000 output tokens, so 2,000 leaves headroom without a 4,000 token tail.
+HOSPITAL_EMAIL_MODEL = os.getenv("HOSPITAL_EMAIL_MODEL", "claude-sonnet-4-20250514")
+HOSPITAL_EMAIL_MAX_TOKENS = int(os.getenv("HOSPITAL_EMAIL_MAX_TOKENS", "2000"))
 
-    prompt = f"""You are writing a 5-email sequence for {contact.get('first_name', '')} at {company['company_name']}.
+# Hospital email-sequence prompt, filled per contact with str.format
+HOSPITAL_EMAIL_PROMPT = """You are writing a 5-email sequence for {first_name} at {company_name}.
 
 **PROSPECT:**
-Name: {contact.get('first_name', '')} {contact.get('name', '').split()[-1] if contact.get('name', '') else ''}
-Title: {contact.get('title', '')}
-Hospital: {company['company_name']}
+Name: {first_name} {last_name}
+Title: {title}
+Hospital: {company_name}
 Persona: {persona_label}
 
 **THEIR WORLD ({persona_label}):**
-{get_persona_focus(persona_type)}
+{persona_focus}
 Pain: Energy costs rising, but can't deploy most efficiency solutions due to patient safety risks
 
 **YOUR SOLUTION:**
@@ -760,7 +861,7 @@ Passive Harmonics Filter
 - Key breakthrough: If it fails → nothing happens (no power interruption, zero patient risk)
 - Unlike active systems that can cause power issues
 - This is WHY hospitals can actually use it
-- Results: 8-12% energy savings (est ${company['annual_savings_dollars']:,}/year for them)
+- Results: 8-12% energy savings (est ${annual_savings_dollars:,}/year for them)
 - Real case study at captivateenergy.com
 
 **SALES APPROACH:**
@@ -784,7 +885,7 @@ The passive filter is the breakthrough moment - make it hit.
 Start with their world: energy costs climbing, can't deploy most solutions (too risky for hospitals).
 Then introduce the breakthrough: passive harmonics filter = if it fails, nothing happens. Zero patient risk.
 Mention naturally: "Happy to walk you through how another hospital system proved this out - there's a case study at captivateenergy.com if you want to preview first."
-CTA: "Worth exploring for {company['company_name']}?"
+CTA: "Worth exploring for {company_name}?"
 75-85 words
 
 **Email 2: Why They Can't Use Traditional Solutions**
@@ -827,21 +928,145 @@ Or simple next step: "Happy to walk you through the approach if you're curious -
 Return JSON: {{"emails": [{{"email_number": 1, "subject": "...", "body": "..."}}, ...]}}
 """
 
-    message = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=4000,
+
+def _safe_number(value, default, cast=int):
+    """Parse a numeric input field, using default for missing, blank, zero or malformed values"""
+    if value is None:
+        return default
+    text = str(value).strip()
+    if not text or text == '0':
+        return default
+    try:
+        return cast(text)
+    except ValueError:
+        return default
+
+
+# Energy estimate assumptions: 250 kWh/sqft/year at $0.11/kWh, 0.92 lbs CO2 per kWh
+_COST_PER_KWH = 0.11
+_SPEND_PER_SQFT = 250 * _COST_PER_KWH
+_TONS_CO2_PER_DOLLAR = 0.92 / _COST_PER_KWH / 2000
+
+
+def calculate_hospital_financials(sqft: int, annual_energy_spend: float, savings_percentage: float) -> Dict:
+    """Savings, carbon and payback estimates for a hospital (rounded for display)"""
+    if annual_energy_spend == 0:
+        annual_energy_spend = sqft * _SPEND_PER_SQFT
+
+    annual_savings = annual_energy_spend * (savings_percentage / 100)
+    monthly_savings = annual_savings / 12
+    five_year_savings = annual_savings * 5
+
+    # saved kWh (spend / $ per kWh) x lbs CO2 per kWh / lbs per ton
+    carbon_reduction_tons = annual_savings * _TONS_CO2_PER_DOLLAR
+
+    estimated_investment = sqft * 0.50
+    payback_months = round((estimated_investment / monthly_savings) if monthly_savings > 0 else 18)
+
+    return {
+        'estimated_energy_spend': round(annual_energy_spend),
+        'annual_savings_dollars': round(annual_savings),
+        'monthly_savings_dollars': round(monthly_savings),
+        'five_year_savings': round(five_year_savings),
+        'carbon_reduction_tons': round(carbon_reduction_tons),
+        'payback_months': payback_months,
+    }
+
+
+async def process_hospital_data(hospital_input: Dict, agent: Dict) -> Dict:
+    """Process a single hospital and generate content + PDF"""
+    from pdf_lead_magnets.hospital_pdf_generator import generate_hospital_cost_analysis_pdf
+
+    # Enrich hospital data
+    hospital_name = hospital_input.get('hospital_name', 'Unknown Hospital')
+    location = hospital_input.get('location', 'United States')
+
+    # Handle empty strings from CSV and None from the JSON models
+    beds = _safe_number(hospital_input.get('beds'), 200)
+
+    # DO NOT estimate sqft from beds - many hospitals have multiple locations
+    # Only use sqft if explicitly provided
+    sqft = _safe_number(hospital_input.get('sqft'), 500000)  # Default conservative estimate for calculation purposes only
+
+    annual_energy_spend = _safe_number(hospital_input.get('annual_energy_spend'), 0, float)
+
+    savings_percentage = agent.get('savings_benchmarks', {}).get('typical_percentage', 12)
+    financials = calculate_hospital_financials(sqft, annual_energy_spend, savings_percentage)
+
+    enriched_data = {
+        'company_profile': {
+            'company_name': hospital_name,
+            'location': location,
+            'beds': beds,
+            'estimated_sqft': sqft,
+            **financials,  # estimated spend, savings, carbon, payback
+            'savings_percentage': savings_percentage,
+            'domain': hospital_input.get('domain', '')
+        },
+        'contact': {
+            'name': hospital_input.get('contact_name', ''),
+            'first_name': hospital_input.get('contact_first_name', hospital_input.get('contact_name', '').split()[0] if hospital_input.get('contact_name', '') else ''),
+            'title': hospital_input.get('contact_title', ''),
+            'email': hospital_input.get('contact_email', '')
+        }
+    }
+
+    # Check if email exists - skip entirely if not
+    contact_email = hospital_input.get('contact_email', '').strip()
+    has_email = bool(contact_email)
+
+    # Skip this contact entirely if no email (don't return anything, not even a PDF)
+    if not has_email:
+        return None
+
+    # Generate PDF (render + write in a worker thread so concurrent hospitals overlap)
+    pdf_filename = await asyncio.to_thread(generate_hospital_cost_analysis_pdf, enriched_data)
+    pdf_base_url = os.getenv("PDF_BASE_URL", "http://localhost:8000")
+    pdf_url = f"{pdf_base_url}/pdf/{pdf_filename}"
+
+    # Generate email sequence
+    # Determine persona (5 categories: Operations, Finance, Executive Leadership, Facilities, ESG)
+    contact_title = hospital_input.get('contact_title', '').lower()
+
+    # Default to Facilities
+    persona_type = 'facilities'
+    persona_label = 'Facilities'
+    for candidate_type, candidate_label, title_pattern in HOSPITAL_PERSONA_PATTERNS:
+        if title_pattern.search(contact_title):
+            persona_type = candidate_type
+            persona_label = candidate_label
+            break
+
+    persona_value_prop = get_persona_value_prop(agent, persona_type)
+
+    company = enriched_data['company_profile']
+    contact = enriched_data['contact']
+
+    prompt = HOSPITAL_EMAIL_PROMPT.format(
+        first_name=contact.get('first_name', ''),
+        last_name=contact.get('name', '').split()[-1] if contact.get('name', '') else '',
+        title=contact.get('title', ''),
+        company_name=company['company_name'],
+        persona_label=persona_label,
+        persona_focus=get_persona_focus(persona_type),
+        annual_savings_dollars=company['annual_savings_dollars']
+    )
+
+    message = await claude_client.messages.create(
+        model=HOSPITAL_EMAIL_MODEL,
+        max_tokens=HOSPITAL_EMAIL_MAX_TOKENS,
         messages=[{"role": "user", "content": prompt}]
     )
 
     content = message.content[0].text
 
+    # Prefer the fenced block; otherwise the reply may be bare JSON
+    match = _JSON_FENCE_RE.search(content)
+    json_str = match.group(1) if match else content.strip()
     try:
-        if '```json' in content:
-            json_str = content.split('```json')[1].split('```')[0].strip()
-            emails_data = json.loads(json_str)
-        else:
-            emails_data = {"emails": []}
-    except:
+        emails_data = orjson.loads(json_str)
+    except orjson.JSONDecodeError:
+        print(f"⚠️  Could not parse email sequence JSON for {hospital_name}")
         emails_data = {"emails": []}
 
     return {
@@ -858,10 +1083,93 @@ Return JSON: {{"emails": [{{"email_number": 1, "subject": "...", "body": "..."}}
     }
 
 
-@app.post("/api/hospital/process-csv", tags=["Hospital"])
+HOSPITAL_AGENT_PATH = Path("agents/hospital_agent.json")
+HOSPITAL_WORKERS = int(os.getenv("CLAUDE_CONCURRENCY", "10"))
+_hospital_agent_cache = {"mtime": None, "agent": None}
+
+async def load_hospital_agent() -> Dict:
+    """Load hospital agent JSON, re-reading only when the file changes"""
+    try:
+        mtime = HOSPITAL_AGENT_PATH.stat().st_mtime
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=404,
+            detail="Hospital agent not found. Build it first: POST /api/agents/build with industry='hospital'"
+        )
+
+    if _hospital_agent_cache["mtime"] != mtime:
+        raw = await asyncio.to_thread(HOSPITAL_AGENT_PATH.read_bytes)
+        _hospital_agent_cache["agent"] = orjson.loads(raw)
+        _hospital_agent_cache["mtime"] = mtime
+
+    return _hospital_agent_cache["agent"]
+
+
+def new_results_file(prefix: str) -> str:
+    """Timestamped JSONL path for a hospital campaign run"""
+    os.makedirs("outputs/hospital_campaigns", exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"outputs/hospital_campaigns/{prefix}_{timestamp}.jsonl"
+
+
+async def process_hospitals(hospital_inputs: Iterable[Dict], agent: Dict,
+                            output_file: str, keep_results: bool = True) -> Dict:
+    """
+    Process hospitals concurrently (bounded), skipping contacts without emails
+
+    Workers pull rows from hospital_inputs as they go, so a streaming source
+    (e.g. a csv.DictReader) is never fully materialized. Each result is appended
+    to output_file as a JSON line when it completes; with keep_results=False
+    nothing is buffered and only the counts are returned. A row that can't be
+    decoded cancels the remaining workers and is reported as a 400.
+    """
+
+    rows = enumerate(hospital_inputs)
+    outcomes = {}
+    summary = {"hospitals_processed": 0, "pdfs_generated": 0}
+
+    try:
+        with open(output_file, 'wb') as out:
+
+            async def worker():
+                # Workers share one iterator; next() never awaits, so each row is taken once
+                for index, hospital_input in rows:
+                    try:
+                        async with _hospital_semaphore:
+                            outcome = await process_hospital_data(hospital_input, agent)
+                    except Exception as e:
+                        print(f"❌ Error processing {hospital_input.get('hospital_name')}: {e}")
+                        continue
+                    if outcome is None:  # Only keep contacts with email
+                        continue
+
+                    # One buffered line per hospital; never awaits, so lines don't interleave
+                    out.write(orjson.dumps(outcome) + b"\n")
+                    summary["hospitals_processed"] += 1
+                    if 'pdf_filename' in outcome['content']:
+                        summary["pdfs_generated"] += 1
+                    if keep_results:
+                        outcomes[index] = outcome
+
+            # TaskGroup cancels and awaits the other workers before the file closes
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(HOSPITAL_WORKERS):
+                    tg.create_task(worker())
+    except* (UnicodeDecodeError, csv.Error) as eg:
+        # Don't leave a partial results file behind for a rejected upload
+        os.remove(output_file)
+        raise HTTPException(status_code=400, detail=f"Invalid CSV: {eg.exceptions[0]}")
+
+    summary["output_file"] = output_file
+    if keep_results:
+        summary["results"] = [outcomes[i] for i in sorted(outcomes)]
+    return summary
+
+
+@protected_router.post("/api/hospital/process-csv", tags=["Hospital"])
 async def process_hospital_csv(
     file: UploadFile = File(...),
-    api_key: APIKey = Depends(require_auth)
+    include_results: bool = True
 ):
     """
     Upload CSV of hospitals and generate personalized content + PDFs (PROTECTED)
@@ -875,57 +1183,36 @@ async def process_hospital_csv(
     - beds (optional)
     - sqft (optional)
     - annual_energy_spend (optional)
+
+    Results are written to output_file as JSON lines while the batch runs.
+    Pass include_results=false to get only counts back (recommended for large files).
     """
 
     # Load hospital agent
-    hospital_agent_path = Path("agents/hospital_agent.json")
-    if not hospital_agent_path.exists():
-        raise HTTPException(
-            status_code=404,
-            detail="Hospital agent not found. Build it first: POST /api/agents/build with industry='hospital'"
-        )
+    hospital_agent = await load_hospital_agent()
 
-    with open(hospital_agent_path, 'r') as f:
-        hospital_agent = json.load(f)
+    # Parse CSV as a stream over the spooled upload (no full in-memory copy)
+    csv_reader = csv.DictReader(io.TextIOWrapper(file.file, encoding='utf-8', newline=''))
 
-    # Parse CSV
-    contents = await file.read()
-    csv_text = contents.decode('utf-8')
-    csv_reader = csv.DictReader(io.StringIO(csv_text))
-
-    hospitals = list(csv_reader)
-
-    if len(hospitals) == 0:
+    try:
+        first_row = next(csv_reader, None)
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid CSV: {e}")
+    if first_row is None:
         raise HTTPException(status_code=400, detail="CSV file is empty")
 
-    # Process each hospital (skip contacts without emails)
-    results = []
-    for hospital_input in hospitals:
-        result = await process_hospital_data(hospital_input, hospital_agent)
-        if result is not None:  # Only add if contact has email
-            results.append(result)
+    # Process hospitals concurrently (skip contacts without emails)
+    summary = await process_hospitals(
+        itertools.chain([first_row], csv_reader), hospital_agent,
+        new_results_file("hospital_campaign"), keep_results=include_results
+    )
 
-    # Save results
-    os.makedirs("outputs/hospital_campaigns", exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = f"outputs/hospital_campaigns/hospital_campaign_{timestamp}.json"
+    return {"status": "success", **summary}
 
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
 
-    return {
-        "status": "success",
-        "hospitals_processed": len(results),
-        "pdfs_generated": len([r for r in results if 'pdf_filename' in r['content']]),
-        "output_file": output_file,
-        "results": results
-    }
-
-
-@app.post("/api/hospital/process-single", tags=["Hospital"])
+@protected_router.post("/api/hospital/process-single", tags=["Hospital"])
 async def process_single_hospital(
-    hospital: HospitalInput,
-    api_key: APIKey = Depends(require_auth)
+    hospital: HospitalInput
 ):
     """
     Process single hospital from Clay webhook or API call (PROTECTED)
@@ -933,26 +1220,17 @@ async def process_single_hospital(
     """
 
     # Load hospital agent
-    hospital_agent_path = Path("agents/hospital_agent.json")
-    if not hospital_agent_path.exists():
-        raise HTTPException(
-            status_code=404,
-            detail="Hospital agent not found. Build it first: POST /api/agents/build with industry='hospital'"
-        )
-
-    with open(hospital_agent_path, 'r') as f:
-        hospital_agent = json.load(f)
+    hospital_agent = await load_hospital_agent()
 
     # Process hospital
-    result = await process_hospital_data(hospital.dict(), hospital_agent)
+    result = await process_hospital_data(hospital.model_dump(), hospital_agent)
 
     return result
 
 
-@app.post("/api/hospital/process-batch", tags=["Hospital"])
+@protected_router.post("/api/hospital/process-batch", tags=["Hospital"])
 async def process_hospital_batch(
-    request: HospitalBatchRequest,
-    api_key: APIKey = Depends(require_auth)
+    request: HospitalBatchRequest
 ):
     """
     Process batch of hospitals from Clay (PROTECTED)
@@ -960,38 +1238,15 @@ async def process_hospital_batch(
     """
 
     # Load hospital agent
-    hospital_agent_path = Path("agents/hospital_agent.json")
-    if not hospital_agent_path.exists():
-        raise HTTPException(
-            status_code=404,
-            detail="Hospital agent not found. Build it first: POST /api/agents/build with industry='hospital'"
-        )
-
-    with open(hospital_agent_path, 'r') as f:
-        hospital_agent = json.load(f)
-
-    # Process each hospital (skip contacts without emails)
-    results = []
-    for hospital_input in request.hospitals:
-        result = await process_hospital_data(hospital_input.dict(), hospital_agent)
-        if result is not None:  # Only add if contact has email
-            results.append(result)
-
-    # Save results
-    os.makedirs("outputs/hospital_campaigns", exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = f"outputs/hospital_campaigns/hospital_batch_{timestamp}.json"
+    hospital_agent = await load_hospital_agent()
 
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    # Process hospitals concurrently (skip contacts without emails)
+    summary = await process_hospitals(
+        (h.model_dump() for h in request.hospitals), hospital_agent,
+        new_results_file("hospital_batch")
+    )
 
-    return {
-        "status": "success",
-        "hospitals_processed": len(results),
-        "pdfs_generated": len([r for r in results if 'pdf_filename' in r['content']]),
-        "output_file": output_file,
-        "results": results
-    }
+    return {"status": "success", **summary}
 
 
 # ============================================================================
@@ -1004,10 +1259,13 @@ async def serve_pdf(filename: str):
     Serve PDF lead magnet files
     No authentication required - these are meant to be shared publicly
     """
-    pdf_path = Path("pdf_lead_magnets/generated") / filename
+    # Security: Prevent directory traversal (validate before touching the filesystem)
+    if not _PDF_NAME_RE.fullmatch(filename):
+        raise HTTPException(status_code=404, detail="PDF not found")
 
-    # Security: Prevent directory traversal
-    if not pdf_path.is_file() or ".." in filename or "/" in filename:
+    # resolve() follows symlinks, so a link pointing outside the directory is rejected too
+    pdf_path = (PDF_DIR / filename).resolve()
+    if not pdf_path.is_relative_to(PDF_DIR) or not pdf_path.is_file():
         raise HTTPException(status_code=404, detail="PDF not found")
 
     return FileResponse(
@@ -1016,30 +1274,52 @@ async def serve_pdf(filename: str):
         filename=filename
     )
 
-@app.get("/api/pdf/list", tags=["PDF Lead Magnets"])
-async def list_pdfs(api_key: APIKey = Depends(require_auth)):
+@protected_router.get("/api/pdf/list", tags=["PDF Lead Magnets"])
+async def list_pdfs():
     """List all generated PDF lead magnets (PROTECTED - requires API key)"""
-    pdf_dir = Path("pdf_lead_magnets/generated")
-
-    if not pdf_dir.exists():
+    if not PDF_DIR.is_dir():
         return {"pdfs": []}
 
-    pdfs = []
-    for pdf_file in pdf_dir.glob("*.pdf"):
-        stat = pdf_file.stat()
-        pdfs.append({
-            "filename": pdf_file.name,
+    # DirEntry caches its stat result, so each file costs one stat call
+    with os.scandir(PDF_DIR) as entries:
+        files = [
+            (entry.name, entry.stat())
+            for entry in entries
+            if entry.name.endswith(".pdf") and entry.is_file()
+        ]
+
+    files.sort(key=lambda f: f[1].st_ctime, reverse=True)
+
+    pdfs = [
+        {
+            "filename": name,
             "size_bytes": stat.st_size,
             "created_at": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-            "url": f"/pdf/{pdf_file.name}"
-        })
+            "url": f"/pdf/{name}"
+        }
+        for name, stat in files
+    ]
 
     return {
         "count": len(pdfs),
-        "pdfs": sorted(pdfs, key=lambda x: x["created_at"], reverse=True)
+        "pdfs": pdfs
     }
 
 
+app.include_router(protected_router)
+
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    # Workers are opt-in: API keys created at runtime, rate limits and caches are
+    # per process, and CLAUDE_CONCURRENCY applies to each worker separately.
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    # loop/http stay on "auto", which picks uvloop + httptools from uvicorn[standard]
+    uvicorn.run(
+        "api_server:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        workers=workers,
+        backlog=2048
+    )
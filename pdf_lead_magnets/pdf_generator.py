@@ -8,18 +8,98 @@ from datetime import datetime
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Flowable
+from reportlab.lib.utils import ImageReader
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.pdfgen import canvas
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.ticker import FuncFormatter
 import io
+import threading
+import numpy as np
+from PIL import Image as PILImage
+
+# Optional: embed charts as vector drawings (no PNG encode, sharper output)
+try:
+    from svglib.svglib import svg2rlg
+except ImportError:
+    svg2rlg = None
+
+def _format_millions(x, p=None):
+    return f'${x/1e6:.1f}M'
+
+# Y-axis tick formatters, one per chart: a formatter binds to the axis it is set on,
+# and each chart type has exactly one (lock-guarded) axes per process
+_SAVINGS_COMPARISON_FORMATTER = FuncFormatter(_format_millions)
+_CUMULATIVE_SAVINGS_FORMATTER = FuncFormatter(_format_millions)
+
+# One reusable Figure per chart type (building a Figure dominates chart cost).
+# Each has its own lock so concurrent PDF renders in threads don't interleave.
+_chart_figures = {}  # {chart_name: (fig, ax, lock)}
+_chart_figures_lock = threading.Lock()
+
+def _get_chart_figure(chart_name, figsize):
+    """Get (or lazily create) the shared Figure/Axes for a chart type"""
+    with _chart_figures_lock:
+        if chart_name not in _chart_figures:
+            # Constrained layout fits labels at draw time, so savefig needs no
+            # bbox_inches='tight' (which costs an extra render pass per chart)
+            fig = Figure(figsize=figsize, dpi=150, constrained_layout=True)
+            FigureCanvasAgg(fig)
+            _chart_figures[chart_name] = (fig, fig.add_subplot(), threading.Lock())
+        return _chart_figures[chart_name]
+
+class _ChartImage(Flowable):
+    """Centered flowable that draws an in-memory raster chart"""
+
+    def __init__(self, image_reader, width, height):
+        super().__init__()
+        self.image_reader = image_reader
+        self.width = width
+        self.height = height
+        self.hAlign = 'CENTER'
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        self.canv.drawImage(self.image_reader, 0, 0, self.width, self.height)
+
+def _render_chart(fig):
+    """Render a chart figure to an SVG buffer (vector) or raw 150dpi raster"""
+    if svg2rlg is not None:
+        img_buffer = io.BytesIO()
+        fig.savefig(img_buffer, format='svg', facecolor='white')
+        img_buffer.seek(0)
+        return img_buffer
+
+    # Hand Agg's RGB pixels straight to reportlab: no PNG encode here, no decode there.
+    # convert() copies out of the shared canvas, which is redrawn before doc.build()
+    fig.canvas.draw()
+    pixels = PILImage.frombuffer('RGBA', fig.canvas.get_width_height(),
+                                 fig.canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1)
+    return ImageReader(pixels.convert('RGB'))
+
+def _chart_flowable(chart, width, height):
+    """Wrap a rendered chart as a PDF flowable of the given size"""
+    if svg2rlg is None:
+        return _ChartImage(chart, width, height)
+
+    drawing = svg2rlg(chart)
+    scale_x = width / drawing.width
+    scale_y = height / drawing.height
+    drawing.width = width
+    drawing.height = height
+    drawing.scale(scale_x, scale_y)
+    return drawing
 
 def create_pie_chart(demand_charges, energy_charges):
     """Create demand vs energy charges pie chart"""
-    fig, ax = plt.subplots(figsize=(6, 4))
+    fig, ax, lock = _get_chart_figure('pie', (6, 4))
 
     sizes = [demand_charges, energy_charges]
     labels = [f'Demand Charges\n${demand_charges/1000:.0f}K (40%)',
@@ -27,85 +107,278 @@ def create_pie_chart(demand_charges, energy_charges):
     colors_pie = ['#FF6B6B', '#4ECDC4']
     explode = (0.1, 0)
 
-    ax.pie(sizes, explode=explode, labels=labels, colors=colors_pie,
-           autopct='', shadow=True, startangle=90)
-    ax.axis('equal')
-    plt.title('Current Energy Bill Breakdown', fontsize=14, fontweight='bold', pad=20)
+    with lock:
+        ax.clear()
+        ax.pie(sizes, explode=explode, labels=labels, colors=colors_pie,
+               autopct='', shadow=True, startangle=90)
+        ax.axis('equal')
+        ax.set_title('Current Energy Bill Breakdown', fontsize=14, fontweight='bold', pad=20)
 
-    # Save to bytes
-    img_buffer = io.BytesIO()
-    plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight', facecolor='white')
-    img_buffer.seek(0)
-    plt.close()
-
-    return img_buffer
+        return _render_chart(fig)
 
 def create_savings_comparison_chart(current_annual, projected_annual):
     """Create current vs projected cost comparison bar chart"""
-    fig, ax = plt.subplots(figsize=(6, 4))
+    fig, ax, lock = _get_chart_figure('savings_comparison', (6, 4))
 
     categories = ['Current\nAnnual Cost', 'Projected\nAnnual Cost']
     values = [current_annual, projected_annual]
     colors_bars = ['#FF6B6B', '#4ECDC4']
 
-    bars = ax.bar(categories, values, color=colors_bars, width=0.5)
-
-    # Add value labels on bars
-    for bar, value in zip(bars, values):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'${value/1e6:.1f}M',
-                ha='center', va='bottom', fontsize=12, fontweight='bold')
+    with lock:
+        ax.clear()
+        bars = ax.bar(categories, values, color=colors_bars, width=0.5)
 
-    ax.set_ylabel('Annual Cost ($)', fontsize=11)
-    ax.set_title('Cost Comparison: Current vs Projected', fontsize=14, fontweight='bold', pad=20)
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x/1e6:.1f}M'))
-    ax.grid(axis='y', alpha=0.3, linestyle='--')
+        # Add value labels on bars
+        ax.bar_label(bars, labels=[_format_millions(v) for v in values],
+                     fontsize=12, fontweight='bold')
 
-    # Save to bytes
-    img_buffer = io.BytesIO()
-    plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight', facecolor='white')
-    img_buffer.seek(0)
-    plt.close()
+        ax.set_ylabel('Annual Cost ($)', fontsize=11)
+        ax.set_title('Cost Comparison: Current vs Projected', fontsize=14, fontweight='bold', pad=20)
+        ax.yaxis.set_major_formatter(_SAVINGS_COMPARISON_FORMATTER)
+        ax.grid(axis='y', alpha=0.3, linestyle='--')
 
-    return img_buffer
+        return _render_chart(fig)
 
 def create_5year_cumulative_savings_chart(annual_savings):
     """Create 5-year cumulative savings line chart"""
-    fig, ax = plt.subplots(figsize=(7, 4))
-
-    years = list(range(1, 6))
-    cumulative = [annual_savings * i for i in years]
-
-    ax.plot(years, cumulative, marker='o', linewidth=3, markersize=8, color='#4ECDC4')
-    ax.fill_between(years, cumulative, alpha=0.3, color='#4ECDC4')
-
-    # Add value labels
-    for x, y in zip(years, cumulative):
-        ax.text(x, y, f'${y/1e6:.1f}M', ha='center', va='bottom', fontsize=10, fontweight='bold')
-
-    ax.set_xlabel('Year', fontsize=11)
-    ax.set_ylabel('Cumulative Savings ($)', fontsize=11)
-    ax.set_title('5-Year Cumulative Cost Savings', fontsize=14, fontweight='bold', pad=20)
-    ax.set_xticks(years)
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x/1e6:.1f}M'))
-    ax.grid(alpha=0.3, linestyle='--')
-
-    # Save to bytes
-    img_buffer = io.BytesIO()
-    plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight', facecolor='white')
-    img_buffer.seek(0)
-    plt.close()
-
-    return img_buffer
-
-def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/generated"):
+    fig, ax, lock = _get_chart_figure('cumulative_savings', (7, 4))
+
+    years = np.arange(1, 6)
+    cumulative = years * annual_savings
+
+    with lock:
+        ax.clear()
+        ax.plot(years, cumulative, marker='o', linewidth=3, markersize=8, color='#4ECDC4')
+        ax.fill_between(years, cumulative, alpha=0.3, color='#4ECDC4')
+
+        # Add value labels
+        for x, y in zip(years.tolist(), cumulative.tolist()):
+            ax.text(x, y, _format_millions(y), ha='center', va='bottom', fontsize=10, fontweight='bold')
+
+        ax.set_xlabel('Year', fontsize=11)
+        ax.set_ylabel('Cumulative Savings ($)', fontsize=11)
+        ax.set_title('5-Year Cumulative Cost Savings', fontsize=14, fontweight='bold', pad=20)
+        ax.set_xticks(years)
+        ax.yaxis.set_major_formatter(_CUMULATIVE_SAVINGS_FORMATTER)
+        ax.grid(alpha=0.3, linestyle='--')
+
+        return _render_chart(fig)
+
+_ensured_dirs = set()  # Output directories already created by this process
+
+_FILENAME_TABLE = str.maketrans({' ': '_', ',': None})  # company name -> filename stem
+
+# Page layout shared by every PDF. The document template itself is created per
+# PDF: platypus frames carry layout state during build(), so they can't be shared
+# between concurrent renders.
+_DOC_LAYOUT = dict(
+    pagesize=letter,
+    rightMargin=0.75*inch,
+    leftMargin=0.75*inch,
+    topMargin=1*inch,
+    bottomMargin=0.75*inch
+)
+
+# Paragraph styles (built once at import, shared by every PDF)
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    textColor=colors.HexColor('#2C3E50'),
+    spaceAfter=30,
+    alignment=TA_CENTER,
+    fontName='Helvetica-Bold'
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=16,
+    textColor=colors.HexColor('#34495E'),
+    spaceAfter=12,
+    spaceBefore=20,
+    fontName='Helvetica-Bold'
+)
+
+_BODY_STYLE = ParagraphStyle(
+    'CustomBody',
+    parent=_STYLES['BodyText'],
+    fontSize=11,
+    textColor=colors.HexColor('#2C3E50'),
+    spaceAfter=12,
+    leading=16
+)
+
+_COMPANY_NAME_STYLE = ParagraphStyle(
+    'CompanyName',
+    parent=_STYLES['Heading2'],
+    fontSize=18,
+    textColor=colors.HexColor('#4ECDC4'),
+    alignment=TA_CENTER,
+    spaceAfter=10
+)
+
+_LOCATION_STYLE = ParagraphStyle(
+    'Location',
+    parent=_STYLES['Normal'],
+    fontSize=12,
+    textColor=colors.HexColor('#7F8C8D'),
+    alignment=TA_CENTER,
+    spaceAfter=30
+)
+
+_CONFIDENTIAL_STYLE = ParagraphStyle(
+    'Confidential',
+    parent=_STYLES['Normal'],
+    fontSize=10,
+    textColor=colors.HexColor('#95A5A6'),
+    alignment=TA_CENTER,
+    spaceAfter=10
+)
+
+_DATE_STYLE = ParagraphStyle(
+    'Date',
+    parent=_STYLES['Normal'],
+    fontSize=10,
+    textColor=colors.HexColor('#95A5A6'),
+    alignment=TA_CENTER
+)
+
+_CASE_STUDY_TITLE_STYLE = ParagraphStyle(
+    'CaseStudyTitle',
+    parent=_STYLES['Heading3'],
+    fontSize=13,
+    textColor=colors.HexColor('#4ECDC4'),
+    spaceAfter=12
+)
+
+_PROBLEM_HEADING_STYLE = ParagraphStyle(
+    'SubHeading',
+    parent=_STYLES['Heading3'],
+    fontSize=12,
+    textColor=colors.HexColor('#E74C3C'),
+    spaceAfter=10
+)
+
+_SOLUTION_HEADING_STYLE = ParagraphStyle(
+    'SubHeading',
+    parent=_STYLES['Heading3'],
+    fontSize=12,
+    textColor=colors.HexColor('#4ECDC4'),
+    spaceAfter=10
+)
+
+_GUARANTEE_STYLE = ParagraphStyle(
+    'Guarantee',
+    parent=_STYLES['Heading3'],
+    fontSize=13,
+    textColor=colors.HexColor('#27AE60'),
+    spaceAfter=10
+)
+
+_PILOT_STYLE = ParagraphStyle(
+    'Pilot',
+    parent=_STYLES['Heading3'],
+    fontSize=13,
+    textColor=colors.HexColor('#4ECDC4'),
+    spaceAfter=10
+)
+
+_CTA_STYLE = ParagraphStyle(
+    'CTA',
+    parent=_STYLES['Normal'],
+    fontSize=10,
+    textColor=colors.HexColor('#2C3E50'),
+    alignment=TA_CENTER
+)
+
+# Table styles (built once at import, shared by every PDF)
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495E')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 1), (1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('TOPPADDING', (0, 1), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#ECF0F1')),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#BDC3C7')),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#ECF0F1')])
+])
+
+_DEMAND_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E74C3C')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 1), (1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#BDC3C7')),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#FADBD8')])
+])
+
+_CASE_STUDY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4ECDC4')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#BDC3C7')),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#D5F4E6')])
+])
+
+_THD_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495E')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#BDC3C7')),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#ECF0F1'), colors.HexColor('#D5F4E6')])
+])
+
+_BENEFITS_TABLE_STYLE = TableStyle([
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#2C3E50')),
+    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+])
+
+_PILOT_TABLE_STYLE = TableStyle([
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#2C3E50')),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+])
+
+_CTA_TABLE_STYLE = TableStyle([
+    ('BOX', (0, 0), (-1, -1), 2, colors.HexColor('#4ECDC4')),
+    ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#E8F8F5')),
+    ('TOPPADDING', (0, 0), (-1, -1), 20),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
+    ('LEFTPADDING', (0, 0), (-1, -1), 20),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 20),
+])
+
+def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/generated", now=None):
     """
     Generate a personalized cost savings analysis PDF for a casino prospect
 
     Args:
         prospect_data: Dict containing company_profile and financial projections
         output_dir: Directory to save the generated PDF
+        now: Generation time for the filename and "Prepared" date (defaults to
+             the current time; batch callers can pass one shared value)
 
     Returns:
         str: Filename of the generated PDF
@@ -114,84 +387,44 @@ def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/gener
     company = prospect_data['company_profile']
     company_name = company['company_name']
 
+    now = now or datetime.now()
+
     # Create filename
-    safe_name = company_name.lower().replace(' ', '_').replace(',', '')
-    timestamp = datetime.now().strftime("%Y%m%d")
+    safe_name = company_name.lower().translate(_FILENAME_TABLE)
+    timestamp = now.strftime("%Y%m%d")
     filename = f"{safe_name}_cost_analysis_{timestamp}.pdf"
     filepath = os.path.join(output_dir, filename)
 
-    # Ensure output directory exists
-    os.makedirs(output_dir, exist_ok=True)
+    # Ensure output directory exists (once per directory per process)
+    if output_dir not in _ensured_dirs:
+        os.makedirs(output_dir, exist_ok=True)
+        _ensured_dirs.add(output_dir)
 
     # Create PDF
-    doc = SimpleDocTemplate(filepath, pagesize=letter,
-                           rightMargin=0.75*inch, leftMargin=0.75*inch,
-                           topMargin=1*inch, bottomMargin=0.75*inch)
+    doc = SimpleDocTemplate(filepath, **_DOC_LAYOUT)
 
     # Container for PDF elements
     elements = []
 
-    # Styles
-    styles = getSampleStyleSheet()
-
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor('#2C3E50'),
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor=colors.HexColor('#34495E'),
-        spaceAfter=12,
-        spaceBefore=20,
-        fontName='Helvetica-Bold'
-    )
-
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['BodyText'],
-        fontSize=11,
-        textColor=colors.HexColor('#2C3E50'),
-        spaceAfter=12,
-        leading=16
-    )
-
     # ============================================================================
     # COVER PAGE
     # ============================================================================
 
     elements.append(Spacer(1, 1.5*inch))
 
-    elements.append(Paragraph("ENERGY COST SAVINGS ANALYSIS", title_style))
+    elements.append(Paragraph("ENERGY COST SAVINGS ANALYSIS", _TITLE_STYLE))
     elements.append(Spacer(1, 0.3*inch))
 
-    elements.append(Paragraph(f"<b>{company_name}</b>", ParagraphStyle(
-        'CompanyName', parent=styles['Heading2'], fontSize=18,
-        textColor=colors.HexColor('#4ECDC4'), alignment=TA_CENTER, spaceAfter=10
-    )))
+    elements.append(Paragraph(f"<b>{company_name}</b>", _COMPANY_NAME_STYLE))
 
-    elements.append(Paragraph(company['location'], ParagraphStyle(
-        'Location', parent=styles['Normal'], fontSize=12,
-        textColor=colors.HexColor('#7F8C8D'), alignment=TA_CENTER, spaceAfter=30
-    )))
+    elements.append(Paragraph(company['location'], _LOCATION_STYLE))
 
     elements.append(Spacer(1, 0.5*inch))
 
-    elements.append(Paragraph("Confidential Analysis", ParagraphStyle(
-        'Confidential', parent=styles['Normal'], fontSize=10,
-        textColor=colors.HexColor('#95A5A6'), alignment=TA_CENTER, spaceAfter=10
-    )))
+    elements.append(Paragraph("Confidential Analysis", _CONFIDENTIAL_STYLE))
 
-    elements.append(Paragraph(f"Prepared: {datetime.now().strftime('%B %d, %Y')}",
-                              ParagraphStyle('Date', parent=styles['Normal'], fontSize=10,
-                                           textColor=colors.HexColor('#95A5A6'), alignment=TA_CENTER)))
+    elements.append(Paragraph(f"Prepared: {now.strftime('%B %d, %Y')}",
+                              _DATE_STYLE))
 
     elements.append(PageBreak())
 
@@ -199,7 +432,7 @@ def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/gener
     # PAGE 1: EXECUTIVE SUMMARY
     # ============================================================================
 
-    elements.append(Paragraph("Executive Summary", heading_style))
+    elements.append(Paragraph("Executive Summary", _HEADING_STYLE))
     elements.append(Spacer(1, 0.2*inch))
 
     # Summary table
@@ -215,21 +448,7 @@ def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/gener
     ]
 
     summary_table = Table(summary_data, colWidths=[3.5*inch, 2.5*inch])
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495E')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 1), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#ECF0F1')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#BDC3C7')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#ECF0F1')])
-    ]))
+    summary_table.setStyle(_SUMMARY_TABLE_STYLE)
 
     elements.append(summary_table)
     elements.append(Spacer(1, 0.3*inch))
@@ -238,7 +457,7 @@ def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/gener
         f"Based on verified results from a Las Vegas casino that achieved an <b>8.59% kW reduction</b> "
         f"(peak demand), {company_name} could realize <b>${company['annual_savings_dollars']:,.0f}</b> "
         f"in annual energy cost savings with a payback period of just {company['payback_months']} months.",
-        body_style
+        _BODY_STYLE
     ))
 
     elements.append(PageBreak())
@@ -247,7 +466,7 @@ def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/gener
     # PAGE 2: DEMAND CHARGES BREAKDOWN
     # ============================================================================
 
-    elements.append(Paragraph("Understanding Your Energy Costs", heading_style))
+    elements.append(Paragraph("Understanding Your Energy Costs", _HEADING_STYLE))
     elements.append(Spacer(1, 0.2*inch))
 
     # Calculate demand vs energy charges
@@ -260,14 +479,14 @@ def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/gener
         "<b>What Are Demand Charges?</b><br/>"
         "Demand charges are based on your <i>highest 15-minute power spike</i> each month, not your total consumption. "
         "For casinos, demand charges typically represent <b>30-50%</b> of your total utility bill due to high peak loads from gaming equipment and HVAC systems.",
-        body_style
+        _BODY_STYLE
     ))
 
     elements.append(Spacer(1, 0.2*inch))
 
     # Add pie chart
     pie_chart = create_pie_chart(annual_demand_charges, annual_energy_charges)
-    elements.append(Image(pie_chart, width=5*inch, height=3.3*inch))
+    elements.append(_chart_flowable(pie_chart, 5*inch, 3.3*inch))
 
     elements.append(Spacer(1, 0.2*inch))
 
@@ -281,17 +500,7 @@ def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/gener
     ]
 
     demand_table = Table(demand_data, colWidths=[3.5*inch, 2.5*inch])
-    demand_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E74C3C')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('ALIGN', (1, 1), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#BDC3C7')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#FADBD8')])
-    ]))
+    demand_table.setStyle(_DEMAND_TABLE_STYLE)
 
     elements.append(demand_table)
     elements.append(PageBreak())
@@ -300,7 +509,7 @@ def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/gener
     # PAGE 3: ROI PROJECTIONS
     # ============================================================================
 
-    elements.append(Paragraph("Return on Investment Analysis", heading_style))
+    elements.append(Paragraph("Return on Investment Analysis", _HEADING_STYLE))
     elements.append(Spacer(1, 0.2*inch))
 
     # Add savings comparison chart
@@ -308,13 +517,13 @@ def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/gener
     projected_annual = current_annual - company['annual_savings_dollars']
 
     savings_chart = create_savings_comparison_chart(current_annual, projected_annual)
-    elements.append(Image(savings_chart, width=5*inch, height=3.3*inch))
+    elements.append(_chart_flowable(savings_chart, 5*inch, 3.3*inch))
 
     elements.append(Spacer(1, 0.3*inch))
 
     # Add 5-year cumulative chart
     cumulative_chart = create_5year_cumulative_savings_chart(company['annual_savings_dollars'])
-    elements.append(Image(cumulative_chart, width=5.5*inch, height=3.6*inch))
+    elements.append(_chart_flowable(cumulative_chart, 5.5*inch, 3.6*inch))
 
     elements.append(PageBreak())
 
@@ -322,13 +531,12 @@ def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/gener
     # PAGE 4: VERIFIED CASE STUDY
     # ============================================================================
 
-    elements.append(Paragraph("Verified Case Study Results", heading_style))
+    elements.append(Paragraph("Verified Case Study Results", _HEADING_STYLE))
     elements.append(Spacer(1, 0.2*inch))
 
     elements.append(Paragraph(
         "<b>Las Vegas Casino - Third-Party Verified</b>",
-        ParagraphStyle('CaseStudyTitle', parent=styles['Heading3'], fontSize=13,
-                      textColor=colors.HexColor('#4ECDC4'), spaceAfter=12)
+        _CASE_STUDY_TITLE_STYLE
     ))
 
     case_study_data = [
@@ -342,16 +550,7 @@ def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/gener
     ]
 
     case_study_table = Table(case_study_data, colWidths=[3.5*inch, 2.5*inch])
-    case_study_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4ECDC4')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#BDC3C7')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#D5F4E6')])
-    ]))
+    case_study_table.setStyle(_CASE_STUDY_TABLE_STYLE)
 
     elements.append(case_study_table)
     elements.append(Spacer(1, 0.3*inch))
@@ -359,7 +558,7 @@ def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/gener
     elements.append(Paragraph(
         "<b>Key Insight:</b> The technology addresses <i>harmonic distortion</i> at the source - "
         "the root cause of inflated demand charges that LED upgrades and BMS systems cannot touch.",
-        body_style
+        _BODY_STYLE
     ))
 
     elements.append(PageBreak())
@@ -368,18 +567,17 @@ def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/gener
     # PAGE 5: HOW IT WORKS
     # ============================================================================
 
-    elements.append(Paragraph("How the Technology Works", heading_style))
+    elements.append(Paragraph("How the Technology Works", _HEADING_STYLE))
     elements.append(Spacer(1, 0.2*inch))
 
     elements.append(Paragraph("<b>The Problem: Harmonic Distortion</b>",
-                              ParagraphStyle('SubHeading', parent=styles['Heading3'], fontSize=12,
-                                           textColor=colors.HexColor('#E74C3C'), spaceAfter=10)))
+                              _PROBLEM_HEADING_STYLE))
 
     elements.append(Paragraph(
         "Gaming equipment (slot machines, servers, VFDs) creates <b>15-25% total harmonic distortion (THD)</b> "
         "in casino electrical systems - compared to just 5-8% in typical office buildings. This harmonic distortion "
         "inflates your apparent power (kVA), which drives up demand readings even when actual power consumption (kW) remains constant.",
-        body_style
+        _BODY_STYLE
     ))
 
     elements.append(Spacer(1, 0.15*inch))
@@ -392,27 +590,18 @@ def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/gener
     ]
 
     thd_table = Table(thd_data, colWidths=[2*inch, 2*inch, 2*inch])
-    thd_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495E')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#BDC3C7')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#ECF0F1'), colors.HexColor('#D5F4E6')])
-    ]))
+    thd_table.setStyle(_THD_TABLE_STYLE)
 
     elements.append(thd_table)
     elements.append(Spacer(1, 0.3*inch))
 
     elements.append(Paragraph("<b>The Solution: Solid-State Harmonic Filtration</b>",
-                              ParagraphStyle('SubHeading', parent=styles['Heading3'], fontSize=12,
-                                           textColor=colors.HexColor('#4ECDC4'), spaceAfter=10)))
+                              _SOLUTION_HEADING_STYLE))
 
     elements.append(Paragraph(
         "Tune filters install at the electrical panel level and use solid-state technology to eliminate "
         "harmonic distortion at the source. <b>No moving parts, no maintenance, 20+ year lifespan.</b>",
-        body_style
+        _BODY_STYLE
     ))
 
     elements.append(Spacer(1, 0.1*inch))
@@ -427,13 +616,7 @@ def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/gener
     ]
 
     benefits_table = Table(benefits_data, colWidths=[6*inch])
-    benefits_table.setStyle(TableStyle([
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#2C3E50')),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('TOPPADDING', (0, 0), (-1, -1), 4),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-    ]))
+    benefits_table.setStyle(_BENEFITS_TABLE_STYLE)
 
     elements.append(benefits_table)
     elements.append(PageBreak())
@@ -442,24 +625,22 @@ def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/gener
     # PAGE 6: NEXT STEPS
     # ============================================================================
 
-    elements.append(Paragraph("Next Steps", heading_style))
+    elements.append(Paragraph("Next Steps", _HEADING_STYLE))
     elements.append(Spacer(1, 0.2*inch))
 
     elements.append(Paragraph("<b>5% Savings Guarantee</b>",
-                              ParagraphStyle('Guarantee', parent=styles['Heading3'], fontSize=13,
-                                           textColor=colors.HexColor('#27AE60'), spaceAfter=10)))
+                              _GUARANTEE_STYLE))
 
     elements.append(Paragraph(
         "With <b>50,000+ installations worldwide</b>, Tune has never achieved below a 5% reduction in energy costs. "
         "If savings don't meet the 5% minimum, you receive a <b>full refund</b>.",
-        body_style
+        _BODY_STYLE
     ))
 
     elements.append(Spacer(1, 0.3*inch))
 
     elements.append(Paragraph("<b>Proposed 30-Day Metered Pilot</b>",
-                              ParagraphStyle('Pilot', parent=styles['Heading3'], fontSize=13,
-                                           textColor=colors.HexColor('#4ECDC4'), spaceAfter=10)))
+                              _PILOT_STYLE))
 
     pilot_steps = [
         ['1.', 'Install metering equipment before and after filters'],
@@ -470,14 +651,7 @@ def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/gener
     ]
 
     pilot_table = Table(pilot_steps, colWidths=[0.5*inch, 5.5*inch])
-    pilot_table.setStyle(TableStyle([
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#2C3E50')),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('TOPPADDING', (0, 0), (-1, -1), 4),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-    ]))
+    pilot_table.setStyle(_PILOT_TABLE_STYLE)
 
     elements.append(pilot_table)
     elements.append(Spacer(1, 0.4*inch))
@@ -488,19 +662,11 @@ def generate_cost_analysis_pdf(prospect_data, output_dir="pdf_lead_magnets/gener
                  "Contact us to schedule a consultation and review the pilot terms.<br/><br/>"
                  "<i>This analysis is based on verified third-party results and transparent projections. "
                  "Actual savings may vary based on facility-specific conditions.</i>",
-                 ParagraphStyle('CTA', parent=styles['Normal'], fontSize=10,
-                              textColor=colors.HexColor('#2C3E50'), alignment=TA_CENTER))
+                 _CTA_STYLE)
     ]]
 
     cta_table = Table(cta_data, colWidths=[6*inch])
-    cta_table.setStyle(TableStyle([
-        ('BOX', (0, 0), (-1, -1), 2, colors.HexColor('#4ECDC4')),
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#E8F8F5')),
-        ('TOPPADDING', (0, 0), (-1, -1), 20),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
-        ('LEFTPADDING', (0, 0), (-1, -1), 20),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 20),
-    ]))
+    cta_table.setStyle(_CTA_TABLE_STYLE)
 
     elements.append(cta_table)
 
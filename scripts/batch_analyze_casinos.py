@@ -4,7 +4,7 @@ Analyze hundreds of casino prospects and export results
 """
 
 import asyncio
-import json
+import orjson
 import csv
 from datetime import datetime
 import httpx
@@ -12,11 +12,25 @@ from typing import List, Dict
 import os
 from dotenv import load_dotenv
 
+# uvloop (installed with uvicorn[standard]) cuts event-loop overhead for the fan-out
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 load_dotenv()
 
-API_URL = "http://localhost:8000"
+API_URL = os.getenv("API_URL", "http://localhost:8000")
 API_KEY = "tune_dev_key_12345"
 
+# HTTP/2 multiplexes concurrent analyses over one connection, but only over TLS
+# (e.g. a deployed server behind a proxy) and only with the h2 package installed
+try:
+    import h2  # noqa: F401
+    USE_HTTP2 = API_URL.startswith("https://")
+except ImportError:
+    USE_HTTP2 = False
+
 # Sample casino list - you can expand this or load from CSV
 CASINO_PROSPECTS = [
     {"company_name": "MGM Grand Las Vegas", "domain": "mgmgrand.com", "employee_count": 5000, "location": "Las Vegas, NV"},
@@ -38,12 +52,11 @@ async def analyze_casino(client: httpx.AsyncClient, prospect: Dict) -> Dict:
             f"{API_URL}/api/prospects/analyze",
             params={"industry": "casino"},
             headers={"X-API-Key": API_KEY, "Content-Type": "application/json"},
-            json=prospect,
-            timeout=120.0
+            json=prospect
         )
 
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"✅ {prospect['company_name']}: Score {result['composite_score']:.1f} | Tier {result['priority_tier']} | ${result['savings_projection']['annual_savings_dollars']:,.0f}/year")
             return result
         else:
@@ -64,70 +77,75 @@ async def batch_analyze(prospects: List[Dict], concurrency: int = 3):
     print(f"Concurrency: {concurrency} simultaneous requests")
     print(f"Estimated Time: {len(prospects) / concurrency * 30} seconds\n")
 
-    results = []
+    # At most `concurrency` requests in flight; a new one starts as soon as any finishes
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
 
-    async with httpx.AsyncClient() as client:
-        # Process in batches to avoid overwhelming the API
-        for i in range(0, len(prospects), concurrency):
-            batch = prospects[i:i+concurrency]
-            print(f"\nProcessing batch {i//concurrency + 1} ({len(batch)} prospects)...")
+    timeout = httpx.Timeout(120.0, connect=5.0)
 
-            # Analyze batch concurrently
-            batch_results = await asyncio.gather(
-                *[analyze_casino(client, prospect) for prospect in batch],
-                return_exceptions=True
-            )
+    async with httpx.AsyncClient(http2=USE_HTTP2, limits=limits, timeout=timeout) as client:
 
-            results.extend(batch_results)
+        async def analyze_with_semaphore(prospect):
+            async with semaphore:
+                return await analyze_casino(client, prospect)
 
-            # Small delay between batches
-            if i + concurrency < len(prospects):
-                await asyncio.sleep(2)
+        results = await asyncio.gather(
+            *[analyze_with_semaphore(prospect) for prospect in prospects],
+            return_exceptions=True
+        )
 
     return results
 
+def _csv_row(result: Dict) -> Dict:
+    """Flatten one analysis into a Clay import row"""
+    return {
+        'company_name': result['company_profile']['company_name'],
+        'domain': result['company_profile']['domain'],
+        'composite_score': result['composite_score'],
+        'priority_tier': result['priority_tier'],
+        'intent_score': result['scores']['intent'],
+        'technical_fit_score': result['scores']['technical_fit'],
+        'urgency_score': result['scores']['urgency'],
+        'annual_savings_dollars': result['savings_projection']['annual_savings_dollars'],
+        'monthly_savings_dollars': result['savings_projection']['monthly_savings_dollars'],
+        'payback_months': result['savings_projection']['payback_period_months'],
+        'roi_percentage': result['savings_projection']['roi_percentage'],
+        'carbon_reduction_tons': result['savings_projection']['carbon_reduction_tons'],
+        'primary_persona': result['persona_mapping']['primary_persona'],
+        'buying_committee_size': result['persona_mapping']['buying_committee_size'],
+        'intent_signals_found': len(result['intent_signals'].get('sustainability_commitments', [])) +
+                               len(result['intent_signals'].get('expansion_signals', [])) +
+                               len(result['intent_signals'].get('hiring_signals', [])),
+        'recommended_messaging': result['recommended_messaging'],
+        'analyzed_at': result['analyzed_at']
+    }
+
 def export_to_csv(results: List[Dict], filename: str):
-    """Export results to CSV for Clay import"""
-
-    csv_data = []
-    for result in results:
-        if 'error' not in result:
-            csv_data.append({
-                'company_name': result['company_profile']['company_name'],
-                'domain': result['company_profile']['domain'],
-                'composite_score': result['composite_score'],
-                'priority_tier': result['priority_tier'],
-                'intent_score': result['scores']['intent'],
-                'technical_fit_score': result['scores']['technical_fit'],
-                'urgency_score': result['scores']['urgency'],
-                'annual_savings_dollars': result['savings_projection']['annual_savings_dollars'],
-                'monthly_savings_dollars': result['savings_projection']['monthly_savings_dollars'],
-                'payback_months': result['savings_projection']['payback_period_months'],
-                'roi_percentage': result['savings_projection']['roi_percentage'],
-                'carbon_reduction_tons': result['savings_projection']['carbon_reduction_tons'],
-                'primary_persona': result['persona_mapping']['primary_persona'],
-                'buying_committee_size': result['persona_mapping']['buying_committee_size'],
-                'intent_signals_found': len(result['intent_signals'].get('sustainability_commitments', [])) +
-                                       len(result['intent_signals'].get('expansion_signals', [])) +
-                                       len(result['intent_signals'].get('hiring_signals', [])),
-                'recommended_messaging': result['recommended_messaging'],
-                'analyzed_at': result['analyzed_at']
-            })
-
-    if csv_data:
-        with open(filename, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=csv_data[0].keys())
-            writer.writeheader()
-            writer.writerows(csv_data)
-
-        print(f"\n✅ Exported {len(csv_data)} results to {filename}")
-    else:
+    """Export results to CSV for Clay import (rows streamed straight to the file)"""
+
+    successful = (r for r in results if 'error' not in r)
+    first = next(successful, None)
+
+    if first is None:
         print("\n❌ No successful results to export")
+        return
+
+    first_row = _csv_row(first)
+    with open(filename, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=first_row.keys())
+        writer.writeheader()
+        writer.writerow(first_row)
+        count = 1
+        for result in successful:
+            writer.writerow(_csv_row(result))
+            count += 1
+
+    print(f"\n✅ Exported {count} results to {filename}")
 
 def export_to_json(results: List[Dict], filename: str):
     """Export full results to JSON"""
-    with open(filename, 'w') as f:
-        json.dump(results, f, indent=2)
+    with open(filename, 'wb') as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
     print(f"✅ Exported full results to {filename}")
 
 def print_summary(results: List[Dict]):
@@ -195,4 +213,7 @@ async def main():
 if __name__ == "__main__":
     print("🎰 Starting Batch Casino Analysis...")
     print("Make sure API server is running: uvicorn api_server:app --reload --port 8000\n")
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
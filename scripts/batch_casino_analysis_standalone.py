@@ -3,20 +3,31 @@ Standalone Batch Casino Analysis
 Analyze hundreds of casinos using the agent directly (no API server needed)
 """
 
-import asyncio
-import json
-import csv
+import orjson
+import re
 from datetime import datetime
-from typing import List, Dict
-import anthropic
+from typing import List, Dict, Union
+import numpy as np
+import pandas as pd
 import os
 from dotenv import load_dotenv
 
+from casino_agent import load_casino_agent
+from compute_scores import compute_scores, INTENT_SCORE, TECHNICAL_FIT, URGENCY
+
 load_dotenv()
 
 # Load casino agent
-with open('agents/casino_agent.json', 'r') as f:
-    CASINO_AGENT = json.load(f)
+CASINO_AGENT = load_casino_agent()
+
+# Batch-wide constants from the agent's savings benchmarks
+TYPICAL_PCT = CASINO_AGENT['savings_benchmarks']['typical_percentage']
+SAVINGS_PCT = TYPICAL_PCT / 100.0
+PAYBACK_MONTHS = CASINO_AGENT['savings_benchmarks']['payback_months']
+
+KWH_PER_SQFT = 200  # Average for large casinos
+NV_RATE = 0.10  # Nevada average: $0.10/kWh
+EPA_FACTOR = 0.0007  # Tons CO2 per kWh
 
 CLAUDE_API_KEY = os.getenv("CLAUDE_API_KEY")
 
@@ -35,195 +46,213 @@ CASINO_PROSPECTS = [
     # CASINO_PROSPECTS = df.to_dict('records')
 ]
 
-def estimate_energy_metrics(prospect: Dict) -> Dict:
-    """Estimate energy consumption based on casino size"""
-    sqft = prospect.get('est_sqft', 1000000)
-    employees = prospect.get('employee_count', 3000)
+# Input columns and their compact dtypes (counts and sqft fit comfortably in int32)
+PROSPECT_DTYPES = {
+    'company_name': 'string',
+    'domain': 'string',
+    'location': 'string',
+    'employee_count': 'int32',
+    'est_sqft': 'int32',
+}
 
-    # Casino energy profile from agent
-    kwh_per_sqft = 200  # Average for large casinos
-    annual_kwh = sqft * kwh_per_sqft
+def estimate_energy_metrics(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Estimate energy consumption for every casino at once, based on size"""
+    sqft = df['est_sqft'].to_numpy(dtype=np.int64)  # sqft * 200 can overflow int32
 
-    # Nevada average: $0.10/kWh
-    annual_energy_spend = annual_kwh * 0.10
-
-    savings_pct = CASINO_AGENT['savings_benchmarks']['typical_percentage'] / 100
-    annual_savings = annual_energy_spend * savings_pct
+    annual_kwh = sqft * KWH_PER_SQFT
+    annual_energy_spend = annual_kwh * NV_RATE
+    annual_savings = annual_energy_spend * SAVINGS_PCT
 
     return {
         "estimated_sqft": sqft,
         "estimated_annual_kwh": annual_kwh,
         "estimated_energy_spend": annual_energy_spend,
-        "savings_percentage": CASINO_AGENT['savings_benchmarks']['typical_percentage'],
         "annual_savings_dollars": annual_savings,
         "monthly_savings_dollars": annual_savings / 12,
-        "payback_months": CASINO_AGENT['savings_benchmarks']['payback_months'],
         "five_year_savings": annual_savings * 5,
-        "carbon_reduction_tons": annual_kwh * savings_pct * 0.0007,  # EPA factor
+        "carbon_reduction_tons": annual_kwh * SAVINGS_PCT * EPA_FACTOR,
     }
 
-def score_prospect(prospect: Dict, energy_metrics: Dict) -> Dict:
-    """Quick scoring without full AI research (for batch processing)"""
+# Location tiers: the Strip first, then the other major gaming hubs
+_VEGAS_RE = re.compile(r'Las Vegas')
+_HUB_RE = re.compile(r'Atlantic City|Macau|Singapore')
 
-    # Size-based scoring
-    sqft = energy_metrics['estimated_sqft']
-    if sqft > 1000000:
-        size_score = 100
-    elif sqft > 500000:
-        size_score = 75
-    else:
-        size_score = 50
+def score_prospects(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Quick scoring without full AI research (for batch processing)"""
 
     # Location-based (Vegas strip = high value)
-    location = prospect.get('location', '')
-    if 'Las Vegas' in location:
-        location_score = 90
-    elif any(city in location for city in ['Atlantic City', 'Macau', 'Singapore']):
-        location_score = 80
-    else:
-        location_score = 60
-
-    # Default scores (you can enhance with real web research)
-    intent_score = 70  # Baseline
-    technical_fit = 85  # Casinos are always good fit
-    urgency = 65  # Moderate
-
-    # Composite score
-    composite = (
-        intent_score * 0.35 +
-        technical_fit * 0.25 +
-        urgency * 0.15 +
-        size_score * 0.15 +
-        location_score * 0.10
-    )
+    location = df['location']
+    is_vegas = location.str.contains(_VEGAS_RE).to_numpy()
+    is_other_hub = location.str.contains(_HUB_RE).to_numpy()
 
-    # Priority tier
-    if composite >= 75:
-        tier = "A"
-    elif composite >= 60:
-        tier = "B"
-    else:
-        tier = "C"
+    composite, tier, size_score, location_score = compute_scores(df['est_sqft'].to_numpy(), is_vegas, is_other_hub)
 
     return {
-        "intent": intent_score,
-        "technical_fit": technical_fit,
-        "urgency": urgency,
+        "intent": INTENT_SCORE,
+        "technical_fit": TECHNICAL_FIT,
+        "urgency": URGENCY,
         "account_value": size_score,
         "location_quality": location_score,
-        "composite": round(composite, 1)
-    }, tier
+        "composite": composite.round(1),
+        "tier": tier,
+    }
 
-def analyze_casino_fast(prospect: Dict) -> Dict:
-    """Fast analysis without API calls - for bulk processing"""
+# Columns written to the Clay import, in order
+CSV_COLUMNS = [
+    'company_name', 'domain', 'location', 'employee_count', 'composite_score', 'priority_tier',
+    'intent_score', 'technical_fit_score', 'urgency_score', 'account_value_score', 'estimated_sqft',
+    'estimated_annual_energy_spend', 'annual_savings_dollars', 'monthly_savings_dollars',
+    'payback_months', 'five_year_savings', 'carbon_reduction_tons', 'primary_persona',
+    'recommended_messaging', 'analyzed_at'
+]
 
-    energy_metrics = estimate_energy_metrics(prospect)
-    scores, tier = score_prospect(prospect, energy_metrics)
+# Dollar columns are kept numeric in the frame and only formatted on export
+DOLLAR_COLUMNS = ['estimated_annual_energy_spend', 'annual_savings_dollars', 'monthly_savings_dollars', 'five_year_savings']
 
-    # Determine primary persona based on size
-    if energy_metrics['estimated_sqft'] > 1000000:
-        primary_persona = "facilities_vp"
-    elif energy_metrics['annual_savings_dollars'] > 500000:
-        primary_persona = "energy_manager"
-    else:
-        primary_persona = "operations_director"
+PROGRESS_EVERY = 100
+CSV_CHUNK_ROWS = 10000
 
-    return {
-        "company_profile": {
-            "company_name": prospect['company_name'],
-            "domain": prospect.get('domain', ''),
-            "location": prospect.get('location', ''),
-            "employee_count": prospect.get('employee_count', 0),
-            **energy_metrics
-        },
-        "scores": scores,
-        "composite_score": scores['composite'],
-        "priority_tier": tier,
-        "savings_projection": energy_metrics,
-        "persona_mapping": {
-            "primary_persona": primary_persona,
-            "recommended_personas": ["esg_director", "facilities_vp", "energy_manager"]
-        },
-        "recommended_messaging": f"Focus on ${energy_metrics['annual_savings_dollars']:,.0f} annual savings opportunity. Emphasize {tier}-tier priority for quick ROI.",
-        "analyzed_at": datetime.now().isoformat()
-    }
+def _format_dollars(values: pd.Series) -> pd.Series:
+    """Format a numeric column as whole dollars"""
+    return values.map('${:,.0f}'.format)
 
-def batch_analyze_fast(prospects: List[Dict]) -> List[Dict]:
-    """Analyze all prospects quickly"""
-    results = []
+def batch_analyze_fast(prospects: Union[List[Dict], pd.DataFrame]) -> pd.DataFrame:
+    """Analyze all prospects quickly - one row per casino, one column per field"""
 
     print(f"\n{'='*70}")
     print(f"FAST BATCH CASINO ANALYSIS")
     print(f"{'='*70}")
     print(f"Analyzing {len(prospects)} casinos...")
     print(f"Using agent: {CASINO_AGENT['name']}")
-    print(f"Savings benchmark: {CASINO_AGENT['savings_benchmarks']['typical_percentage']}%\n")
+    print(f"Savings benchmark: {TYPICAL_PCT}%\n")
 
-    for i, prospect in enumerate(prospects, 1):
-        result = analyze_casino_fast(prospect)
-        results.append(result)
+    if isinstance(prospects, pd.DataFrame):
+        df = prospects.reindex(columns=PROSPECT_DTYPES.keys())
+    else:
+        df = pd.DataFrame.from_records(prospects, columns=list(PROSPECT_DTYPES))
+    df = df.fillna({'domain': '', 'location': '', 'employee_count': 0, 'est_sqft': 1000000}).astype(PROSPECT_DTYPES)
+
+    energy = estimate_energy_metrics(df)
+    scores = score_prospects(df)
+
+    df = df.drop(columns='est_sqft').assign(
+        composite_score=scores['composite'],
+        priority_tier=scores['tier'],
+        intent_score=scores['intent'],
+        technical_fit_score=scores['technical_fit'],
+        urgency_score=scores['urgency'],
+        account_value_score=scores['account_value'],
+        location_quality_score=scores['location_quality'],
+        estimated_sqft=energy['estimated_sqft'],
+        estimated_annual_kwh=energy['estimated_annual_kwh'],
+        estimated_annual_energy_spend=energy['estimated_energy_spend'],
+        savings_percentage=TYPICAL_PCT,
+        annual_savings_dollars=energy['annual_savings_dollars'],
+        monthly_savings_dollars=energy['monthly_savings_dollars'],
+        payback_months=PAYBACK_MONTHS,
+        five_year_savings=energy['five_year_savings'],
+        carbon_reduction_tons=energy['carbon_reduction_tons'],
+        # Determine primary persona based on size
+        primary_persona=np.select(
+            [energy['estimated_sqft'] > 1000000, energy['annual_savings_dollars'] > 500000],
+            ["facilities_vp", "energy_manager"],
+            default="operations_director"
+        ),
+    )
 
-        print(f"  {i}. {prospect['company_name']}: "
-              f"Score {result['composite_score']} | "
-              f"Tier {result['priority_tier']} | "
-              f"${result['savings_projection']['annual_savings_dollars']:,.0f}/year")
+    df['recommended_messaging'] = (
+        "Focus on " + _format_dollars(df['annual_savings_dollars']) +
+        " annual savings opportunity. Emphasize " + df['priority_tier'] +
+        "-tier priority for quick ROI."
+    )
+    df['analyzed_at'] = datetime.now().isoformat()
+
+    # Progress line every PROGRESS_EVERY casinos (and for the last one) instead of per row
+    for i in range(1, len(df) + 1):
+        if i % PROGRESS_EVERY and i != len(df):
+            continue
+        row = df.iloc[i - 1]
+        print(f"  {i}. {row['company_name']}: "
+              f"Score {row['composite_score']} | "
+              f"Tier {row['priority_tier']} | "
+              f"${row['annual_savings_dollars']:,.0f}/year")
+
+    return df
+
+def to_nested_dict(df: pd.DataFrame) -> List[Dict]:
+    """Rebuild the nested per-prospect analysis records (JSON export only)"""
+    results = []
+    for row in df.to_dict('records'):
+        energy_metrics = {
+            "estimated_sqft": row['estimated_sqft'],
+            "estimated_annual_kwh": row['estimated_annual_kwh'],
+            "estimated_energy_spend": row['estimated_annual_energy_spend'],
+            "savings_percentage": row['savings_percentage'],
+            "annual_savings_dollars": row['annual_savings_dollars'],
+            "monthly_savings_dollars": row['monthly_savings_dollars'],
+            "payback_months": row['payback_months'],
+            "five_year_savings": row['five_year_savings'],
+            "carbon_reduction_tons": row['carbon_reduction_tons'],
+        }
+
+        results.append({
+            "company_profile": {
+                "company_name": row['company_name'],
+                "domain": row['domain'],
+                "location": row['location'],
+                "employee_count": row['employee_count'],
+                **energy_metrics
+            },
+            "scores": {
+                "intent": row['intent_score'],
+                "technical_fit": row['technical_fit_score'],
+                "urgency": row['urgency_score'],
+                "account_value": row['account_value_score'],
+                "location_quality": row['location_quality_score'],
+                "composite": row['composite_score']
+            },
+            "composite_score": row['composite_score'],
+            "priority_tier": row['priority_tier'],
+            "savings_projection": energy_metrics,
+            "persona_mapping": {
+                "primary_persona": row['primary_persona'],
+                "recommended_personas": ["esg_director", "facilities_vp", "energy_manager"]
+            },
+            "recommended_messaging": row['recommended_messaging'],
+            "analyzed_at": row['analyzed_at']
+        })
 
     return results
 
-def export_to_csv(results: List[Dict], filename: str):
+def export_to_csv(results: pd.DataFrame, filename: str):
     """Export to Clay-ready CSV"""
 
-    csv_data = []
-    for r in results:
-        csv_data.append({
-            'company_name': r['company_profile']['company_name'],
-            'domain': r['company_profile']['domain'],
-            'location': r['company_profile']['location'],
-            'employee_count': r['company_profile']['employee_count'],
-            'composite_score': r['composite_score'],
-            'priority_tier': r['priority_tier'],
-            'intent_score': r['scores']['intent'],
-            'technical_fit_score': r['scores']['technical_fit'],
-            'urgency_score': r['scores']['urgency'],
-            'account_value_score': r['scores']['account_value'],
-            'estimated_sqft': r['company_profile']['estimated_sqft'],
-            'estimated_annual_energy_spend': f"${r['company_profile']['estimated_energy_spend']:,.0f}",
-            'annual_savings_dollars': f"${r['savings_projection']['annual_savings_dollars']:,.0f}",
-            'monthly_savings_dollars': f"${r['savings_projection']['monthly_savings_dollars']:,.0f}",
-            'payback_months': r['savings_projection']['payback_months'],
-            'five_year_savings': f"${r['savings_projection']['five_year_savings']:,.0f}",
-            'carbon_reduction_tons': round(r['savings_projection']['carbon_reduction_tons'], 1),
-            'primary_persona': r['persona_mapping']['primary_persona'],
-            'recommended_messaging': r['recommended_messaging'],
-            'analyzed_at': r['analyzed_at']
-        })
-
+    # Format and write a chunk at a time so the formatted copy stays small
     with open(filename, 'w', newline='') as f:
-        if csv_data:
-            writer = csv.DictWriter(f, fieldnames=csv_data[0].keys())
-            writer.writeheader()
-            writer.writerows(csv_data)
+        for start in range(0, len(results), CSV_CHUNK_ROWS):
+            chunk = results.iloc[start:start + CSV_CHUNK_ROWS]
+            chunk[CSV_COLUMNS].assign(
+                carbon_reduction_tons=chunk['carbon_reduction_tons'].round(1),
+                **{col: _format_dollars(chunk[col]) for col in DOLLAR_COLUMNS}
+            ).to_csv(f, header=start == 0, index=False)
 
-    print(f"\n✅ Exported {len(csv_data)} results to {filename}")
+    print(f"\n✅ Exported {len(results)} results to {filename}")
 
-def print_summary(results: List[Dict]):
+def print_summary(results: pd.DataFrame):
     """Print analysis summary"""
 
-    a_tier = [r for r in results if r['priority_tier'] == 'A']
-    b_tier = [r for r in results if r['priority_tier'] == 'B']
-    c_tier = [r for r in results if r['priority_tier'] == 'C']
-
-    total_savings = sum(r['savings_projection']['annual_savings_dollars'] for r in results)
-    avg_score = sum(r['composite_score'] for r in results) / len(results)
+    tier_counts = results['priority_tier'].value_counts()
+    total_savings = results['annual_savings_dollars'].sum()
+    avg_score = results['composite_score'].mean()
 
     print(f"\n{'='*70}")
     print("SUMMARY")
     print(f"{'='*70}")
     print(f"Total Analyzed: {len(results)}")
     print(f"\nPriority Distribution:")
-    print(f"  A-Tier (75+): {len(a_tier)} casinos → Generate full 5-touch sequences")
-    print(f"  B-Tier (60-74): {len(b_tier)} casinos → Standard 3-touch sequences")
-    print(f"  C-Tier (<60): {len(c_tier)} casinos → Light touch or nurture")
+    print(f"  A-Tier (75+): {tier_counts.get('A', 0)} casinos → Generate full 5-touch sequences")
+    print(f"  B-Tier (60-74): {tier_counts.get('B', 0)} casinos → Standard 3-touch sequences")
+    print(f"  C-Tier (<60): {tier_counts.get('C', 0)} casinos → Light touch or nurture")
 
     print(f"\nFinancial Opportunity:")
     print(f"  Total Annual Savings: ${total_savings:,.0f}")
@@ -231,16 +260,15 @@ def print_summary(results: List[Dict]):
     print(f"  5-Year Pipeline Value: ${total_savings * 5:,.0f}")
 
     print(f"\nTop 5 Opportunities:")
-    top_5 = sorted(results, key=lambda x: x['savings_projection']['annual_savings_dollars'], reverse=True)[:5]
-    for i, r in enumerate(top_5, 1):
-        print(f"  {i}. {r['company_profile']['company_name']}: ${r['savings_projection']['annual_savings_dollars']:,.0f}/year")
+    top_5 = results[['company_name', 'annual_savings_dollars']].nlargest(5, 'annual_savings_dollars')
+    for i, (name, savings) in enumerate(zip(top_5['company_name'], top_5['annual_savings_dollars']), 1):
+        print(f"  {i}. {name}: ${savings:,.0f}/year")
 
 def main():
     """Main function"""
 
-    # Load from the auto-generated casino list
-    import pandas as pd
-    prospects = pd.read_csv('casino_prospect_list.csv').to_dict('records')
+    # Load from the auto-generated casino list (nullable ints: Claude-generated rows can have blanks)
+    prospects = pd.read_csv('casino_prospect_list.csv', dtype={**PROSPECT_DTYPES, 'employee_count': 'Int32', 'est_sqft': 'Int32'})
 
     print(f"Loaded {len(prospects)} casinos from casino_prospect_list.csv")
 
@@ -251,8 +279,8 @@ def main():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     export_to_csv(results, f"casino_analysis_{timestamp}.csv")
 
-    with open(f"casino_analysis_{timestamp}.json", 'w') as f:
-        json.dump(results, f, indent=2)
+    with open(f"casino_analysis_{timestamp}.json", 'wb') as f:
+        f.write(orjson.dumps(to_nested_dict(results), option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
 
     # Summary
     print_summary(results)
@@ -4,72 +4,239 @@ Generate personalized emails for each casino BEFORE sending to Clay
 """
 
 import asyncio
+import hashlib
 import json
+import orjson
+import re
 import csv
 import httpx
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict
 import anthropic
 import os
 from dotenv import load_dotenv
 
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+from casino_agent import load_casino_agent
+from casino_csv import load_casino_csv
+
 load_dotenv()
 
 CLAUDE_API_KEY = os.getenv("CLAUDE_API_KEY")
+CLAUDE_CONCURRENCY = int(os.getenv("CLAUDE_CONCURRENCY", "10"))
 CLAY_WEBHOOK_URL = "https://api.clay.com/v3/sources/webhook/pull-in-data-from-a-webhook-66d60486-9c7c-4a7b-b615-9ddbe021fbab"
+CLAY_WEBHOOK_CONCURRENCY = int(os.getenv("CLAY_WEBHOOK_CONCURRENCY", "10"))
+CLAY_WEBHOOK_RATE = float(os.getenv("CLAY_WEBHOOK_RATE", "10"))  # requests per second
 
 # Load casino agent with email frameworks
-with open('agents/casino_agent.json', 'r') as f:
-    CASINO_AGENT = json.load(f)
+CASINO_AGENT = load_casino_agent()
+
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)\s*```", re.S)
+
+# Generated sequences are reused across prospects that land in the same
+# persona / location / size / savings bucket; stored with placeholders, persisted between runs
+EMAIL_CACHE_FILE = os.getenv("EMAIL_CACHE_FILE", "email_sequence_cache.json")
+_email_templates: Dict[str, List[Dict]] = {}
+_pending_templates: Dict[str, asyncio.Future] = {}
+
+# Words too generic to identify the prospect a template was generated for
+_GENERIC_NAME_WORDS = {"the", "and", "casino", "casinos", "resort", "hotel", "spa", "&"}
+
+# Dollar amounts or comma-grouped numbers left over after placeholder substitution
+_RESIDUAL_NUMBER_RE = re.compile(r"\$\s?\d|\d{1,3}(?:,\d{3})+")
+
+def load_email_cache():
+    """Load cached email templates from a previous run (skipped if the prompt or frameworks changed)"""
+    if os.path.exists(EMAIL_CACHE_FILE):
+        with open(EMAIL_CACHE_FILE, 'r') as f:
+            cached = json.load(f)
+        if cached.get('version') != _email_cache_version():
+            print(f"♻️  Ignoring {EMAIL_CACHE_FILE}: prompt or email frameworks changed since it was written")
+            return
+        _email_templates.update(cached['templates'])
+        print(f"📂 Loaded {len(_email_templates)} cached email sequences from {EMAIL_CACHE_FILE}")
+
+def save_email_cache():
+    """Persist email templates for the next run"""
+    with open(EMAIL_CACHE_FILE, 'w') as f:
+        json.dump({'version': _email_cache_version(), 'templates': _email_templates}, f, indent=2)
+
+@lru_cache(maxsize=1)
+def _email_cache_version() -> str:
+    """Hash of everything besides prospect facts that shapes a generated sequence"""
+    digest = hashlib.sha256(_PROMPT_TEMPLATE.encode())
+    digest.update(orjson.dumps(CASINO_AGENT.get('email_sequences', {}), option=orjson.OPT_SORT_KEYS))
+    return digest.hexdigest()[:16]
+
+def _email_cache_key(prospect_analysis: Dict, persona_type: str, num_emails: int) -> str:
+    """Coarse cache key: persona, sequence length, tier, location, payback and bucketed size/savings"""
+    company = prospect_analysis['company_profile']
+    return "|".join(str(part) for part in (
+        persona_type,
+        num_emails,
+        prospect_analysis['priority_tier'],
+        company['location'],
+        company['payback_months'],
+        int(round(company['estimated_sqft'], -5)),
+        int(round(company['annual_savings_dollars'], -4)),
+    ))
+
+def _email_substitutions(company: Dict) -> List[tuple]:
+    """Prospect-specific strings and the placeholders that stand in for them
+
+    Covers every prospect fact in _PROMPT_TEMPLATE, longest strings first so
+    e.g. the full location is replaced before its city alone.
+    """
+    return [
+        ("{{company_name}}", company['company_name']),
+        ("{{location}}", company['location']),
+        ("{{city}}", company['location'].split(',')[0].strip()),
+        ("{{energy_spend}}", f"${company['estimated_energy_spend']:,.0f}"),
+        ("{{annual_savings}}", f"${company['annual_savings_dollars']:,.0f}"),
+        ("{{monthly_savings}}", f"${company['monthly_savings_dollars']:,.0f}"),
+        ("{{five_year_savings}}", f"${company['five_year_savings']:,.0f}"),
+        ("{{estimated_sqft}}", f"{company['estimated_sqft']:,}"),
+        ("{{payback}}", f"{company['payback_months']} months"),
+        ("{{payback_month}}", f"{company['payback_months']}-month"),
+    ]
+
+def _template_is_reusable(templates: List[Dict], company: Dict) -> bool:
+    """True if nothing identifying the source prospect survived placeholder substitution
+
+    Claude sometimes shortens names ("Borgata") or rounds figures ("$1.3M");
+    those sequences are still used for their own prospect but never cached.
+    """
+    name_words = {
+        word for word in re.findall(r"[\w']+", company['company_name'])
+        if len(word) > 2 and word.lower() not in _GENERIC_NAME_WORDS
+    }
+    for template in templates:
+        for field in ('subject', 'body', 'cta'):
+            text = template.get(field)
+            if not isinstance(text, str):
+                continue
+            if _RESIDUAL_NUMBER_RE.search(text):
+                return False
+            if any(re.search(rf"\b{re.escape(word)}\b", text) for word in name_words):
+                return False
+    return True
+
+def _to_template(emails: List[Dict], company: Dict) -> List[Dict]:
+    """Replace the prospect's name, location and figures with placeholders"""
+    substitutions = _email_substitutions(company)
+    templates = []
+    for email in emails:
+        template = dict(email)
+        for field in ('subject', 'body', 'cta'):
+            text = template.get(field)
+            if isinstance(text, str):
+                for placeholder, value in substitutions:
+                    text = text.replace(value, placeholder)
+                template[field] = text
+        templates.append(template)
+    return templates
+
+def _from_template(templates: List[Dict], company: Dict) -> List[Dict]:
+    """Fill a cached template with this prospect's name, location and figures"""
+    substitutions = _email_substitutions(company)
+    emails = []
+    for template in templates:
+        email = dict(template)
+        for field in ('subject', 'body', 'cta'):
+            text = email.get(field)
+            if isinstance(text, str):
+                for placeholder, value in substitutions:
+                    text = text.replace(placeholder, value)
+                email[field] = text
+        emails.append(email)
+    return emails
+
+def _fallback_emails(company: Dict, num_emails: int) -> List[Dict]:
+    """Basic emails used when Claude's response can't be parsed"""
+    return [{
+        "email_number": i+1,
+        "subject": f"Energy savings opportunity for {company['company_name']}",
+        "body": f"Hi,\n\nI noticed {company['company_name']} could save ${company['annual_savings_dollars']:,.0f} annually with Tune's energy optimization. Would you be open to a brief call?\n\nBest regards",
+        "cta": "Schedule a 15-minute call",
+        "send_delay_days": i * 3
+    } for i in range(num_emails)]
 
 async def generate_email_sequence(
-    client: anthropic.Anthropic,
+    client: anthropic.AsyncAnthropic,
     prospect_analysis: Dict,
     persona_type: str,
     num_emails: int
 ) -> List[Dict]:
     """
-    Generate personalized email sequence for a prospect
+    Generate personalized email sequence for a prospect, reusing a cached
+    sequence from a similar prospect when one exists
 
     Args:
         prospect_analysis: The full analyzed prospect data
         persona_type: Primary persona (facilities_vp, energy_manager, etc.)
         num_emails: Number of emails in sequence (3 for B-tier, 5 for A-tier)
     """
+    company = prospect_analysis['company_profile']
+    key = _email_cache_key(prospect_analysis, persona_type, num_emails)
+
+    if key in _email_templates:
+        return _from_template(_email_templates[key], company)
 
-    # Get email frameworks from agent
+    # Another prospect in the same bucket is already being generated - share its result
+    if key in _pending_templates:
+        templates = await _pending_templates[key]
+        if templates is not None:
+            return _from_template(templates, company)
+
+    pending = asyncio.get_running_loop().create_future()
+    _pending_templates[key] = pending
+    templates = None
+    try:
+        emails = await _request_email_sequence(client, prospect_analysis, persona_type, num_emails)
+        candidate = _to_template(emails, company)
+        if _template_is_reusable(candidate, company):
+            templates = _email_templates[key] = candidate
+        return emails
+    except ValueError as e:
+        print(f"  ⚠️  Email generation error for {company['company_name']}: {e}")
+        # Return basic fallback emails (not cached)
+        return _fallback_emails(company, num_emails)
+    finally:
+        pending.set_result(templates)
+        _pending_templates.pop(key, None)
+
+@lru_cache(maxsize=32)
+def _frameworks_json(persona_type: str, num_emails: int) -> str:
+    """Email frameworks for a persona, serialized for the prompt (falls back to facilities_vp)"""
     email_frameworks = CASINO_AGENT.get('email_sequences', {}).get(persona_type, [])
 
     if not email_frameworks:
         # Fallback to facilities_vp if persona not found
         email_frameworks = CASINO_AGENT['email_sequences']['facilities_vp']
 
-    # Take only the number of emails needed
-    frameworks = email_frameworks[:num_emails]
+    return json.dumps(email_frameworks[:num_emails], indent=2)
 
-    # Extract data
-    company = prospect_analysis['company_profile']
-
-    # Build generation prompt
-    prompt = f"""Generate a personalized email sequence for this casino prospect:
+_PROMPT_TEMPLATE = """Generate a personalized email sequence for this casino prospect:
 
 **Prospect Details:**
-- Company: {company['company_name']}
-- Location: {company['location']}
-- Square Footage: {company['estimated_sqft']:,} sqft
-- Annual Energy Spend: ${company['estimated_energy_spend']:,.0f}
-- Potential Annual Savings: ${company['annual_savings_dollars']:,.0f}
-- Monthly Savings: ${company['monthly_savings_dollars']:,.0f}
-- Payback Period: {company['payback_months']} months
-- 5-Year Value: ${company['five_year_savings']:,.0f}
-- Priority Tier: {prospect_analysis['priority_tier']}
-- Composite Score: {prospect_analysis['composite_score']}
+- Company: {company_name}
+- Location: {location}
+- Square Footage: {estimated_sqft:,} sqft
+- Annual Energy Spend: ${estimated_energy_spend:,.0f}
+- Potential Annual Savings: ${annual_savings_dollars:,.0f}
+- Monthly Savings: ${monthly_savings_dollars:,.0f}
+- Payback Period: {payback_months} months
+- 5-Year Value: ${five_year_savings:,.0f}
+- Priority Tier: {priority_tier}
+- Composite Score: {composite_score}
 
 **Target Persona:** {persona_type}
 
 **Generate {num_emails} emails using these frameworks:**
 
-{json.dumps(frameworks, indent=2)}
+{frameworks_json}
 
 **Requirements:**
 1. Each email should be 150-200 words
@@ -94,9 +261,40 @@ Return as JSON array with this format:
 
 Focus on the massive energy waste in casinos and how Tune's 8.59% savings can transform their operations."""
 
+@retry(
+    retry=retry_if_exception_type((anthropic.RateLimitError, anthropic.APIConnectionError, anthropic.InternalServerError)),
+    wait=wait_exponential(min=1, max=30),
+    stop=stop_after_attempt(5),
+    reraise=True
+)
+async def _request_email_sequence(
+    client: anthropic.AsyncAnthropic,
+    prospect_analysis: Dict,
+    persona_type: str,
+    num_emails: int
+) -> List[Dict]:
+    """
+    Ask Claude for a personalized email sequence (retried with backoff on
+    rate limits, connection errors and 5xx)
+
+    Args:
+        prospect_analysis: The full analyzed prospect data
+        persona_type: Primary persona (facilities_vp, energy_manager, etc.)
+        num_emails: Number of emails in sequence (3 for B-tier, 5 for A-tier)
+    """
+
+    # Build generation prompt
+    prompt = _PROMPT_TEMPLATE.format_map({
+        **prospect_analysis['company_profile'],
+        'priority_tier': prospect_analysis['priority_tier'],
+        'composite_score': prospect_analysis['composite_score'],
+        'persona_type': persona_type,
+        'num_emails': num_emails,
+        'frameworks_json': _frameworks_json(persona_type, num_emails),
+    })
+
     # Generate emails using Claude
-    message = await asyncio.to_thread(
-        client.messages.create,
+    message = await client.messages.create(
         model="claude-sonnet-4-20250514",
         max_tokens=4000,
         messages=[{"role": "user", "content": prompt}]
@@ -104,28 +302,28 @@ Focus on the massive energy waste in casinos and how Tune's 8.59% savings can tr
 
     content = message.content[0].text
 
-    # Extract JSON
+    return _parse_email_json(content)
+
+def _parse_email_json(content: str) -> List[Dict]:
+    """Extract the email array from Claude's reply (fenced or bare, with or without surrounding prose)"""
+    match = _JSON_FENCE_RE.search(content)
+    text = match.group(1) if match else content
+
+    start, end = text.find('['), text.rfind(']')
+    if start == -1 or end < start:
+        raise ValueError("no JSON array in response")
+
     try:
-        if '```json' in content:
-            json_str = content.split('```json')[1].split('```')[0].strip()
-        else:
-            json_str = content
+        return orjson.loads(text[start:end + 1])
+    except orjson.JSONDecodeError:
+        # Brackets in trailing prose - decode only the first complete array
+        return json.JSONDecoder().raw_decode(text, start)[0]
 
-        emails = json.loads(json_str)
-        return emails
-    except Exception as e:
-        print(f"  ⚠️  Email generation error for {company['company_name']}: {e}")
-        # Return basic fallback emails
-        return [{
-            "email_number": i+1,
-            "subject": f"Energy savings opportunity for {company['company_name']}",
-            "body": f"Hi,\n\nI noticed {company['company_name']} could save ${company['annual_savings_dollars']:,.0f} annually with Tune's energy optimization. Would you be open to a brief call?\n\nBest regards",
-            "cta": "Schedule a 15-minute call",
-            "send_delay_days": i * 3
-        } for i in range(num_emails)]
+# Email generation order: A-tier prospects are scheduled first
+TIER_ORDER = {'A': 0, 'B': 1, 'C': 2}
 
 async def process_prospect_with_emails(
-    client: anthropic.Anthropic,
+    client: anthropic.AsyncAnthropic,
     prospect_analysis: Dict,
     semaphore: asyncio.Semaphore
 ) -> Dict:
@@ -157,7 +355,8 @@ async def process_prospect_with_emails(
 async def batch_generate_emails(analysis_results: List[Dict]) -> List[Dict]:
     """Generate emails for all prospects concurrently"""
 
-    client = anthropic.Anthropic(api_key=CLAUDE_API_KEY)
+    # One async client (and connection pool) for the whole batch
+    client = anthropic.AsyncAnthropic(api_key=CLAUDE_API_KEY, timeout=60.0)
 
     print(f"\n{'='*70}")
     print("EMAIL GENERATION FOR ALL PROSPECTS")
@@ -175,18 +374,30 @@ async def batch_generate_emails(analysis_results: List[Dict]) -> List[Dict]:
 
     total_emails = len(a_tier) * 5 + len(b_tier) * 3 + len(c_tier) * 1
     print(f"  Total emails to generate: {total_emails}")
-    print(f"\n⏱️  Estimated time: {len(analysis_results) * 3 // 60} minutes (3 concurrent generations)\n")
+    print(f"\n⏱️  Estimated time: {len(analysis_results) * 9 // (CLAUDE_CONCURRENCY * 60)} minutes ({CLAUDE_CONCURRENCY} concurrent generations)\n")
+
+    load_email_cache()
 
     # Limit concurrency to avoid rate limits
-    semaphore = asyncio.Semaphore(3)
+    semaphore = asyncio.Semaphore(CLAUDE_CONCURRENCY)
 
-    # Generate emails for all prospects
+    # A-tier first so the most valuable prospects take the first concurrency slots
+    results_with_emails = sorted(analysis_results, key=lambda r: TIER_ORDER.get(r['priority_tier'], len(TIER_ORDER)))
+
+    # Generate emails for all prospects (each task fills in its prospect dict)
     tasks = [
-        process_prospect_with_emails(client, result, semaphore)
-        for result in analysis_results
+        asyncio.ensure_future(process_prospect_with_emails(client, result, semaphore))
+        for result in results_with_emails
     ]
 
-    results_with_emails = await asyncio.gather(*tasks)
+    try:
+        for done, task in enumerate(asyncio.as_completed(tasks), 1):
+            prospect = await task
+            print(f"  ✅ {done}/{len(tasks)}: {prospect['company_profile']['company_name']} ({prospect['num_emails_generated']} emails)")
+    finally:
+        await client.close()
+
+    save_email_cache()
 
     print(f"\n✅ Generated {total_emails} personalized emails for {len(results_with_emails)} prospects")
 
@@ -201,31 +412,49 @@ async def send_to_clay_webhook(data: List[Dict]) -> bool:
     print(f"Webhook URL: {CLAY_WEBHOOK_URL}")
     print(f"Sending {len(data)} prospects with complete email sequences...\n")
 
+    # Up to CLAY_WEBHOOK_CONCURRENCY requests in flight, but request starts are
+    # spaced so the batch never exceeds CLAY_WEBHOOK_RATE requests per second
+    semaphore = asyncio.Semaphore(CLAY_WEBHOOK_CONCURRENCY)
+    rate_lock = asyncio.Lock()
+    next_slot = 0.0
+    success_count = 0
+
+    async def wait_for_slot():
+        nonlocal next_slot
+        async with rate_lock:
+            loop = asyncio.get_running_loop()
+            delay = next_slot - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            next_slot = max(next_slot, loop.time()) + 1.0 / CLAY_WEBHOOK_RATE
+
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        limits = httpx.Limits(max_connections=CLAY_WEBHOOK_CONCURRENCY, max_keepalive_connections=CLAY_WEBHOOK_CONCURRENCY)
+        async with httpx.AsyncClient(timeout=30.0, limits=limits) as client:
+
             # Send each prospect as individual webhook call
             # (Clay typically expects one record per webhook call)
-            success_count = 0
-
-            for i, prospect in enumerate(data, 1):
-                try:
-                    response = await client.post(
-                        CLAY_WEBHOOK_URL,
-                        json=prospect,
-                        headers={"Content-Type": "application/json"}
-                    )
-
-                    if response.status_code in [200, 201, 202]:
-                        success_count += 1
-                        print(f"  ✅ {i}/{len(data)}: {prospect['company_profile']['company_name']} sent successfully")
-                    else:
-                        print(f"  ❌ {i}/{len(data)}: {prospect['company_profile']['company_name']} failed (status {response.status_code})")
-
-                    # Rate limit: wait 100ms between requests
-                    await asyncio.sleep(0.1)
-
-                except Exception as e:
-                    print(f"  ❌ {i}/{len(data)}: {prospect['company_profile']['company_name']} error: {e}")
+            async def send_one(i: int, prospect: Dict):
+                nonlocal success_count
+                async with semaphore:
+                    await wait_for_slot()
+                    try:
+                        response = await client.post(
+                            CLAY_WEBHOOK_URL,
+                            json=prospect,
+                            headers={"Content-Type": "application/json"}
+                        )
+
+                        if response.status_code in [200, 201, 202]:
+                            success_count += 1
+                            print(f"  ✅ {i}/{len(data)}: {prospect['company_profile']['company_name']} sent successfully")
+                        else:
+                            print(f"  ❌ {i}/{len(data)}: {prospect['company_profile']['company_name']} failed (status {response.status_code})")
+
+                    except Exception as e:
+                        print(f"  ❌ {i}/{len(data)}: {prospect['company_profile']['company_name']} error: {e}")
+
+            await asyncio.gather(*[send_one(i, prospect) for i, prospect in enumerate(data, 1)])
 
             print(f"\n✅ Successfully sent {success_count}/{len(data)} prospects to Clay")
             return success_count == len(data)
@@ -234,43 +463,56 @@ async def send_to_clay_webhook(data: List[Dict]) -> bool:
         print(f"\n❌ Webhook error: {e}")
         return False
 
-def export_with_emails(results: List[Dict], filename: str):
-    """Export results with email content to CSV"""
+EXPORT_BASE_COLUMNS = [
+    'company_name', 'domain', 'location', 'employee_count', 'composite_score', 'priority_tier',
+    'estimated_sqft', 'annual_savings_dollars', 'monthly_savings_dollars', 'five_year_savings',
+    'primary_persona', 'num_emails'
+]
+EMAIL_FIELDS = ('subject', 'body', 'cta', 'delay_days')
+
+def _row_tuple(r: Dict, max_emails: int) -> tuple:
+    """Flatten one prospect and its emails into a CSV row, padded to max_emails"""
+    company = r['company_profile']
+    savings = r['savings_projection']
+    row = [
+        company['company_name'],
+        company['domain'],
+        company['location'],
+        company['employee_count'],
+        r['composite_score'],
+        r['priority_tier'],
+        company['estimated_sqft'],
+        f"${savings['annual_savings_dollars']:,.0f}",
+        f"${savings['monthly_savings_dollars']:,.0f}",
+        f"${savings['five_year_savings']:,.0f}",
+        r['persona_mapping']['primary_persona'],
+        r['num_emails_generated'],
+    ]
 
-    csv_data = []
-    for r in results:
-        base_row = {
-            'company_name': r['company_profile']['company_name'],
-            'domain': r['company_profile']['domain'],
-            'location': r['company_profile']['location'],
-            'employee_count': r['company_profile']['employee_count'],
-            'composite_score': r['composite_score'],
-            'priority_tier': r['priority_tier'],
-            'estimated_sqft': r['company_profile']['estimated_sqft'],
-            'annual_savings_dollars': f"${r['savings_projection']['annual_savings_dollars']:,.0f}",
-            'monthly_savings_dollars': f"${r['savings_projection']['monthly_savings_dollars']:,.0f}",
-            'five_year_savings': f"${r['savings_projection']['five_year_savings']:,.0f}",
-            'primary_persona': r['persona_mapping']['primary_persona'],
-            'num_emails': r['num_emails_generated'],
-        }
+    # Add email columns
+    for email in r['email_sequence']:
+        row += (email['subject'], email['body'], email['cta'], email['send_delay_days'])
+    row += [''] * (len(EMAIL_FIELDS) * (max_emails - len(r['email_sequence'])))
 
-        # Add email columns
-        for i, email in enumerate(r['email_sequence'], 1):
-            base_row[f'email_{i}_subject'] = email['subject']
-            base_row[f'email_{i}_body'] = email['body']
-            base_row[f'email_{i}_cta'] = email['cta']
-            base_row[f'email_{i}_delay_days'] = email['send_delay_days']
+    return tuple(row)
 
-        csv_data.append(base_row)
+def export_with_emails(results: List[Dict], filename: str):
+    """Export results with email content to CSV"""
+
+    # Fixed schema sized for the longest sequence; shorter ones are padded
+    max_emails = max((len(r['email_sequence']) for r in results), default=0)
+    header = EXPORT_BASE_COLUMNS + [
+        f'email_{i}_{field}' for i in range(1, max_emails + 1) for field in EMAIL_FIELDS
+    ]
 
     # Write CSV
     with open(filename, 'w', newline='') as f:
-        if csv_data:
-            writer = csv.DictWriter(f, fieldnames=csv_data[0].keys())
-            writer.writeheader()
-            writer.writerows(csv_data)
+        if results:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(_row_tuple(r, max_emails) for r in results)
 
-    print(f"\n✅ Exported {len(csv_data)} prospects with emails to {filename}")
+    print(f"\n✅ Exported {len(results)} prospects with emails to {filename}")
 
 async def main():
     """Main workflow: Load analysis → Generate emails → Send to Clay"""
@@ -284,52 +526,54 @@ async def main():
 
     print(f"📂 Loading analysis from {analysis_file}...")
 
-    # Read CSV and convert to analysis format
-    import pandas as pd
-    df = pd.read_csv(analysis_file)
+    # Read CSV (money columns parsed by the loader) and cast the rest once
+    df = load_casino_csv(analysis_file)
+    df = df.astype({
+        'employee_count': 'int64',
+        'estimated_sqft': 'int64',
+        'payback_months': 'int64',
+        'carbon_reduction_tons': 'float64',
+        'composite_score': 'float64',
+        'intent_score': 'int64',
+        'technical_fit_score': 'int64',
+        'urgency_score': 'int64',
+        'account_value_score': 'int64',
+    })
 
     # Convert CSV rows back to analysis format
-    analysis_results = []
-    for _, row in df.iterrows():
-        # Parse monetary values
-        annual_savings = float(row['annual_savings_dollars'].replace('$', '').replace(',', ''))
-        monthly_savings = float(row['monthly_savings_dollars'].replace('$', '').replace(',', ''))
-        five_year_savings = float(row['five_year_savings'].replace('$', '').replace(',', ''))
-        energy_spend = float(row['estimated_annual_energy_spend'].replace('$', '').replace(',', ''))
-
-        analysis_results.append({
-            'company_profile': {
-                'company_name': row['company_name'],
-                'domain': row['domain'],
-                'location': row['location'],
-                'employee_count': int(row['employee_count']),
-                'estimated_sqft': int(row['estimated_sqft']),
-                'estimated_energy_spend': energy_spend,
-                'annual_savings_dollars': annual_savings,
-                'monthly_savings_dollars': monthly_savings,
-                'five_year_savings': five_year_savings,
-                'payback_months': int(row['payback_months']),
-                'carbon_reduction_tons': float(row['carbon_reduction_tons']),
-            },
-            'composite_score': float(row['composite_score']),
-            'priority_tier': row['priority_tier'],
-            'scores': {
-                'intent': int(row['intent_score']),
-                'technical_fit': int(row['technical_fit_score']),
-                'urgency': int(row['urgency_score']),
-                'account_value': int(row['account_value_score']),
-            },
-            'savings_projection': {
-                'annual_savings_dollars': annual_savings,
-                'monthly_savings_dollars': monthly_savings,
-                'five_year_savings': five_year_savings,
-                'payback_months': int(row['payback_months']),
-                'carbon_reduction_tons': float(row['carbon_reduction_tons']),
-            },
-            'persona_mapping': {
-                'primary_persona': row['primary_persona'],
-            }
-        })
+    analysis_results = [{
+        'company_profile': {
+            'company_name': row['company_name'],
+            'domain': row['domain'],
+            'location': row['location'],
+            'employee_count': row['employee_count'],
+            'estimated_sqft': row['estimated_sqft'],
+            'estimated_energy_spend': row['estimated_annual_energy_spend'],
+            'annual_savings_dollars': row['annual_savings_dollars'],
+            'monthly_savings_dollars': row['monthly_savings_dollars'],
+            'five_year_savings': row['five_year_savings'],
+            'payback_months': row['payback_months'],
+            'carbon_reduction_tons': row['carbon_reduction_tons'],
+        },
+        'composite_score': row['composite_score'],
+        'priority_tier': row['priority_tier'],
+        'scores': {
+            'intent': row['intent_score'],
+            'technical_fit': row['technical_fit_score'],
+            'urgency': row['urgency_score'],
+            'account_value': row['account_value_score'],
+        },
+        'savings_projection': {
+            'annual_savings_dollars': row['annual_savings_dollars'],
+            'monthly_savings_dollars': row['monthly_savings_dollars'],
+            'five_year_savings': row['five_year_savings'],
+            'payback_months': row['payback_months'],
+            'carbon_reduction_tons': row['carbon_reduction_tons'],
+        },
+        'persona_mapping': {
+            'primary_persona': row['primary_persona'],
+        }
+    } for row in df.to_dict('records')]
 
     print(f"✅ Loaded {len(analysis_results)} analyzed casinos\n")
 
@@ -343,8 +587,8 @@ async def main():
 
     # Also save full JSON
     json_filename = f"casino_analysis_with_emails_{timestamp}.json"
-    with open(json_filename, 'w') as f:
-        json.dump(results_with_emails, f, indent=2)
+    with open(json_filename, 'wb') as f:
+        f.write(orjson.dumps(results_with_emails, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     print(f"✅ Exported full JSON to {json_filename}")
 
     # Send to Clay webhook
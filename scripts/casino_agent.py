@@ -0,0 +1,15 @@
+"""
+Casino Agent Loader
+Parse agents/casino_agent.json once per process, shared by the casino scripts
+"""
+
+import orjson
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict
+
+
+@lru_cache(maxsize=1)
+def load_casino_agent() -> Dict:
+    """Load the casino agent config (cached; treat the result as read-only)"""
+    return orjson.loads(Path('agents/casino_agent.json').read_bytes())
@@ -0,0 +1,21 @@
+"""
+Casino Analysis CSV Loader
+Read batch analysis exports with the dollar columns already parsed to floats
+"""
+
+import pandas as pd
+
+# Written as "$1,234,567" by batch_casino_analysis_standalone.export_to_csv
+MONEY_COLUMNS = [
+    'estimated_annual_energy_spend',
+    'annual_savings_dollars',
+    'monthly_savings_dollars',
+    'five_year_savings',
+]
+
+
+def load_casino_csv(path: str) -> pd.DataFrame:
+    """Load an analysis CSV, stripping $ and , from every money column in one vectorized pass"""
+    df = pd.read_csv(path)
+    df[MONEY_COLUMNS] = df[MONEY_COLUMNS].replace(r'[$,]', '', regex=True).astype('float64')
+    return df
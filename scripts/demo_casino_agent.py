@@ -2,11 +2,10 @@
 Demo: View Casino Agent Capabilities
 """
 
-import json
+from casino_agent import load_casino_agent
 
 # Load the casino agent
-with open('agents/casino_agent.json', 'r') as f:
-    agent = json.load(f)
+agent = load_casino_agent()
 
 print("=" * 70)
 print("🎰 CASINO AGENT LOADED")
@@ -21,12 +21,12 @@ async def run_complete_campaign():
     1. Build industry agent
     2. Create campaign in database
     3. Read Clay-enriched prospects
-    4. Analyze prospects (web research + scoring)
-    5. Write analysis back to Clay
-    6. Generate content for high-scorers
-    7. Write content to Clay
-    8. Track performance
-    9. Get analytics
+    4. Analyze prospects (web research + scoring), saving each to the
+       database and writing it back to Clay as soon as it finishes
+    5. Generate content for high-scorers
+    6. Write content to Clay
+    7. Track performance
+    8. Get analytics
     """
 
     # ============================================================================
@@ -149,53 +149,49 @@ async def run_complete_campaign():
     print(f"✅ Read {len(enriched_prospects)} Clay-enriched prospects\n")
 
     # ============================================================================
-    # STEP 5: ANALYZE PROSPECTS
+    # STEP 5: ANALYZE PROSPECTS, SAVE TO DATABASE, WRITE BACK TO CLAY
     # ============================================================================
 
     print("STEP 5: Analyzing Prospects (Web Research + Scoring)")
+    print("   Each analysis is saved to the database and written back to Clay as soon as it finishes")
     print("-" * 80)
 
-    processor = BatchProspectProcessor(agent, CLAUDE_API_KEY)
-    analyses = await processor.process_batch(enriched_prospects, concurrency=3)
+    processor = BatchProspectProcessor(agent, CLAUDE_API_KEY, client=builder.client)
+    clay_semaphore = asyncio.Semaphore(10)
 
-    print(f"\n✅ Analyzed {len(analyses)} prospects")
-    print(f"   Average Score: {sum(a['composite_score'] for a in analyses) / len(analyses):.1f}/100\n")
-
-    # ============================================================================
-    # STEP 6: SAVE TO DATABASE
-    # ============================================================================
-
-    print("STEP 6: Saving Analyses to Database")
-    print("-" * 80)
-
-    for analysis, prospect in zip(analyses, enriched_prospects):
-        prospect_id = db.insert_prospect(campaign_id, prospect, analysis)
-        print(f"   Saved: {prospect['company_name']} (Score: {analysis['composite_score']}/100)")
-
-    print(f"\n✅ Saved {len(analyses)} prospect analyses to database\n")
-
-    # ============================================================================
-    # STEP 7: WRITE ANALYSIS BACK TO CLAY
-    # ============================================================================
-
-    print("STEP 7: Writing Analysis Back to Clay")
-    print("-" * 80)
+    async def update_clay(analysis, prospect):
+        async with clay_semaphore:
+            await clay.write_prospect_analysis(
+                prospects_table_id,
+                prospect["row_id"],
+                analysis
+            )
 
-    for analysis, prospect in zip(analyses, enriched_prospects):
-        await clay.write_prospect_analysis(
-            prospects_table_id,
-            prospect["row_id"],
-            analysis
+    async def save_and_write_back(analysis, prospect):
+        prospect_id, _ = await asyncio.gather(
+            db.insert_prospect_async(campaign_id, prospect, analysis),
+            update_clay(analysis, prospect)
         )
-        print(f"   Updated Clay: {prospect['company_name']}")
+        print(f"   Saved + updated Clay: {prospect['company_name']} (Score: {analysis['composite_score']}/100)")
+        return prospect_id
+
+    analyses = []
+    write_backs = []
+    async for prospect, analysis in processor.iter_batch(enriched_prospects, concurrency=3):
+        analyses.append(analysis)
+        write_backs.append(asyncio.ensure_future(save_and_write_back(analysis, prospect)))
+    await asyncio.gather(*write_backs)
 
-    print(f"\n✅ Updated {len(analyses)} Clay rows with analysis\n")
+    print(f"\n✅ Analyzed {len(analyses)} prospects")
+    print(f"   Average Score: {sum(a['composite_score'] for a in analyses) / len(analyses):.1f}/100")
+    print(f"✅ Saved {len(analyses)} prospect analyses to database")
+    print(f"✅ Updated {len(analyses)} Clay rows with analysis\n")
 
     # ============================================================================
-    # STEP 8: GENERATE CONTENT FOR HIGH-SCORERS
+    # STEP 6: GENERATE CONTENT FOR HIGH-SCORERS
     # ============================================================================
 
-    print("STEP 8: Generating Content for High-Score Prospects")
+    print("STEP 6: Generating Content for High-Score Prospects")
     print("-" * 80)
 
     # Filter A and B tier prospects
@@ -207,7 +203,7 @@ async def run_complete_campaign():
 
     print()
 
-    content_gen = BatchContentGenerator(agent, CLAUDE_API_KEY)
+    content_gen = BatchContentGenerator(agent, CLAUDE_API_KEY, client=builder.client)
     content_results = await content_gen.generate_sequences_batch(high_scorers, concurrency=2)
 
     total_emails = sum(len(r["sequence"]) for r in content_results)
@@ -220,10 +216,10 @@ async def run_complete_campaign():
     print(f"   Average Quality Score: {avg_quality:.1f}/10\n")
 
     # ============================================================================
-    # STEP 9: WRITE CONTENT TO CLAY
+    # STEP 7: WRITE CONTENT TO CLAY
     # ============================================================================
 
-    print("STEP 9: Writing Generated Content to Clay")
+    print("STEP 7: Writing Generated Content to Clay")
     print("-" * 80)
 
     content_table_id = table_ids.get("content") or "your_content_table_id"
@@ -232,29 +228,26 @@ async def run_complete_campaign():
     print(f"✅ Wrote {total_emails} emails to Clay content table\n")
 
     # ============================================================================
-    # STEP 10: SAVE CONTENT TO DATABASE
+    # STEP 8: SAVE CONTENT TO DATABASE
     # ============================================================================
 
-    print("STEP 10: Saving Content to Database")
+    print("STEP 8: Saving Content to Database")
     print("-" * 80)
 
-    for result in content_results:
-        prospect_id = 1  # Would lookup from database in production
-        for email in result["sequence"]:
-            content_id = db.insert_generated_content(
-                prospect_id=prospect_id,
-                campaign_id=campaign_id,
-                contact_id=None,
-                email_data=email
-            )
+    prospect_id = 1  # Would lookup from database in production
+    db.bulk_insert_generated_content([
+        (prospect_id, campaign_id, None, email)
+        for result in content_results
+        for email in result["sequence"]
+    ])
 
     print(f"✅ Saved {total_emails} emails to database\n")
 
     # ============================================================================
-    # STEP 11: GET ANALYTICS
+    # STEP 9: GET ANALYTICS
     # ============================================================================
 
-    print("STEP 11: Campaign Analytics")
+    print("STEP 9: Campaign Analytics")
     print("-" * 80)
 
     analytics = AnalyticsEngine(db)
@@ -4,8 +4,10 @@ Uses AI to research and build a comprehensive casino database
 """
 
 import asyncio
-import json
+import orjson
 import csv
+from collections import Counter
+from itertools import islice
 from typing import List, Dict
 import anthropic
 import os
@@ -15,6 +17,36 @@ load_dotenv()
 
 CLAUDE_API_KEY = os.getenv("CLAUDE_API_KEY")
 
+# Forcing this tool makes Claude return the list as structured input instead of fenced JSON text
+CASINO_LIST_TOOL = {
+    "name": "emit_casinos",
+    "description": "Record the researched casino prospect list",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "casinos": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "company_name": {"type": "string", "description": "Official name"},
+                        "domain": {"type": "string", "description": "Website domain"},
+                        "location": {"type": "string", "description": "City, State"},
+                        "employee_count": {"type": "integer", "description": "Estimate"},
+                        "est_sqft": {"type": "integer", "description": "Estimated square footage"},
+                        "parent_company": {"type": ["string", "null"]},
+                        "property_type": {"type": "string", "description": "resort, standalone, tribal, etc."},
+                        "notes": {"type": "string"}
+                    },
+                    "required": ["company_name", "domain", "location", "employee_count", "est_sqft",
+                                 "parent_company", "property_type", "notes"]
+                }
+            }
+        },
+        "required": ["casinos"]
+    }
+}
+
 async def generate_casino_list(regions: List[str], min_size: str = "medium") -> List[Dict]:
     """
     Use Claude to research and generate a comprehensive casino list
@@ -24,7 +56,7 @@ async def generate_casino_list(regions: List[str], min_size: str = "medium") ->
         min_size: "small", "medium", or "large"
     """
 
-    client = anthropic.Anthropic(api_key=CLAUDE_API_KEY)
+    client = anthropic.AsyncAnthropic(api_key=CLAUDE_API_KEY)
 
     print(f"\n{'='*70}")
     print("AUTO-GENERATING CASINO PROSPECT LIST")
@@ -49,47 +81,35 @@ Focus on casinos that would be good prospects for energy efficiency solutions:
 - 24/7 operations
 - High energy consumption
 
-Format as a JSON array with these exact fields:
-- company_name
-- domain
-- location
-- employee_count (estimate)
-- est_sqft (estimate)
-- parent_company
-- property_type
-- notes
-
-Provide at least 20-30 casinos per region if possible. Include major casino resorts, tribal casinos, and regional gaming facilities."""
-
-    message = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=16000,
-        messages=[{"role": "user", "content": prompt}]
-    )
+Provide at least 20-30 casinos per region if possible. Include major casino resorts, tribal casinos, and regional gaming facilities.
 
-    content = message.content[0].text
+Record the list with the emit_casinos tool."""
 
-    # Extract JSON
     try:
-        if '```json' in content:
-            json_str = content.split('```json')[1].split('```')[0].strip()
-        else:
-            json_str = content
-
-        casinos = json.loads(json_str)
-        print(f"✅ Found {len(casinos)} casinos")
+        message = await client.messages.create(
+            model="claude-sonnet-4-20250514",
+            max_tokens=16000,
+            tools=[CASINO_LIST_TOOL],
+            tool_choice={"type": "tool", "name": CASINO_LIST_TOOL["name"]},
+            messages=[{"role": "user", "content": prompt}]
+        )
+    finally:
+        await client.close()
+
+    tool_use = next((block for block in message.content if block.type == "tool_use"), None)
+    if tool_use is None or "casinos" not in tool_use.input:
+        print(f"❌ No casino list returned (stop reason: {message.stop_reason})")
+        return []
 
-        # Preview
-        print(f"\nSample casinos:")
-        for casino in casinos[:5]:
-            print(f"  • {casino['company_name']} - {casino['location']}")
+    casinos = tool_use.input["casinos"]
+    print(f"✅ Found {len(casinos)} casinos")
 
-        return casinos
+    # Preview
+    print(f"\nSample casinos:")
+    for casino in islice(casinos, 5):
+        print(f"  • {casino['company_name']} - {casino['location']}")
 
-    except Exception as e:
-        print(f"❌ Error parsing response: {e}")
-        print(f"Response preview: {content[:500]}")
-        return []
+    return casinos
 
 def export_casino_list(casinos: List[Dict], filename: str):
     """Export casino list to CSV"""
@@ -140,8 +160,8 @@ async def main():
         export_casino_list(casinos, "casino_prospect_list.csv")
 
         # Also save as JSON
-        with open("casino_prospect_list.json", 'w') as f:
-            json.dump(casinos, f, indent=2)
+        with open("casino_prospect_list.json", 'wb') as f:
+            f.write(orjson.dumps(casinos, option=orjson.OPT_INDENT_2))
 
         print(f"\n{'='*70}")
         print("SUMMARY")
@@ -149,13 +169,10 @@ async def main():
         print(f"Total Casinos Found: {len(casinos)}")
 
         # Group by state
-        by_state = {}
-        for casino in casinos:
-            state = casino['location'].split(',')[-1].strip()
-            by_state[state] = by_state.get(state, 0) + 1
+        by_state = Counter(casino['location'].rsplit(',', 1)[-1].strip() for casino in casinos)
 
         print("\nBy State:")
-        for state, count in sorted(by_state.items(), key=lambda x: x[1], reverse=True):
+        for state, count in by_state.most_common():
             print(f"  {state}: {count} casinos")
 
         print(f"\n{'='*70}")
@@ -3,92 +3,129 @@ Quick Demo: Generate emails for top 10 A-tier casinos and send to Clay
 """
 
 import asyncio
-import json
+import orjson
 import csv
+import heapq
+import re
 import httpx
 from datetime import datetime
 from typing import List, Dict
 import anthropic
 import os
 from dotenv import load_dotenv
-import pandas as pd
 
 load_dotenv()
 
 CLAUDE_API_KEY = os.getenv("CLAUDE_API_KEY")
 CLAY_WEBHOOK_URL = "https://api.clay.com/v3/sources/webhook/pull-in-data-from-a-webhook-66d60486-9c7c-4a7b-b615-9ddbe021fbab"
+CLAY_RATE = 10  # Webhook requests per second
 
-# Load casino agent
-with open('agents/casino_agent.json', 'r') as f:
-    CASINO_AGENT = json.load(f)
+# Shared clients for the whole demo run (connections kept alive between calls)
+ASYNC_CLAUDE = anthropic.AsyncAnthropic(api_key=CLAUDE_API_KEY)
+HTTP = httpx.AsyncClient(
+    timeout=10.0,
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+)
+
+# Quick demo sequences are at most 5 emails (A-tier)
+CSV_FIELDNAMES = ['company_name', 'domain', 'location', 'composite_score', 'annual_savings', 'num_emails'] + [
+    f'email_{i}_{field}' for i in range(1, 6) for field in ('subject', 'body', 'cta')
+]
+
+PROMPT_TEMPLATE = """Generate a {num_emails}-email sequence for {company_name}:
+
+**Key Facts:**
+- Location: {location}
+- Size: {estimated_sqft:,} sqft
+- Annual Savings: ${annual_savings_dollars:,.0f}
+- Monthly Savings: ${monthly_savings_dollars:,.0f}
+- Payback: {payback_months} months
+- 5-Year Value: ${five_year_savings:,.0f}
+- Tier: {priority_tier} (Score: {composite_score})
+
+**Target Persona:** {persona_type}
+
+Create {num_emails} compelling emails."""
+
+# Instructions shared by every prospect; the user message carries only the per-casino facts
+SYSTEM_PROMPT = """You write outbound email sequences for casino prospects.
+
+Focus every email on casino energy waste (24/7 HVAC, gaming floor, kitchen) and use the key facts provided for each casino.
+
+Record the sequence with the emit_emails tool."""
+
+# Forcing this tool makes Claude return the emails as structured input instead of fenced JSON text
+EMAIL_SEQUENCE_TOOL = {
+    "name": "emit_emails",
+    "description": "Record the generated email sequence",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "emails": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "email_number": {"type": "integer"},
+                        "subject": {"type": "string", "description": "Subject line"},
+                        "body": {"type": "string", "description": "Email body (150-200 words)"},
+                        "cta": {"type": "string", "description": "Call to action"},
+                        "send_delay_days": {"type": "integer"}
+                    },
+                    "required": ["email_number", "subject", "body", "cta", "send_delay_days"]
+                }
+            }
+        },
+        "required": ["emails"]
+    }
+}
+
+# Money columns come back from the analysis CSV as "$1,234,567"
+_MONEY_RE = re.compile(r'[$,]')
+
+def _money(value: str) -> float:
+    """Parse a formatted dollar string"""
+    return float(_MONEY_RE.sub('', value))
 
 async def generate_email_sequence(
-    client: anthropic.Anthropic,
+    client: anthropic.AsyncAnthropic,
     prospect_analysis: Dict,
     persona_type: str,
     num_emails: int
 ) -> List[Dict]:
     """Generate personalized email sequence"""
 
-    email_frameworks = CASINO_AGENT.get('email_sequences', {}).get(persona_type, [])
-    if not email_frameworks:
-        email_frameworks = CASINO_AGENT['email_sequences']['facilities_vp']
-
-    frameworks = email_frameworks[:num_emails]
     company = prospect_analysis['company_profile']
 
-    prompt = f"""Generate a {num_emails}-email sequence for {company['company_name']}:
+    prompt = PROMPT_TEMPLATE.format_map({
+        **company,
+        'priority_tier': prospect_analysis['priority_tier'],
+        'composite_score': prospect_analysis['composite_score'],
+        'persona_type': persona_type,
+        'num_emails': num_emails,
+    })
 
-**Key Facts:**
-- Location: {company['location']}
-- Size: {company['estimated_sqft']:,} sqft
-- Annual Savings: ${company['annual_savings_dollars']:,.0f}
-- Monthly Savings: ${company['monthly_savings_dollars']:,.0f}
-- Payback: {company['payback_months']} months
-- 5-Year Value: ${company['five_year_savings']:,.0f}
-- Tier: {prospect_analysis['priority_tier']} (Score: {prospect_analysis['composite_score']})
-
-**Target Persona:** {persona_type}
-
-Create {num_emails} compelling emails focused on casino energy waste (24/7 HVAC, gaming floor, kitchen).
-
-Return JSON array:
-[
-  {{
-    "email_number": 1,
-    "subject": "Subject line",
-    "body": "Email body (150-200 words)",
-    "cta": "Call to action",
-    "send_delay_days": 0
-  }}
-]"""
-
-    message = await asyncio.to_thread(
-        client.messages.create,
+    message = await client.messages.create(
         model="claude-sonnet-4-20250514",
         max_tokens=4000,
+        tools=[EMAIL_SEQUENCE_TOOL],
+        tool_choice={"type": "tool", "name": EMAIL_SEQUENCE_TOOL["name"]},
+        system=SYSTEM_PROMPT,
         messages=[{"role": "user", "content": prompt}]
     )
 
-    content = message.content[0].text
+    tool_use = next((block for block in message.content if block.type == "tool_use"), None)
+    if tool_use is not None and "emails" in tool_use.input:
+        return tool_use.input["emails"]
 
-    try:
-        if '```json' in content:
-            json_str = content.split('```json')[1].split('```')[0].strip()
-        else:
-            json_str = content
-
-        emails = json.loads(json_str)
-        return emails
-    except Exception as e:
-        print(f"  ⚠️  Error: {e}")
-        return [{
-            "email_number": i+1,
-            "subject": f"${company['annual_savings_dollars']:,.0f} energy savings for {company['company_name']}",
-            "body": f"Quick note about {company['company_name']}'s energy optimization opportunity. Our analysis shows potential savings of ${company['annual_savings_dollars']:,.0f} annually. Worth a conversation?",
-            "cta": "Schedule 15-minute call",
-            "send_delay_days": i * 3
-        } for i in range(num_emails)]
+    print(f"  ⚠️  No email sequence returned (stop reason: {message.stop_reason})")
+    return [{
+        "email_number": i+1,
+        "subject": f"${company['annual_savings_dollars']:,.0f} energy savings for {company['company_name']}",
+        "body": f"Quick note about {company['company_name']}'s energy optimization opportunity. Our analysis shows potential savings of ${company['annual_savings_dollars']:,.0f} annually. Worth a conversation?",
+        "cta": "Schedule 15-minute call",
+        "send_delay_days": i * 3
+    } for i in range(num_emails)]
 
 async def process_prospect(client, prospect_analysis):
     """Generate emails for one prospect"""
@@ -107,17 +144,21 @@ async def process_prospect(client, prospect_analysis):
 
 async def send_to_clay(prospect: Dict):
     """Send one prospect to Clay webhook"""
+    name = prospect['company_profile']['company_name']
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(CLAY_WEBHOOK_URL, json=prospect)
-            if response.status_code in [200, 201, 202]:
-                print(f"    ✅ Sent to Clay")
-                return True
-            else:
-                print(f"    ❌ Clay error: {response.status_code}")
-                return False
+        response = await HTTP.post(
+            CLAY_WEBHOOK_URL,
+            content=orjson.dumps(prospect),
+            headers={'Content-Type': 'application/json'}
+        )
+        if response.status_code in [200, 201, 202]:
+            print(f"  ✅ {name}: Sent to Clay")
+            return True
+        else:
+            print(f"  ❌ {name}: Clay error: {response.status_code}")
+            return False
     except Exception as e:
-        print(f"    ❌ Error: {e}")
+        print(f"  ❌ {name}: Error: {e}")
         return False
 
 async def main():
@@ -127,96 +168,97 @@ async def main():
     print("QUICK DEMO: TOP 10 A-TIER CASINOS WITH EMAIL GENERATION")
     print(f"{'='*70}\n")
 
-    # Load analysis
-    df = pd.read_csv('casino_analysis_20251029_225746.csv')
-
-    # Parse annual_savings as numeric for sorting
-    df['annual_savings_numeric'] = df['annual_savings_dollars'].str.replace('$', '').str.replace(',', '').astype(float)
-
-    # Get top 10 A-tier by savings
-    a_tier = df[df['priority_tier'] == 'A'].nlargest(10, 'annual_savings_numeric')
+    # Top 10 A-tier by savings, straight from the analysis CSV
+    with open('casino_analysis_20251029_225746.csv', newline='') as f:
+        a_tier = heapq.nlargest(
+            10,
+            (row for row in csv.DictReader(f) if row['priority_tier'] == 'A'),
+            key=lambda row: _money(row['annual_savings_dollars'])
+        )
 
     print(f"Selected top 10 A-tier casinos by savings potential:\n")
 
     # Convert to analysis format
-    prospects = []
-    for _, row in a_tier.iterrows():
-        annual_savings = float(row['annual_savings_dollars'].replace('$', '').replace(',', ''))
-        print(f"  • {row['company_name']}: ${annual_savings:,.0f}/year")
-
-        prospects.append({
-            'company_profile': {
-                'company_name': row['company_name'],
-                'domain': row['domain'],
-                'location': row['location'],
-                'employee_count': int(row['employee_count']),
-                'estimated_sqft': int(row['estimated_sqft']),
-                'estimated_energy_spend': float(row['estimated_annual_energy_spend'].replace('$', '').replace(',', '')),
-                'annual_savings_dollars': annual_savings,
-                'monthly_savings_dollars': float(row['monthly_savings_dollars'].replace('$', '').replace(',', '')),
-                'five_year_savings': float(row['five_year_savings'].replace('$', '').replace(',', '')),
-                'payback_months': int(row['payback_months']),
-                'carbon_reduction_tons': float(row['carbon_reduction_tons']),
-            },
-            'composite_score': float(row['composite_score']),
-            'priority_tier': row['priority_tier'],
-            'persona_mapping': {
-                'primary_persona': row['primary_persona'],
-            }
-        })
+    prospects = [{
+        'company_profile': {
+            'company_name': row['company_name'],
+            'domain': row['domain'],
+            'location': row['location'],
+            'employee_count': int(row['employee_count']),
+            'estimated_sqft': int(row['estimated_sqft']),
+            'estimated_energy_spend': _money(row['estimated_annual_energy_spend']),
+            'annual_savings_dollars': _money(row['annual_savings_dollars']),
+            'monthly_savings_dollars': _money(row['monthly_savings_dollars']),
+            'five_year_savings': _money(row['five_year_savings']),
+            'payback_months': int(row['payback_months']),
+            'carbon_reduction_tons': float(row['carbon_reduction_tons']),
+        },
+        'composite_score': float(row['composite_score']),
+        'priority_tier': row['priority_tier'],
+        'persona_mapping': {
+            'primary_persona': row['primary_persona'],
+        }
+    } for row in a_tier]
+
+    for prospect in prospects:
+        print(f"  • {prospect['company_profile']['company_name']}: ${prospect['company_profile']['annual_savings_dollars']:,.0f}/year")
 
     print(f"\n{'='*70}")
     print("GENERATING 5-EMAIL SEQUENCES FOR EACH CASINO")
     print(f"{'='*70}\n")
 
-    client = anthropic.Anthropic(api_key=CLAUDE_API_KEY)
+    client = ASYNC_CLAUDE
 
-    # Generate emails (sequential for better progress visibility)
-    results = []
-    for i, prospect in enumerate(prospects, 1):
-        print(f"[{i}/10] {prospect['company_profile']['company_name']}")
-        result = await process_prospect(client, prospect)
-        results.append(result)
+    # Generate emails concurrently (up to 5 Claude calls in flight)
+    semaphore = asyncio.Semaphore(5)
 
-        # Show first email as sample
-        if result['email_sequence']:
-            email1 = result['email_sequence'][0]
-            print(f"    📨 Email 1: \"{email1['subject']}\"")
+    async def bounded(prospect):
+        async with semaphore:
+            return await process_prospect(client, prospect)
 
-    # Export to CSV
+    # Stream each casino to the CSV and NDJSON exports as soon as its emails are ready
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     csv_filename = f"top_10_casinos_with_emails_{timestamp}.csv"
+    json_filename = csv_filename.replace('.csv', '.jsonl')
 
-    csv_data = []
-    for r in results:
-        row = {
-            'company_name': r['company_profile']['company_name'],
-            'domain': r['company_profile']['domain'],
-            'location': r['company_profile']['location'],
-            'composite_score': r['composite_score'],
-            'annual_savings': f"${r['company_profile']['annual_savings_dollars']:,.0f}",
-            'num_emails': r['num_emails_generated'],
-        }
+    tasks = [asyncio.ensure_future(bounded(prospect)) for prospect in prospects]
+    with open(csv_filename, 'w', newline='') as csv_file, open(json_filename, 'wb') as json_file:
+        writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDNAMES, extrasaction='ignore')
+        writer.writeheader()
 
-        # Add emails
-        for i, email in enumerate(r['email_sequence'], 1):
-            row[f'email_{i}_subject'] = email['subject']
-            row[f'email_{i}_body'] = email['body']
-            row[f'email_{i}_cta'] = email['cta']
+        for i, task in enumerate(asyncio.as_completed(tasks), 1):
+            r = await task
+            print(f"[{i}/{len(tasks)}] {r['company_profile']['company_name']}")
+
+            # Show first email as sample
+            if r['email_sequence']:
+                email1 = r['email_sequence'][0]
+                print(f"    📨 Email 1: \"{email1['subject']}\"")
+
+            row = {
+                'company_name': r['company_profile']['company_name'],
+                'domain': r['company_profile']['domain'],
+                'location': r['company_profile']['location'],
+                'composite_score': r['composite_score'],
+                'annual_savings': f"${r['company_profile']['annual_savings_dollars']:,.0f}",
+                'num_emails': r['num_emails_generated'],
+            }
 
-        csv_data.append(row)
+            # Add emails
+            for n, email in enumerate(r['email_sequence'], 1):
+                row[f'email_{n}_subject'] = email['subject']
+                row[f'email_{n}_body'] = email['body']
+                row[f'email_{n}_cta'] = email['cta']
 
-    with open(csv_filename, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=csv_data[0].keys())
-        writer.writeheader()
-        writer.writerows(csv_data)
+            writer.writerow(row)
+            json_file.write(orjson.dumps(r) + b'\n')
+            csv_file.flush()
+            json_file.flush()
 
-    print(f"\n✅ Exported to {csv_filename}")
+    # Results in the original savings order (still needed for the Clay send)
+    results = await asyncio.gather(*tasks)
 
-    # Also save JSON
-    json_filename = csv_filename.replace('.csv', '.json')
-    with open(json_filename, 'w') as f:
-        json.dump(results, f, indent=2)
+    print(f"\n✅ Exported to {csv_filename}")
     print(f"✅ Exported to {json_filename}")
 
     # Send to Clay
@@ -224,12 +266,16 @@ async def main():
     print("SENDING TO CLAY WEBHOOK")
     print(f"{'='*70}\n")
 
-    success_count = 0
-    for i, prospect in enumerate(results, 1):
-        print(f"[{i}/10] {prospect['company_profile']['company_name']}")
-        if await send_to_clay(prospect):
-            success_count += 1
-        await asyncio.sleep(0.2)  # Rate limit
+    # All posts run concurrently; starts are staggered to stay under CLAY_RATE requests/second
+    async def send_one(i, prospect):
+        await asyncio.sleep(i / CLAY_RATE)
+        return await send_to_clay(prospect)
+
+    statuses = await asyncio.gather(
+        *(send_one(i, prospect) for i, prospect in enumerate(results)),
+        return_exceptions=True
+    )
+    success_count = sum(1 for status in statuses if status is True)
 
     # Summary
     print(f"\n{'='*70}")
@@ -242,5 +288,13 @@ async def main():
     print(f"✅ JSON: {json_filename}")
     print(f"\n💡 Next: Run batch_with_email_generation.py for all 133 casinos")
 
+async def run():
+    """Run the demo, closing the shared clients afterwards"""
+    try:
+        await main()
+    finally:
+        await HTTP.aclose()
+        await ASYNC_CLAUDE.close()
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(run())
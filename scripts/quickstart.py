@@ -3,13 +3,36 @@ Quick Start Script
 Gets you up and running with Tune Agent Builder in 5 minutes
 """
 
+import argparse
 import asyncio
 import json
 import os
 from pathlib import Path
 
+from agent_builder_system import MasterAgentBuilder, IndustryType, IndustryAgent
+from content_generator import ContentGenerator
+from database import TuneDatabase
+from prospect_intelligence import ProspectIntelligence
 
-async def setup():
+
+AGENT_PATH = Path("agents/casino_agent.json")
+
+
+async def load_or_build_agent(builder: MasterAgentBuilder, rebuild: bool = False) -> IndustryAgent:
+    """Reuse the casino agent from a previous run unless a rebuild is requested"""
+    if AGENT_PATH.exists() and not rebuild:
+        agent = await asyncio.to_thread(IndustryAgent.load, AGENT_PATH)
+        print(f"✅ Loaded casino agent from {AGENT_PATH} (pass --rebuild to refresh)")
+        return agent
+
+    print("🏗️  Building sample casino agent...")
+    agent = await builder.build_agent(IndustryType.CASINO)
+    agent.save(AGENT_PATH)
+    print("✅ Casino agent built and saved")
+    return agent
+
+
+async def setup(rebuild: bool = False):
     """Quick setup wizard"""
 
     print("\n" + "="*70)
@@ -50,21 +73,15 @@ async def setup():
     Path("agents").mkdir(exist_ok=True)
     print("✅ agents/ directory ready")
 
-    # Initialize database
+    # Initialize database (in a worker thread) while loading or building the sample agent
     print("\n📊 Initializing database...")
-    from database import TuneDatabase
-    db = TuneDatabase(config.get("database_path", "tune_campaigns.db"))
-    print("✅ Database initialized")
-
-    # Build a sample agent
-    print("\n🏗️  Building sample casino agent...")
-    from agent_builder_system import MasterAgentBuilder, IndustryType
 
     builder = MasterAgentBuilder(config["claude_api_key"])
-    agent = await builder.build_agent(IndustryType.CASINO)
-    agent.save("agents/casino_agent.json")
-
-    print("✅ Casino agent built and saved")
+    db, agent = await asyncio.gather(
+        asyncio.to_thread(TuneDatabase, config.get("database_path", "tune_campaigns.db")),
+        load_or_build_agent(builder, rebuild)
+    )
+    print("✅ Database initialized")
 
     # Create sample campaign
     print("\n📋 Creating sample campaign...")
@@ -73,9 +90,8 @@ async def setup():
 
     # Sample prospect analysis
     print("\n🔍 Analyzing sample prospect...")
-    from prospect_intelligence import ProspectIntelligence
 
-    intelligence = ProspectIntelligence(agent, config["claude_api_key"])
+    intelligence = ProspectIntelligence(agent, config["claude_api_key"], client=builder.client)
 
     sample_prospect = {
         "company_name": "MGM Grand Las Vegas",
@@ -101,9 +117,8 @@ async def setup():
 
     # Generate sample content
     print("\n✍️  Generating sample email sequence...")
-    from content_generator import ContentGenerator
 
-    generator = ContentGenerator(agent, config["claude_api_key"])
+    generator = ContentGenerator(agent, config["claude_api_key"], client=builder.client)
     sequence = await generator.generate_full_sequence(
         prospect_analysis=analysis,
         persona_type="facilities_vp"
@@ -115,13 +130,9 @@ async def setup():
     print(f"   Body Preview: {sequence[0]['body'][:200]}...")
 
     # Save content to database
-    for email in sequence:
-        db.insert_generated_content(
-            prospect_id=prospect_id,
-            campaign_id=campaign_id,
-            contact_id=None,
-            email_data=email
-        )
+    db.bulk_insert_generated_content([
+        (prospect_id, campaign_id, None, email) for email in sequence
+    ])
 
     print(f"\n✅ Generated {len(sequence)} emails and saved to database")
 
@@ -158,4 +169,9 @@ async def setup():
 
 
 if __name__ == "__main__":
-    asyncio.run(setup())
+    parser = argparse.ArgumentParser(description="Tune Agent Builder quick start")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Rebuild the casino agent even if agents/casino_agent.json exists")
+    args = parser.parse_args()
+
+    asyncio.run(setup(rebuild=args.rebuild))
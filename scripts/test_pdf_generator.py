@@ -1,11 +1,11 @@
 """
 Test PDF generation with a single casino
 """
-import pandas as pd
 from pdf_lead_magnets.pdf_generator import generate_cost_analysis_pdf
+from casino_csv import load_casino_csv
 
 # Load casino data
-df = pd.read_csv('casino_analysis_20251029_225746.csv')
+df = load_casino_csv('casino_analysis_20251029_225746.csv')
 
 # Get first A-tier casino (Foxwoods)
 casino = df[df['priority_tier'] == 'A'].iloc[0]
@@ -18,10 +18,10 @@ prospect_data = {
         'location': casino['location'],
         'employee_count': int(casino['employee_count']),
         'estimated_sqft': int(casino['estimated_sqft']),
-        'estimated_energy_spend': float(casino['estimated_annual_energy_spend'].replace('$', '').replace(',', '')),
-        'annual_savings_dollars': float(casino['annual_savings_dollars'].replace('$', '').replace(',', '')),
-        'monthly_savings_dollars': float(casino['monthly_savings_dollars'].replace('$', '').replace(',', '')),
-        'five_year_savings': float(casino['five_year_savings'].replace('$', '').replace(',', '')),
+        'estimated_energy_spend': float(casino['estimated_annual_energy_spend']),
+        'annual_savings_dollars': float(casino['annual_savings_dollars']),
+        'monthly_savings_dollars': float(casino['monthly_savings_dollars']),
+        'five_year_savings': float(casino['five_year_savings']),
         'payback_months': int(casino['payback_months']),
         'carbon_reduction_tons': float(casino['carbon_reduction_tons']),
     }
@@ -6,7 +6,7 @@ import asyncio
 import anthropic
 import os
 from dotenv import load_dotenv
-import pandas as pd
+from casino_csv import load_casino_csv
 
 # Import from worldclass_email_generator
 from worldclass_email_generator import (
@@ -26,15 +26,14 @@ async def test_single_casino():
     print("="*70 + "\n")
 
     # Load data
-    df = pd.read_csv('casino_analysis_20251029_225746.csv')
-    df['annual_savings_numeric'] = df['annual_savings_dollars'].str.replace('$', '').str.replace(',', '').astype(float)
+    df = load_casino_csv('casino_analysis_20251029_225746.csv')
 
     # Get Foxwoods (first A-tier casino)
-    a_tier = df[df['priority_tier'] == 'A'].nlargest(1, 'annual_savings_numeric')
+    a_tier = df[df['priority_tier'] == 'A'].nlargest(1, 'annual_savings_dollars')
     row = a_tier.iloc[0]
 
     # Build prospect
-    annual_savings = float(row['annual_savings_dollars'].replace('$', '').replace(',', ''))
+    annual_savings = float(row['annual_savings_dollars'])
     prospect = {
         'company_profile': {
             'company_name': row['company_name'],
@@ -42,10 +41,10 @@ async def test_single_casino():
             'location': row['location'],
             'employee_count': int(row['employee_count']),
             'estimated_sqft': int(row['estimated_sqft']),
-            'estimated_energy_spend': float(row['estimated_annual_energy_spend'].replace('$', '').replace(',', '')),
+            'estimated_energy_spend': float(row['estimated_annual_energy_spend']),
             'annual_savings_dollars': annual_savings,
-            'monthly_savings_dollars': float(row['monthly_savings_dollars'].replace('$', '').replace(',', '')),
-            'five_year_savings': float(row['five_year_savings'].replace('$', '').replace(',', '')),
+            'monthly_savings_dollars': float(row['monthly_savings_dollars']),
+            'five_year_savings': float(row['five_year_savings']),
             'payback_months': int(row['payback_months']),
             'carbon_reduction_tons': float(row['carbon_reduction_tons']),
         },
@@ -61,7 +60,7 @@ async def test_single_casino():
     print(f"Est. Savings: ${annual_savings:,.0f}/year")
     print(f"Tier: {prospect['priority_tier']}\n")
 
-    client = anthropic.Anthropic(api_key=os.getenv("CLAUDE_API_KEY"))
+    client = anthropic.AsyncAnthropic(api_key=os.getenv("CLAUDE_API_KEY"))
 
     num_emails = 5  # A-tier gets 5 emails
 
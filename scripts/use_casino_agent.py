@@ -3,16 +3,15 @@ Example: Using the Casino Agent to analyze prospects and generate content
 """
 
 import asyncio
-import json
 from prospect_intelligence import ProspectIntelligenceEngine
 from content_generator import ContentGenerator
+from casino_agent import load_casino_agent
 
 async def analyze_casino_prospects():
     """Analyze real casino prospects using the built agent"""
 
     # Load the casino agent
-    with open('agents/casino_agent.json', 'r') as f:
-        agent_data = json.load(f)
+    agent_data = load_casino_agent()
 
     print("🎰 Casino Agent Loaded!")
     print(f"Agent: {agent_data['name']}")
@@ -160,6 +160,36 @@ class IndustryAgent:
         with open(filepath, 'w') as f:
             f.write(self.to_json())
 
+    @classmethod
+    def from_json(cls, text: str) -> "IndustryAgent":
+        """Rebuild an agent from to_json() output"""
+        data = json.loads(text)
+        data['industry'] = IndustryType(data['industry'])
+        data['created_at'] = datetime.fromisoformat(data['created_at'])
+
+        data['ideal_personas'] = [
+            PersonaProfile(**{**persona, 'persona_type': PersonaType(persona['persona_type'])})
+            for persona in data['ideal_personas']
+        ]
+        data['value_props_by_persona'] = {
+            PersonaType(k): TuneValueProposition(**v) for k, v in data['value_props_by_persona'].items()
+        }
+        data['email_sequences'] = {
+            PersonaType(k): [EmailFramework(**framework) for framework in v]
+            for k, v in data['email_sequences'].items()
+        }
+        data['channel_mix_by_persona'] = {
+            PersonaType(k): v for k, v in data['channel_mix_by_persona'].items()
+        }
+
+        return cls(**data)
+
+    @classmethod
+    def load(cls, filepath: str) -> "IndustryAgent":
+        """Load agent saved with save()"""
+        with open(filepath, 'r') as f:
+            return cls.from_json(f.read())
+
 
 # =============================================================================
 # INDUSTRY RESEARCH ENGINE
@@ -168,9 +198,10 @@ class IndustryAgent:
 class IndustryResearchEngine:
     """Conducts comprehensive industry research to power agent creation"""
     
-    def __init__(self, industry: IndustryType, claude_api_key: str):
+    def __init__(self, industry: IndustryType, claude_api_key: str,
+                 client: Optional[anthropic.Anthropic] = None):
         self.industry = industry
-        self.client = anthropic.Anthropic(api_key=claude_api_key)
+        self.client = client or anthropic.Anthropic(api_key=claude_api_key)
         self.http_client = httpx.AsyncClient()
         
     async def research_industry(self) -> Dict[str, Any]:
@@ -486,9 +517,10 @@ Format as structured JSON."""
 class PersonaResearchEngine:
     """Researches target personas for industry"""
     
-    def __init__(self, industry: IndustryType, claude_api_key: str):
+    def __init__(self, industry: IndustryType, claude_api_key: str,
+                 client: Optional[anthropic.Anthropic] = None):
         self.industry = industry
-        self.client = anthropic.Anthropic(api_key=claude_api_key)
+        self.client = client or anthropic.Anthropic(api_key=claude_api_key)
     
     async def research_personas(self) -> List[PersonaProfile]:
         """Identify and research all relevant personas"""
@@ -612,9 +644,10 @@ Format as JSON with specific, actionable insights."""
 class ValuePropositionBuilder:
     """Builds industry/persona-specific value propositions"""
     
-    def __init__(self, industry: IndustryType, claude_api_key: str):
+    def __init__(self, industry: IndustryType, claude_api_key: str,
+                 client: Optional[anthropic.Anthropic] = None):
         self.industry = industry
-        self.client = anthropic.Anthropic(api_key=claude_api_key)
+        self.client = client or anthropic.Anthropic(api_key=claude_api_key)
         
         # Load Tune case study data
         self.case_study_data = self._load_case_studies()
@@ -746,9 +779,10 @@ Format as JSON."""
 class ContentFrameworkBuilder:
     """Builds email, LinkedIn, video content frameworks"""
     
-    def __init__(self, industry: IndustryType, claude_api_key: str):
+    def __init__(self, industry: IndustryType, claude_api_key: str,
+                 client: Optional[anthropic.Anthropic] = None):
         self.industry = industry
-        self.client = anthropic.Anthropic(api_key=claude_api_key)
+        self.client = client or anthropic.Anthropic(api_key=claude_api_key)
     
     async def build_email_frameworks(self, 
                                      persona_profiles: List[PersonaProfile],
@@ -833,8 +867,10 @@ Format as JSON array of 5 email specifications."""
 class MasterAgentBuilder:
     """Master system that orchestrates entire agent creation"""
     
-    def __init__(self, claude_api_key: str):
+    def __init__(self, claude_api_key: str, client: Optional[anthropic.Anthropic] = None):
         self.claude_api_key = claude_api_key
+        # One client (and connection pool) shared by every build phase
+        self.client = client or anthropic.Anthropic(api_key=claude_api_key)
     
     async def build_agent(self, industry: IndustryType, 
                          config: Optional[Dict] = None) -> IndustryAgent:
@@ -849,25 +885,25 @@ class MasterAgentBuilder:
         
         # Phase 1: Industry Research
         print("📚 Phase 1: Deep Industry Research")
-        industry_engine = IndustryResearchEngine(industry, self.claude_api_key)
+        industry_engine = IndustryResearchEngine(industry, self.claude_api_key, client=self.client)
         industry_intel = await industry_engine.research_industry()
         print("✅ Industry research complete\n")
         
         # Phase 2: Persona Research
         print("👥 Phase 2: Persona Intelligence Gathering")
-        persona_engine = PersonaResearchEngine(industry, self.claude_api_key)
+        persona_engine = PersonaResearchEngine(industry, self.claude_api_key, client=self.client)
         personas = await persona_engine.research_personas()
         print(f"✅ Identified {len(personas)} key personas\n")
         
         # Phase 3: Value Propositions
         print("💎 Phase 3: Building Value Propositions")
-        value_prop_builder = ValuePropositionBuilder(industry, self.claude_api_key)
+        value_prop_builder = ValuePropositionBuilder(industry, self.claude_api_key, client=self.client)
         value_props = await value_prop_builder.build_value_props(personas, industry_intel)
         print("✅ Value props created for each persona\n")
         
         # Phase 4: Content Frameworks
         print("✍️  Phase 4: Creating Content Frameworks")
-        content_builder = ContentFrameworkBuilder(industry, self.claude_api_key)
+        content_builder = ContentFrameworkBuilder(industry, self.claude_api_key, client=self.client)
         email_frameworks = await content_builder.build_email_frameworks(personas, value_props)
         print("✅ Email sequences designed\n")
         
@@ -5,7 +5,7 @@ Secure API access with API keys and rate limiting
 
 import secrets
 import hashlib
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime, timedelta
 from fastapi import HTTPException, Security, status, Depends, Request
 from fastapi.security import APIKeyHeader
@@ -40,8 +40,13 @@ class APIKeyManager:
 
     def __init__(self):
         self.keys: List[APIKey] = []
+        self._keys_by_hash: Dict[str, APIKey] = {}  # sha256 hex -> key, for O(1) lookup
         self._load_keys()
 
+    def _add_key(self, api_key: APIKey):
+        self.keys.append(api_key)
+        self._keys_by_hash[api_key.key_hash] = api_key
+
     def _load_keys(self):
         """Load API keys from environment or database"""
         # In production, load from database
@@ -49,7 +54,7 @@ class APIKeyManager:
 
         # Development key: "tune_dev_key_12345"
         dev_key_hash = hashlib.sha256("tune_dev_key_12345".encode()).hexdigest()
-        self.keys.append(APIKey(
+        self._add_key(APIKey(
             key_hash=dev_key_hash,
             name="Development Key",
             created_at=datetime.utcnow(),
@@ -86,7 +91,7 @@ class APIKeyManager:
             allowed_endpoints=allowed_endpoints
         )
 
-        self.keys.append(api_key)
+        self._add_key(api_key)
 
         logger.info(
             "api_key_created",
@@ -98,20 +103,23 @@ class APIKeyManager:
 
     def verify_key(self, provided_key: str) -> Optional[APIKey]:
         """Verify API key and return key object if valid"""
-        for api_key in self.keys:
-            if api_key.is_active and api_key.verify(provided_key):
-                # Update last used timestamp
-                api_key.last_used_at = datetime.utcnow()
-                return api_key
+        provided_hash = hashlib.sha256(provided_key.encode()).hexdigest()
+        api_key = self._keys_by_hash.get(provided_hash)
+
+        # Constant-time comparison on the single candidate
+        if api_key and api_key.is_active and secrets.compare_digest(provided_hash, api_key.key_hash):
+            # Update last used timestamp
+            api_key.last_used_at = datetime.utcnow()
+            return api_key
         return None
 
     def revoke_key(self, key_hash: str):
         """Revoke (deactivate) an API key"""
-        for api_key in self.keys:
-            if api_key.key_hash == key_hash:
-                api_key.is_active = False
-                logger.warning("api_key_revoked", name=api_key.name)
-                return True
+        api_key = self._keys_by_hash.get(key_hash)
+        if api_key:
+            api_key.is_active = False
+            logger.warning("api_key_revoked", name=api_key.name)
+            return True
         return False
 
 
@@ -292,6 +300,9 @@ async def require_auth(
         ):
             # Fully protected endpoint
             pass
+
+        # Or protect every endpoint on a router:
+        router = APIRouter(dependencies=[Depends(require_auth)])
     """
     return await check_rate_limit(request, api_key)
 
@@ -0,0 +1,93 @@
+"""
+LLM Response Cache
+Two-tier cache (in-process LRU + optional Redis) for Claude-backed results
+"""
+
+import os
+import time
+import json
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+import structlog
+
+logger = structlog.get_logger()
+
+
+class LLMCache:
+    """Cache Claude results keyed by a stable hash of the normalized request
+
+    L1 is an in-process LRU with TTL. L2 is Redis, used only when REDIS_URL
+    is set and the redis package is importable.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: int = 1800,
+                 redis_url: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # {key: (expires_at, value)}
+        self.hits = 0
+        self.misses = 0
+
+        self.redis = None
+        redis_url = redis_url or os.getenv("REDIS_URL")
+        if redis_url:
+            try:
+                import redis.asyncio as aioredis
+                self.redis = aioredis.from_url(redis_url)
+                logger.info("llm_cache_redis_enabled")
+            except ImportError:
+                logger.warning("llm_cache_redis_unavailable", note="redis package not installed")
+
+    @staticmethod
+    def make_key(namespace: str, payload: Dict[str, Any]) -> str:
+        """Build a stable cache key from a namespace and request payload"""
+        normalized = json.dumps(payload, sort_keys=True, default=str)
+        digest = hashlib.sha256(normalized.encode()).hexdigest()
+        return f"llm:{namespace}:{digest}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get cached value (L1, then L2)"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+
+        if self.redis is not None:
+            try:
+                raw = await self.redis.get(key)
+            except Exception as e:
+                logger.warning("llm_cache_redis_error", op="get", error=str(e))
+                raw = None
+            if raw is not None:
+                value = json.loads(raw)
+                self._set_local(key, value)
+                self.hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: Any):
+        """Store value in both tiers"""
+        self._set_local(key, value)
+
+        if self.redis is not None:
+            try:
+                await self.redis.set(key, json.dumps(value, default=str), ex=self.ttl_seconds)
+            except Exception as e:
+                logger.warning("llm_cache_redis_error", op="set", error=str(e))
+
+    def _set_local(self, key: str, value: Any):
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Clear the in-process tier"""
+        self._entries.clear()
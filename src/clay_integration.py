@@ -13,15 +13,22 @@ import httpx
 class ClayAPI:
     """Clay API client"""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, client: Optional[httpx.AsyncClient] = None):
         self.api_key = api_key
         self.base_url = "https://api.clay.com/v1"
-        self.client = httpx.AsyncClient(
+        # Pass a shared client (see make_client) to reuse pooled connections
+        self.client = client or self.make_client(api_key)
+
+    @staticmethod
+    def make_client(api_key: str) -> httpx.AsyncClient:
+        """Create an authenticated HTTP client for the Clay API"""
+        return httpx.AsyncClient(
             headers={
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json"
             },
-            timeout=30.0
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
         )
 
     async def get_table(self, table_id: str) -> Dict:
@@ -78,8 +85,9 @@ class ClayAPI:
 class ClayIntegration:
     """High-level Clay integration for Tune workflows"""
 
-    def __init__(self, clay_api_key: str, industry_agent):
-        self.api = ClayAPI(clay_api_key)
+    def __init__(self, clay_api_key: str, industry_agent,
+                 client: Optional[httpx.AsyncClient] = None):
+        self.api = ClayAPI(clay_api_key, client)
         self.agent = industry_agent
         self.table_ids = {}  # Cache table IDs
 
@@ -261,7 +269,46 @@ class ClayIntegration:
                                      row_id: str, analysis: Dict):
         """Write analysis results back to Clay prospect row"""
 
-        update_data = {
+        update_data = self._analysis_fields(analysis)
+
+        await self.api.update_row(prospects_table_id, row_id, update_data)
+
+        print(f"✅ Wrote analysis for {analysis['company_profile']['company_name']}")
+
+    async def write_prospect_analyses(self, prospects_table_id: str,
+                                      analyses: List[Dict], concurrency: int = 10):
+        """Write analyses as new Clay prospect rows (bounded concurrency)
+
+        For prospects that did not originate in Clay, so there is no row to update.
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def create_with_semaphore(analysis):
+            async with semaphore:
+                await self.create_prospect_analysis_row(prospects_table_id, analysis)
+
+        await asyncio.gather(*(create_with_semaphore(a) for a in analyses))
+
+        print(f"✅ Wrote {len(analyses)} analyses to Clay")
+
+    async def create_prospect_analysis_row(self, prospects_table_id: str, analysis: Dict):
+        """Write one analysis as a new Clay prospect row"""
+
+        profile = analysis["company_profile"]
+        row_data = {
+            "company_name": profile["company_name"],
+            "domain": profile.get("domain"),
+            "industry": profile.get("industry"),
+            "employee_count": profile.get("employee_count"),
+            **self._analysis_fields(analysis),
+        }
+        await self.api.create_row(prospects_table_id, row_data)
+
+    def _analysis_fields(self, analysis: Dict) -> Dict:
+        """Clay prospect columns for an analysis"""
+
+        return {
             "composite_score": analysis["composite_score"],
             "priority_tier": analysis["priority_tier"],
             "intent_score": analysis["scores"]["intent"],
@@ -278,19 +325,18 @@ class ClayIntegration:
             "analyzed_at": datetime.now().isoformat(),
         }
 
-        await self.api.update_row(prospects_table_id, row_id, update_data)
-
-        print(f"✅ Wrote analysis for {analysis['company_profile']['company_name']}")
-
     async def write_generated_content(self, content_table_id: str,
-                                     content_results: List[Dict]):
+                                     content_results: List[Dict],
+                                     concurrency: int = 10):
         """Write generated email sequences to Clay content table"""
 
         print(f"✍️  Writing {len(content_results)} sequences to Clay...")
 
+        generated_at = datetime.now().isoformat()
+        rows = []
         for result in content_results:
             for email in result["sequence"]:
-                row_data = {
+                rows.append({
                     "company_name": result["company"],
                     "persona_type": result["persona_type"],
                     "touch_number": email["touch_number"],
@@ -300,12 +346,18 @@ class ClayIntegration:
                     "quality_score": email["quality_score"],
                     "personalization_depth": len(email.get("personalization_used", [])),
                     "status": "ready_to_review" if email["quality_score"] >= 7 else "draft",
-                    "generated_at": datetime.now().isoformat(),
+                    "generated_at": generated_at,
                     "priority_tier": result["priority_tier"],
-                }
+                })
+
+        semaphore = asyncio.Semaphore(concurrency)
 
+        async def create_with_semaphore(row_data):
+            async with semaphore:
                 await self.api.create_row(content_table_id, row_data)
 
+        await asyncio.gather(*(create_with_semaphore(row) for row in rows))
+
         print(f"✅ Wrote content to Clay")
 
     async def get_prospects_needing_analysis(self, prospects_table_id: str) -> List[Dict]:
@@ -342,10 +394,11 @@ class ClayIntegration:
 class ClayWebhookHandler:
     """Handle webhooks from Clay for automation"""
 
-    def __init__(self, industry_agent, claude_api_key: str, clay_api_key: str):
+    def __init__(self, industry_agent, claude_api_key: str, clay_api_key: str,
+                 client: Optional[httpx.AsyncClient] = None):
         self.agent = industry_agent
         self.claude_api_key = claude_api_key
-        self.clay = ClayIntegration(clay_api_key, industry_agent)
+        self.clay = ClayIntegration(clay_api_key, industry_agent, client)
 
     async def handle_new_prospect(self, webhook_data: Dict) -> Dict:
         """
@@ -416,7 +469,7 @@ class ClayWebhookHandler:
         return {
             "status": "success",
             "emails_generated": len(sequence),
-            "avg_quality": sum(e["quality_score"] for e in sequence) / len(sequence)
+            "avg_quality": sum(e["quality_score"] for e in sequence) / len(sequence) if sequence else 0
         }
 
 
@@ -13,9 +13,10 @@ import anthropic
 class ContentGenerator:
     """Generates highly personalized emails, LinkedIn messages, and video scripts"""
     
-    def __init__(self, industry_agent, claude_api_key: str):
+    def __init__(self, industry_agent, claude_api_key: str,
+                 client: Optional[anthropic.Anthropic] = None):
         self.agent = industry_agent
-        self.client = anthropic.Anthropic(api_key=claude_api_key)
+        self.client = client or anthropic.Anthropic(api_key=claude_api_key)
     
     async def generate_full_sequence(self, prospect_analysis: Dict, 
                                      persona_type: str) -> List[Dict]:
@@ -354,8 +355,10 @@ Format as JSON with timestamps."""
 class BatchContentGenerator:
     """Generate content for multiple prospects efficiently"""
     
-    def __init__(self, industry_agent, claude_api_key: str):
-        self.generator = ContentGenerator(industry_agent, claude_api_key)
+    def __init__(self, industry_agent, claude_api_key: str,
+                 client: Optional[anthropic.Anthropic] = None):
+        self.agent = industry_agent
+        self.generator = ContentGenerator(industry_agent, claude_api_key, client=client)
         self.results = []
     
     async def generate_sequences_batch(self, prospects_analyzed: List[Dict],
@@ -368,20 +371,7 @@ class BatchContentGenerator:
         
         async def generate_with_semaphore(prospect):
             async with semaphore:
-                # Determine persona to target
-                persona_type = self._select_primary_persona(prospect)
-                
-                # Generate sequence
-                sequence = await self.generator.generate_full_sequence(
-                    prospect, persona_type
-                )
-                
-                return {
-                    "company": prospect["company_profile"]["company_name"],
-                    "persona_type": persona_type,
-                    "sequence": sequence,
-                    "priority_tier": prospect["priority_tier"]
-                }
+                return await self.generate_for_prospect(prospect)
         
         tasks = [generate_with_semaphore(p) for p in prospects_analyzed]
         results = await asyncio.gather(*tasks)
@@ -393,6 +383,24 @@ class BatchContentGenerator:
         
         return results
     
+    async def generate_for_prospect(self, prospect_analysis: Dict) -> Dict:
+        """Generate email sequence for a single analyzed prospect"""
+        
+        # Determine persona to target
+        persona_type = self._select_primary_persona(prospect_analysis)
+        
+        # Generate sequence
+        sequence = await self.generator.generate_full_sequence(
+            prospect_analysis, persona_type
+        )
+        
+        return {
+            "company": prospect_analysis["company_profile"]["company_name"],
+            "persona_type": persona_type,
+            "sequence": sequence,
+            "priority_tier": prospect_analysis["priority_tier"]
+        }
+    
     def _select_primary_persona(self, prospect_analysis: Dict) -> str:
         """Select primary persona to target first"""
         
@@ -410,11 +418,15 @@ class BatchContentGenerator:
     def _print_summary(self):
         """Print generation summary"""
         
-        total_emails = sum(len(r["sequence"]) for r in self.results)
-        avg_quality = sum(
-            sum(e["quality_score"] for e in r["sequence"]) / len(r["sequence"])
-            for r in self.results
-        ) / len(self.results) if self.results else 0
+        # Single pass: total emails + mean of per-prospect average quality
+        total_emails = 0
+        quality_sum = 0.0
+        for r in self.results:
+            sequence = r["sequence"]
+            if sequence:
+                total_emails += len(sequence)
+                quality_sum += sum(e["quality_score"] for e in sequence) / len(sequence)
+        avg_quality = quality_sum / len(self.results) if self.results else 0
         
         print(f"\n{'='*60}")
         print("📧 CONTENT GENERATION SUMMARY")
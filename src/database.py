@@ -5,6 +5,7 @@ Campaign tracking, performance analytics, A/B testing results
 
 import sqlite3
 import json
+import asyncio
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from contextlib import contextmanager
@@ -22,6 +23,8 @@ class TuneDatabase:
         """Context manager for database connections"""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        # WAL (set once in _create_tables) only needs a full fsync at checkpoints
+        conn.execute("PRAGMA synchronous=NORMAL")
         try:
             yield conn
             conn.commit()
@@ -37,6 +40,9 @@ class TuneDatabase:
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
+            # Write-ahead log: commits append instead of rewriting the rollback journal
+            cursor.execute("PRAGMA journal_mode=WAL")
+
             # Campaigns table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS campaigns (
@@ -271,6 +277,10 @@ class TuneDatabase:
             ))
             return cursor.lastrowid
 
+    async def insert_prospect_async(self, campaign_id: int, prospect_data: Dict, analysis: Dict) -> int:
+        """Insert analyzed prospect on a worker thread so the event loop keeps running"""
+        return await asyncio.to_thread(self.insert_prospect, campaign_id, prospect_data, analysis)
+
     def get_prospects_by_tier(self, campaign_id: int, tier: str) -> List[Dict]:
         """Get prospects by priority tier"""
         with self.get_connection() as conn:
@@ -318,31 +328,50 @@ class TuneDatabase:
 
     # ==================== GENERATED CONTENT ====================
 
+    _GENERATED_CONTENT_INSERT = """
+        INSERT INTO generated_content (
+            prospect_id, contact_id, campaign_id, touch_number,
+            subject_line, email_body, framework_used, quality_score,
+            personalization_depth, variant_id
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _generated_content_params(prospect_id: int, campaign_id: int,
+                                  contact_id: Optional[int], email_data: Dict) -> tuple:
+        """Column values for one generated_content row"""
+        return (
+            prospect_id,
+            contact_id,
+            campaign_id,
+            email_data['touch_number'],
+            email_data['subject'],
+            email_data['body'],
+            email_data.get('framework_used'),
+            email_data['quality_score'],
+            len(email_data.get('personalization_used', [])),
+            email_data.get('variant_id')
+        )
+
     def insert_generated_content(self, prospect_id: int, campaign_id: int,
                                  contact_id: Optional[int], email_data: Dict) -> int:
         """Insert generated email content"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO generated_content (
-                    prospect_id, contact_id, campaign_id, touch_number,
-                    subject_line, email_body, framework_used, quality_score,
-                    personalization_depth, variant_id
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                prospect_id,
-                contact_id,
-                campaign_id,
-                email_data['touch_number'],
-                email_data['subject'],
-                email_data['body'],
-                email_data.get('framework_used'),
-                email_data['quality_score'],
-                len(email_data.get('personalization_used', [])),
-                email_data.get('variant_id')
+            cursor.execute(self._GENERATED_CONTENT_INSERT, self._generated_content_params(
+                prospect_id, campaign_id, contact_id, email_data
             ))
             return cursor.lastrowid
 
+    def bulk_insert_generated_content(self, rows: List[tuple]) -> int:
+        """Insert many (prospect_id, campaign_id, contact_id, email_data) rows in one transaction"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(self._GENERATED_CONTENT_INSERT, (
+                self._generated_content_params(*row) for row in rows
+            ))
+            return cursor.rowcount
+
     def get_content_ready_to_send(self, campaign_id: int, min_quality: float = 7.0) -> List[Dict]:
         """Get content ready to send (high quality, not sent)"""
         with self.get_connection() as conn:
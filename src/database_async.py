@@ -4,11 +4,13 @@ Replaces database.py with SQLAlchemy async for 10x better scale performance
 """
 
 import os
+import asyncio
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy import (
     Column, Integer, String, Float, Boolean, Text, DateTime, ForeignKey,
-    Index, CheckConstraint, select, func, and_, or_, text
+    Index, CheckConstraint, select, func, and_, or_, event
 )
 from typing import Dict, List, Any, Optional, AsyncGenerator
 from datetime import datetime, timedelta
@@ -235,14 +237,22 @@ class TuneDatabaseAsync:
                 "sqlite+aiosqlite:///tune_campaigns.db"
             )
 
+        # Hosted Postgres URLs (postgres://...) -> asyncpg driver
+        if db_url.startswith("postgres://"):
+            db_url = "postgresql+asyncpg://" + db_url[len("postgres://"):]
+        elif db_url.startswith("postgresql://"):
+            db_url = "postgresql+asyncpg://" + db_url[len("postgresql://"):]
+
         # Configure engine with connection pooling
         engine_kwargs = {
             "echo": os.getenv("DB_ECHO", "false").lower() == "true",
             "future": True,
         }
 
-        # Add pooling config for non-SQLite databases
-        if not db_url.startswith("sqlite"):
+        is_sqlite = db_url.startswith("sqlite")
+        is_memory = is_sqlite and (":memory:" in db_url or db_url.rstrip("/").endswith("sqlite+aiosqlite:"))
+
+        if not is_sqlite:
             engine_kwargs.update({
                 "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
                 "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
@@ -258,8 +268,27 @@ class TuneDatabaseAsync:
                     "timeout": 30,
                 }
             })
+            if not is_memory:
+                # Keep file connections open so pragmas and page cache stay warm
+                engine_kwargs.update({
+                    "poolclass": AsyncAdaptedQueuePool,
+                    "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+                    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "0")),
+                    "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+                })
 
         self.engine = create_async_engine(db_url, **engine_kwargs)
+
+        if is_sqlite:
+            # Pragmas are per-connection; apply them as each pooled connection opens
+            @event.listens_for(self.engine.sync_engine, "connect")
+            def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA foreign_keys=ON")
+                cursor.execute("PRAGMA cache_size=-20000")  # ~20MB page cache
+                cursor.close()
         self.async_session_maker = async_sessionmaker(
             self.engine,
             class_=AsyncSession,
@@ -273,13 +302,6 @@ class TuneDatabaseAsync:
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
-        # Enable WAL mode for SQLite (allows concurrent reads/writes)
-        if "sqlite" in str(self.engine.url):
-            async with self.engine.connect() as conn:
-                await conn.execute(text("PRAGMA journal_mode=WAL"))
-                await conn.execute(text("PRAGMA foreign_keys=ON"))
-                await conn.commit()
-
         logger.info("database_tables_created")
 
     @asynccontextmanager
@@ -435,43 +457,66 @@ class TuneDatabaseAsync:
     async def track_email_event(self, content_id: int, contact_id: int,
                                event_type: str, event_data: Optional[Dict] = None):
         """Track email event (open, click, reply)"""
-        async with self.get_session() as session:
-            # Create event
-            event = EmailEvent(
-                content_id=content_id,
-                contact_id=contact_id,
-                event_type=event_type,
-                event_data=json.dumps(event_data) if event_data else None,
-                timestamp=datetime.now()
-            )
-            session.add(event)
+        await self.track_email_events_batch([{
+            "content_id": content_id,
+            "contact_id": contact_id,
+            "event_type": event_type,
+            "event_data": event_data,
+        }])
+
+    async def track_email_events_batch(self, events: List[Dict]):
+        """Track many email events in a single transaction"""
+        if not events:
+            return
 
-            # Update content record
+        async with self.get_session() as session:
+            now = datetime.now()
+
+            # Create events (one multi-row INSERT)
+            session.add_all([
+                EmailEvent(
+                    content_id=e["content_id"],
+                    contact_id=e["contact_id"],
+                    event_type=e["event_type"],
+                    event_data=json.dumps(e["event_data"]) if e.get("event_data") else None,
+                    timestamp=now
+                )
+                for e in events
+            ])
+
+            # Update content records
+            content_ids = {e["content_id"] for e in events}
             result = await session.execute(
-                select(GeneratedContent).where(GeneratedContent.id == content_id)
+                select(GeneratedContent).where(GeneratedContent.id.in_(content_ids))
             )
-            content = result.scalar_one_or_none()
-
-            if content:
-                if event_type == 'opened':
-                    content.opened_at = datetime.now()
-                elif event_type == 'clicked':
-                    content.clicked_at = datetime.now()
-                elif event_type == 'replied':
-                    content.replied_at = datetime.now()
+            contents = {c.id: c for c in result.scalars().all()}
+
+            replied_contact_ids = set()
+            for e in events:
+                content = contents.get(e["content_id"])
+                if not content:
+                    continue
+
+                if e["event_type"] == 'opened':
+                    content.opened_at = now
+                elif e["event_type"] == 'clicked':
+                    content.clicked_at = now
+                elif e["event_type"] == 'replied':
+                    content.replied_at = now
                     content.status = 'replied'
+                    replied_contact_ids.add(e["contact_id"])
 
-                    # Update contact
-                    contact_result = await session.execute(
-                        select(Contact).where(Contact.id == contact_id)
-                    )
-                    contact = contact_result.scalar_one_or_none()
-                    if contact:
-                        contact.replied = True
+            # Update contacts
+            if replied_contact_ids:
+                contact_result = await session.execute(
+                    select(Contact).where(Contact.id.in_(replied_contact_ids))
+                )
+                for contact in contact_result.scalars().all():
+                    contact.replied = True
 
-            logger.info("email_event_tracked",
-                       content_id=content_id,
-                       event_type=event_type)
+            logger.info("email_events_tracked",
+                       count=len(events),
+                       content_ids=len(content_ids))
 
     # ==================== ANALYTICS ====================
 
@@ -513,6 +558,104 @@ class TuneDatabaseAsync:
             return {}
 
 
+# ==================== EVENT BATCHING ====================
+
+class EmailEventBatcher:
+    """
+    Coalesce email tracking events into batched writes
+
+    Events arriving within max_wait_seconds of each other (up to max_batch_size)
+    are written in one transaction. Callers await their own event's result.
+    """
+
+    def __init__(self, database: TuneDatabaseAsync, max_batch_size: int = 500,
+                 max_wait_seconds: float = 0.02):
+        self.db = database
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background flush loop"""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Flush pending events and stop the flush loop"""
+        if self._worker is None:
+            return
+        await self._queue.join()
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    async def track(self, content_id: int, contact_id: int,
+                    event_type: str, event_data: Optional[Dict] = None):
+        """Queue an event and wait until its batch is committed"""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(({
+            "content_id": content_id,
+            "contact_id": contact_id,
+            "event_type": event_type,
+            "event_data": event_data,
+        }, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_seconds
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self.db.track_email_events_batch([event for event, _ in batch])
+            except Exception as e:
+                logger.error("email_event_batch_failed", count=len(batch), error=str(e))
+                if len(batch) == 1:
+                    _, future = batch[0]
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    # One bad event (e.g. a stale content_id) must not fail the rest
+                    await self._track_individually(batch)
+            else:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(True)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _track_individually(self, batch: List[tuple]):
+        """Retry a failed batch one event at a time so only the bad events fail"""
+        for event, future in batch:
+            try:
+                await self.db.track_email_event(**event)
+            except Exception as e:
+                logger.error("email_event_failed", content_id=event["content_id"],
+                             event_type=event["event_type"], error=str(e))
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(True)
+
+
 # ==================== BACKWARD COMPATIBILITY ====================
 
 class TuneDatabase:
@@ -7,7 +7,7 @@ Web research, intent detection, and advanced scoring
 import asyncio
 import json
 import re
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, AsyncIterator, Tuple
 from datetime import datetime
 from dataclasses import dataclass, asdict
 import anthropic
@@ -17,8 +17,8 @@ import httpx
 class WebResearchEngine:
     """Conducts intelligent web research on prospects"""
 
-    def __init__(self, claude_api_key: str):
-        self.client = anthropic.Anthropic(api_key=claude_api_key)
+    def __init__(self, claude_api_key: str, client: Optional[anthropic.Anthropic] = None):
+        self.client = client or anthropic.Anthropic(api_key=claude_api_key)
         self.http_client = httpx.AsyncClient(
             timeout=30.0,
             follow_redirects=True,
@@ -297,10 +297,11 @@ Be specific with evidence. Score confidence based on strength of evidence."""
 class ProspectIntelligence:
     """Main prospect intelligence orchestrator (works with Clay-enriched data)"""
 
-    def __init__(self, industry_agent, claude_api_key: str):
+    def __init__(self, industry_agent, claude_api_key: str,
+                 client: Optional[anthropic.Anthropic] = None):
         self.agent = industry_agent
-        self.web_research = WebResearchEngine(claude_api_key)
-        self.claude_client = anthropic.Anthropic(api_key=claude_api_key)
+        self.claude_client = client or anthropic.Anthropic(api_key=claude_api_key)
+        self.web_research = WebResearchEngine(claude_api_key, client=self.claude_client)
 
     async def analyze_prospect(self, clay_enriched_data: Dict) -> Dict[str, Any]:
         """
@@ -607,8 +608,10 @@ Return as JSON array of strings."""
 class BatchProspectProcessor:
     """Batch process multiple Clay-enriched prospects"""
 
-    def __init__(self, industry_agent, claude_api_key: str):
-        self.intelligence = ProspectIntelligence(industry_agent, claude_api_key)
+    def __init__(self, industry_agent, claude_api_key: str,
+                 client: Optional[anthropic.Anthropic] = None):
+        self.agent = industry_agent
+        self.intelligence = ProspectIntelligence(industry_agent, claude_api_key, client=client)
         self.results = []
 
     async def process_batch(self, clay_enriched_prospects: List[Dict],
@@ -623,11 +626,7 @@ class BatchProspectProcessor:
 
         async def process_with_semaphore(prospect):
             async with semaphore:
-                try:
-                    return await self.intelligence.analyze_prospect(prospect)
-                except Exception as e:
-                    print(f"❌ Error processing {prospect.get('company_name')}: {e}")
-                    return None
+                return await self.process_one(prospect)
 
         tasks = [process_with_semaphore(p) for p in clay_enriched_prospects]
         results = await asyncio.gather(*tasks)
@@ -638,6 +637,38 @@ class BatchProspectProcessor:
 
         return self.results
 
+    async def iter_batch(self, clay_enriched_prospects: List[Dict],
+                         concurrency: int = 3) -> AsyncIterator[Tuple[Dict, Dict]]:
+        """Yield (prospect, analysis) pairs as each analysis finishes (failures are skipped)"""
+
+        print(f"\n{'='*70}")
+        print(f"🚀 BATCH PROCESSING {len(clay_enriched_prospects)} PROSPECTS")
+        print(f"{'='*70}\n")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def process_with_semaphore(prospect):
+            async with semaphore:
+                return prospect, await self.process_one(prospect)
+
+        self.results = []
+        tasks = [process_with_semaphore(p) for p in clay_enriched_prospects]
+        for task in asyncio.as_completed(tasks):
+            prospect, analysis = await task
+            if analysis is not None:
+                self.results.append(analysis)
+                yield prospect, analysis
+
+        self._print_summary()
+
+    async def process_one(self, clay_enriched_prospect: Dict) -> Optional[Dict]:
+        """Analyze a single prospect, returning None on failure"""
+        try:
+            return await self.intelligence.analyze_prospect(clay_enriched_prospect)
+        except Exception as e:
+            print(f"❌ Error processing {clay_enriched_prospect.get('company_name')}: {e}")
+            return None
+
     def _print_summary(self):
         """Print batch summary"""
 
@@ -645,12 +676,16 @@ class BatchProspectProcessor:
             print("No results to summarize")
             return
 
-        tier_a = len([r for r in self.results if r["priority_tier"] == "A"])
-        tier_b = len([r for r in self.results if r["priority_tier"] == "B"])
-        tier_c = len([r for r in self.results if r["priority_tier"] == "C"])
+        tiers = {"A": 0, "B": 0, "C": 0}
+        score_total = 0
+        total_savings = 0
+        for r in self.results:
+            tiers[r["priority_tier"]] = tiers.get(r["priority_tier"], 0) + 1
+            score_total += r["composite_score"]
+            total_savings += r["savings_projection"]["annual_savings_dollars"]
 
-        avg_score = sum(r["composite_score"] for r in self.results) / len(self.results)
-        total_savings = sum(r["savings_projection"]["annual_savings_dollars"] for r in self.results)
+        tier_a, tier_b, tier_c = tiers["A"], tiers["B"], tiers["C"]
+        avg_score = score_total / len(self.results)
 
         print(f"\n{'='*70}")
         print("📊 BATCH ANALYSIS SUMMARY")
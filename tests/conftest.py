@@ -0,0 +1,11 @@
+"""
+Shared test setup
+Make the repo root importable so tests can use the same src.* paths as api_server
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
@@ -0,0 +1,107 @@
+"""
+EmailEventBatcher tests (src/database_async.py)
+Coalescing, per-event failure isolation and the flush in stop()
+"""
+
+import asyncio
+
+import pytest
+
+from src.database_async import EmailEventBatcher
+
+
+class RecordingDatabase:
+    """Stands in for TuneDatabaseAsync; rejects events for unknown content ids like a FK violation"""
+
+    def __init__(self, bad_content_ids=()):
+        self.bad_content_ids = set(bad_content_ids)
+        self.batches = []
+        self.single_events = []
+
+    async def track_email_events_batch(self, events):
+        if any(e["content_id"] in self.bad_content_ids for e in events):
+            raise ValueError("FOREIGN KEY constraint failed")
+        self.batches.append([e["content_id"] for e in events])
+
+    async def track_email_event(self, content_id, contact_id, event_type, event_data=None):
+        if content_id in self.bad_content_ids:
+            raise ValueError("FOREIGN KEY constraint failed")
+        self.single_events.append(content_id)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_concurrent_events_share_one_batch():
+    db = RecordingDatabase()
+
+    async def scenario():
+        batcher = EmailEventBatcher(db, max_wait_seconds=0.05)
+        results = await asyncio.gather(*(batcher.track(i, 1, "opened") for i in range(5)))
+        await batcher.stop()
+        return results
+
+    assert run(scenario()) == [True] * 5
+    assert db.batches == [[0, 1, 2, 3, 4]]
+
+
+def test_batches_are_capped_at_max_batch_size():
+    db = RecordingDatabase()
+
+    async def scenario():
+        batcher = EmailEventBatcher(db, max_batch_size=3, max_wait_seconds=0.05)
+        await asyncio.gather(*(batcher.track(i, 1, "clicked") for i in range(7)))
+        await batcher.stop()
+
+    run(scenario())
+    assert [len(batch) for batch in db.batches] == [3, 3, 1]
+
+
+def test_bad_event_fails_alone():
+    db = RecordingDatabase(bad_content_ids={2})
+
+    async def scenario():
+        batcher = EmailEventBatcher(db, max_wait_seconds=0.05)
+        results = await asyncio.gather(
+            *(batcher.track(i, 1, "opened") for i in range(4)),
+            return_exceptions=True
+        )
+        await batcher.stop()
+        return results
+
+    results = run(scenario())
+    assert results[0] is True and results[1] is True and results[3] is True
+    assert isinstance(results[2], ValueError)
+    assert db.batches == []
+    assert db.single_events == [0, 1, 3]
+
+
+def test_single_event_failure_propagates():
+    db = RecordingDatabase(bad_content_ids={9})
+
+    async def scenario():
+        batcher = EmailEventBatcher(db, max_wait_seconds=0.01)
+        try:
+            with pytest.raises(ValueError):
+                await batcher.track(9, 1, "replied")
+        finally:
+            await batcher.stop()
+
+    run(scenario())
+    assert db.single_events == []
+
+
+def test_stop_flushes_queued_events():
+    db = RecordingDatabase()
+
+    async def scenario():
+        batcher = EmailEventBatcher(db, max_wait_seconds=0.05)
+        pending = [asyncio.create_task(batcher.track(i, 1, "opened")) for i in range(3)]
+        await asyncio.sleep(0)  # let each track() enqueue its event
+        await batcher.stop()
+        assert all(task.done() for task in pending)
+        return [task.result() for task in pending]
+
+    assert run(scenario()) == [True] * 3
+    assert db.batches == [[0, 1, 2]]
@@ -0,0 +1,140 @@
+"""
+Email template cache tests (scripts/batch_with_email_generation.py)
+Cached sequences must never carry one prospect's facts into another's emails
+"""
+
+import asyncio
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+
+AGENT = {
+    "name": "Casino",
+    "savings_benchmarks": {"typical_percentage": 22, "payback_months": 14},
+    "email_sequences": {"facilities_vp": [{"touch_number": 1, "goal": "awareness"}]},
+}
+
+
+@pytest.fixture
+def batch(tmp_path, monkeypatch):
+    """Fresh import of the batch script with a stub agent and an isolated cache file"""
+    (tmp_path / "agents").mkdir()
+    (tmp_path / "agents" / "casino_agent.json").write_text(json.dumps(AGENT))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(SCRIPTS_DIR))
+    for name in ("batch_with_email_generation", "casino_agent"):
+        sys.modules.pop(name, None)
+    module = importlib.import_module("batch_with_email_generation")
+    monkeypatch.setattr(module, "EMAIL_CACHE_FILE", str(tmp_path / "email_sequence_cache.json"))
+
+    calls = []
+
+    async def fake_request(client, prospect_analysis, persona_type, num_emails):
+        company = prospect_analysis["company_profile"]
+        calls.append(company["company_name"])
+        return [{
+            "email_number": i + 1,
+            "subject": f"{company['company_name']}: ${company['annual_savings_dollars']:,.0f} a year",
+            "body": (
+                f"{company['company_name']} in {company['location']} runs 24/7. "
+                f"Your {company['estimated_sqft']:,} sqft floor could save "
+                f"${company['monthly_savings_dollars']:,.0f} a month, "
+                f"paying back in {company['payback_months']} months."
+            ),
+            "cta": "Schedule a 15-minute call",
+            "send_delay_days": i * 3,
+        } for i in range(num_emails)]
+
+    monkeypatch.setattr(module, "_request_email_sequence", fake_request)
+    module.calls = calls
+    return module
+
+
+def prospect(name, location, sqft, savings=1_320_000):
+    return {
+        "company_profile": {
+            "company_name": name,
+            "location": location,
+            "estimated_sqft": sqft,
+            "estimated_energy_spend": savings * 4.5,
+            "annual_savings_dollars": savings,
+            "monthly_savings_dollars": savings / 12,
+            "five_year_savings": savings * 5,
+            "payback_months": 14,
+        },
+        "priority_tier": "A",
+        "composite_score": 80.5,
+    }
+
+
+def email_text(emails):
+    return " ".join(f"{e['subject']} {e['body']} {e['cta']}" for e in emails)
+
+
+def generate(batch, *prospects):
+    async def run():
+        return [await batch.generate_email_sequence(None, p, "facilities_vp", 3) for p in prospects]
+    return asyncio.run(run())
+
+
+def test_same_bucket_shares_template_without_leaking_facts(batch):
+    wynn = prospect("Wynn Las Vegas", "Las Vegas, NV", 1_040_000)
+    aria = prospect("Aria Resort", "Las Vegas, NV", 960_000)
+
+    wynn_emails, aria_emails = generate(batch, wynn, aria)
+
+    assert batch.calls == ["Wynn Las Vegas"]
+    text = email_text(aria_emails)
+    assert "Aria Resort" in text and "960,000 sqft" in text
+    assert "Wynn" not in text and "1,040,000" not in text
+
+
+def test_different_locations_never_share(batch):
+    bellagio = prospect("Bellagio", "Las Vegas, NV", 1_040_000)
+    borgata = prospect("Borgata", "Atlantic City, NJ", 960_000)
+
+    _, borgata_emails = generate(batch, bellagio, borgata)
+
+    assert batch.calls == ["Bellagio", "Borgata"]
+    text = email_text(borgata_emails)
+    assert "Borgata in Atlantic City, NJ" in text
+    assert "Bellagio" not in text and "Las Vegas" not in text and "1,040,000" not in text
+
+
+def test_shortened_name_is_not_cached(batch, monkeypatch):
+    original = batch._request_email_sequence
+
+    async def short_name(client, prospect_analysis, persona_type, num_emails):
+        emails = await original(client, prospect_analysis, persona_type, num_emails)
+        if prospect_analysis["company_profile"]["company_name"] == "Wynn Las Vegas":
+            emails[0]["body"] += " The Wynn team already tracks demand charges."
+        return emails
+
+    monkeypatch.setattr(batch, "_request_email_sequence", short_name)
+    wynn = prospect("Wynn Las Vegas", "Las Vegas, NV", 1_040_000)
+    aria = prospect("Aria Resort", "Las Vegas, NV", 960_000)
+
+    _, aria_emails = generate(batch, wynn, aria)
+
+    assert batch.calls == ["Wynn Las Vegas", "Aria Resort"]
+    assert "Wynn" not in email_text(aria_emails)
+
+
+def test_cache_file_ignored_after_prompt_change(batch, monkeypatch):
+    generate(batch, prospect("Wynn Las Vegas", "Las Vegas, NV", 1_040_000))
+    batch.save_email_cache()
+    batch._email_templates.clear()
+
+    batch.load_email_cache()
+    assert len(batch._email_templates) == 1
+    batch._email_templates.clear()
+
+    monkeypatch.setattr(batch, "_PROMPT_TEMPLATE", batch._PROMPT_TEMPLATE + "\nBe brief.")
+    batch._email_cache_version.cache_clear()
+    batch.load_email_cache()
+    assert batch._email_templates == {}
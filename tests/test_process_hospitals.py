@@ -0,0 +1,73 @@
+"""
+Hospital CSV batch tests (api_server.process_hospitals)
+A bad upload cancels the remaining workers and comes back as a 400
+"""
+
+import asyncio
+import csv
+import io
+
+import pytest
+from fastapi import HTTPException
+
+import api_server
+
+
+def upload_with_bad_byte(rows: int) -> io.TextIOWrapper:
+    """CSV whose invalid UTF-8 byte sits well past the first read buffer"""
+    lines = ["hospital_name,contact_email"] + [f"Hospital {i},h{i}@example.com" for i in range(rows)]
+    raw = ("\n".join(lines) + "\n").encode() + b"Bad \xff Hospital,bad@example.com\n"
+    return io.TextIOWrapper(io.BytesIO(raw), encoding='utf-8', newline='')
+
+
+def test_decode_error_cancels_workers_and_returns_400(monkeypatch, tmp_path):
+    calls = {"started": 0, "after_error": 0}
+    failed = asyncio.Event()
+
+    async def fake_process_hospital_data(hospital_input, agent):
+        calls["started"] += 1
+        if failed.is_set():
+            calls["after_error"] += 1
+        await asyncio.sleep(0.001)
+        return {"content": {}}
+
+    rows = csv.DictReader(upload_with_bad_byte(3000))
+
+    def reader():
+        try:
+            yield from rows
+        except UnicodeDecodeError:
+            failed.set()
+            raise
+
+    monkeypatch.setattr(api_server, "process_hospital_data", fake_process_hospital_data)
+    output_file = tmp_path / "results.jsonl"
+
+    async def scenario():
+        with pytest.raises(HTTPException) as exc_info:
+            await api_server.process_hospitals(reader(), {}, str(output_file), keep_results=False)
+        # Give any stray worker a chance to run before counting
+        await asyncio.sleep(0.05)
+        return exc_info.value
+
+    error = asyncio.run(scenario())
+
+    assert error.status_code == 400
+    assert calls["after_error"] == 0
+    assert not output_file.exists()
+
+
+def test_clean_upload_writes_every_row(monkeypatch, tmp_path):
+    async def fake_process_hospital_data(hospital_input, agent):
+        return {"hospital": hospital_input["hospital_name"], "content": {"pdf_filename": "x.pdf"}}
+
+    monkeypatch.setattr(api_server, "process_hospital_data", fake_process_hospital_data)
+    rows = csv.DictReader(io.StringIO("hospital_name\nA\nB\nC\n"))
+    output_file = tmp_path / "results.jsonl"
+
+    summary = asyncio.run(api_server.process_hospitals(rows, {}, str(output_file)))
+
+    assert summary["hospitals_processed"] == 3
+    assert summary["pdfs_generated"] == 3
+    assert [r["hospital"] for r in summary["results"]] == ["A", "B", "C"]
+    assert len(output_file.read_bytes().splitlines()) == 3
@@ -5,15 +5,17 @@ Generates insight-first, human-voice emails with peak demand charges education
 
 import asyncio
 import json
+import re
 import csv
 import httpx
 from datetime import datetime
 from typing import List, Dict
 import anthropic
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from dotenv import load_dotenv
 import pandas as pd
-from pdf_lead_magnets.pdf_generator import generate_cost_analysis_pdf
 
 load_dotenv()
 
@@ -21,9 +23,12 @@ CLAUDE_API_KEY = os.getenv("CLAUDE_API_KEY")
 CLAY_WEBHOOK_URL = "https://api.clay.com/v3/sources/webhook/pull-in-data-from-a-webhook-66d60486-9c7c-4a7b-b615-9ddbe021fbab"
 PDF_BASE_URL = os.getenv("PDF_BASE_URL", "http://localhost:8000")  # Default to local API server
 
-# Load casino agent
-with open('agents/casino_agent.json', 'r') as f:
-    CASINO_AGENT = json.load(f)
+# Money columns come back from the analysis CSV as "$1,234,567"
+_MONEY_RE = re.compile(r'[$,]')
+
+def _money(value: str) -> float:
+    """Parse a formatted dollar string"""
+    return float(_MONEY_RE.sub('', value))
 
 # The ONLY verified case study
 VERIFIED_CASE_STUDY = {
@@ -53,7 +58,7 @@ DEMAND_CHARGE_DATA = {
 # ============================================================================
 
 async def generate_cfo_sequence(
-    client: anthropic.Anthropic,
+    client: anthropic.AsyncAnthropic,
     prospect_analysis: Dict,
     num_emails: int
 ) -> List[Dict]:
@@ -239,8 +244,7 @@ Return a JSON array with exactly {num_emails} emails:
 Now write {num_emails} world-class CFO-focused emails that are CONVERSATIONAL, CONCISE, and EBITDA-focused. Sound like a helpful salesperson, not a robot. Make them the BEST B2B emails you've ever written."""
 
     try:
-        message = await asyncio.to_thread(
-            client.messages.create,
+        message = await client.messages.create(
             model="claude-sonnet-4-20250514",
             max_tokens=8000,
             temperature=0.7,
@@ -271,7 +275,7 @@ Now write {num_emails} world-class CFO-focused emails that are CONVERSATIONAL, C
 
 
 async def generate_operations_sequence(
-    client: anthropic.Anthropic,
+    client: anthropic.AsyncAnthropic,
     prospect_analysis: Dict,
     num_emails: int
 ) -> List[Dict]:
@@ -435,8 +439,7 @@ Return a JSON array with exactly {num_emails} emails following the structure abo
 Now write {num_emails} world-class Operations-focused emails that are CONVERSATIONAL, PRAGMATIC, and emphasize ZERO DOWNTIME. Sound like a helpful salesperson, not a robot. Make them the BEST B2B emails you've ever written."""
 
     try:
-        message = await asyncio.to_thread(
-            client.messages.create,
+        message = await client.messages.create(
             model="claude-sonnet-4-20250514",
             max_tokens=8000,
             temperature=0.7,
@@ -467,7 +470,7 @@ Now write {num_emails} world-class Operations-focused emails that are CONVERSATI
 
 
 async def generate_facilities_sequence(
-    client: anthropic.Anthropic,
+    client: anthropic.AsyncAnthropic,
     prospect_analysis: Dict,
     num_emails: int
 ) -> List[Dict]:
@@ -611,8 +614,7 @@ Return JSON array with exactly {num_emails} emails.
 Now write {num_emails} world-class Facilities-focused emails that are TECHNICAL yet CONVERSATIONAL. Sound like a helpful expert, not a textbook. Make them the BEST B2B emails you've ever written."""
 
     try:
-        message = await asyncio.to_thread(
-            client.messages.create,
+        message = await client.messages.create(
             model="claude-sonnet-4-20250514",
             max_tokens=8000,
             temperature=0.7,
@@ -637,7 +639,7 @@ Now write {num_emails} world-class Facilities-focused emails that are TECHNICAL
 
 
 async def generate_esg_sequence(
-    client: anthropic.Anthropic,
+    client: anthropic.AsyncAnthropic,
     prospect_analysis: Dict,
     num_emails: int
 ) -> List[Dict]:
@@ -785,8 +787,7 @@ Return JSON array with exactly {num_emails} emails.
 Now write {num_emails} world-class ESG-focused emails that are STRATEGIC and IMPACT-DRIVEN. Show that sustainability and profitability align. Make them the BEST B2B emails you've ever written."""
 
     try:
-        message = await asyncio.to_thread(
-            client.messages.create,
+        message = await client.messages.create(
             model="claude-sonnet-4-20250514",
             max_tokens=8000,
             temperature=0.7,
@@ -810,8 +811,11 @@ Now write {num_emails} world-class ESG-focused emails that are STRATEGIC and IMP
         } for i in range(num_emails)]
 
 
-async def process_prospect(client, prospect_analysis):
-    """Generate 4 persona-specific email sequences for one prospect"""
+async def process_prospect(client, prospect_analysis, generate_pdf=True):
+    """Generate 4 persona-specific email sequences for one prospect
+
+    Pass generate_pdf=False to skip the PDF and batch it later with generate_pdfs().
+    """
 
     tier = prospect_analysis['priority_tier']
     num_emails = 5 if tier == 'A' else 3
@@ -851,14 +855,41 @@ async def process_prospect(client, prospect_analysis):
     print(f"     ✓ ESG Email 1: \"{email_sequences['esg'][0]['subject']}\"")
 
     # Generate PDF lead magnet
-    print(f"     → Generating PDF lead magnet...")
-    pdf_filename = generate_cost_analysis_pdf(prospect_analysis)
+    if generate_pdf:
+        from pdf_lead_magnets.pdf_generator import generate_cost_analysis_pdf
+        print(f"     → Generating PDF lead magnet...")
+        _attach_pdf(prospect_analysis, generate_cost_analysis_pdf(prospect_analysis))
+
+    return prospect_analysis
+
+def _attach_pdf(prospect_analysis: Dict, pdf_filename: str):
+    """Record a generated PDF on the prospect"""
     prospect_analysis['pdf_filename'] = pdf_filename
     prospect_analysis['pdf_url'] = f"{PDF_BASE_URL}/pdf/{pdf_filename}"
     print(f"     ✓ PDF generated: {pdf_filename}")
     print(f"     ✓ PDF URL: {prospect_analysis['pdf_url']}")
 
-    return prospect_analysis
+def generate_pdfs(results: List[Dict]):
+    """Generate PDF lead magnets for all prospects in parallel across CPU cores
+
+    Chart rendering and PDF layout are CPU-bound, so processes (not threads) are
+    used to get around the GIL.
+    """
+    if not results:
+        return
+
+    # Imported here so email-only callers don't pay for matplotlib/reportlab
+    from pdf_lead_magnets.pdf_generator import generate_cost_analysis_pdf
+
+    workers = min(len(results), os.cpu_count() or 1)
+    print(f"  → Generating {len(results)} PDF lead magnets ({workers} processes)...")
+
+    # One timestamp for the whole batch, so every PDF carries the same date
+    render = partial(generate_cost_analysis_pdf, now=datetime.now())
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for prospect_analysis, pdf_filename in zip(results, pool.map(render, results)):
+            _attach_pdf(prospect_analysis, pdf_filename)
 
 async def send_persona_to_clay(persona_name: str, persona_data: Dict):
     """Send one persona sequence to Clay webhook"""
@@ -941,7 +972,7 @@ async def main():
 
     # Load analysis
     df = pd.read_csv('casino_analysis_20251029_225746.csv')
-    df['annual_savings_numeric'] = df['annual_savings_dollars'].str.replace('$', '').str.replace(',', '').astype(float)
+    df['annual_savings_numeric'] = df['annual_savings_dollars'].str.replace(r'[$,]', '', regex=True).astype(float)
 
     # Get top 5 A-tier
     a_tier = df[df['priority_tier'] == 'A'].nlargest(5, 'annual_savings_numeric')
@@ -951,7 +982,7 @@ async def main():
     # Convert to analysis format
     prospects = []
     for _, row in a_tier.iterrows():
-        annual_savings = float(row['annual_savings_dollars'].replace('$', '').replace(',', ''))
+        annual_savings = _money(row['annual_savings_dollars'])
         print(f"  • {row['company_name']}: ${annual_savings:,.0f}/year")
 
         prospects.append({
@@ -961,10 +992,10 @@ async def main():
                 'location': row['location'],
                 'employee_count': int(row['employee_count']),
                 'estimated_sqft': int(row['estimated_sqft']),
-                'estimated_energy_spend': float(row['estimated_annual_energy_spend'].replace('$', '').replace(',', '')),
+                'estimated_energy_spend': _money(row['estimated_annual_energy_spend']),
                 'annual_savings_dollars': annual_savings,
-                'monthly_savings_dollars': float(row['monthly_savings_dollars'].replace('$', '').replace(',', '')),
-                'five_year_savings': float(row['five_year_savings'].replace('$', '').replace(',', '')),
+                'monthly_savings_dollars': _money(row['monthly_savings_dollars']),
+                'five_year_savings': _money(row['five_year_savings']),
                 'payback_months': int(row['payback_months']),
                 'carbon_reduction_tons': float(row['carbon_reduction_tons']),
             },
@@ -979,16 +1010,19 @@ async def main():
     print("GENERATING WORLD-CLASS 5-EMAIL SEQUENCES")
     print(f"{'='*70}\n")
 
-    client = anthropic.Anthropic(api_key=CLAUDE_API_KEY)
+    client = anthropic.AsyncAnthropic(api_key=CLAUDE_API_KEY)
 
     # Generate emails sequentially for visibility
     results = []
     for i, prospect in enumerate(prospects, 1):
         print(f"[{i}/5] {prospect['company_profile']['company_name']}")
-        result = await process_prospect(client, prospect)
+        result = await process_prospect(client, prospect, generate_pdf=False)
         results.append(result)
         print()
 
+    # PDFs are independent per casino - render them all at once
+    generate_pdfs(results)
+
     # Export
     csv_file, json_file = export_results(results, "worldclass_casino_emails")
 